@@ -0,0 +1,50 @@
+"""Add usage rollups
+
+Revision ID: 4ee6ff1ac928
+Revises: 4033221ea50c
+Create Date: 2023-06-05 09:12:43.518226
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "4ee6ff1ac928"
+down_revision = "4033221ea50c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "usage_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("previous_day", sa.Date(), nullable=True),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "project_event_type",
+            postgresql.ENUM(name="projecteventtype", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("counted", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["git_projects.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_usage_rollups_counted_day", "usage_rollups", ["counted", "day"])
+    # the rollups are refreshed incrementally from the recent pipelines
+    op.create_index(
+        op.f("ix_pipelines_datetime"), "pipelines", ["datetime"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_pipelines_datetime"), table_name="pipelines")
+    op.drop_index("ix_usage_rollups_counted_day", table_name="usage_rollups")
+    op.drop_table("usage_rollups")
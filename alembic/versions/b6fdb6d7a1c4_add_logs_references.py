@@ -0,0 +1,26 @@
+"""Add references to the logs in the log store
+
+Revision ID: b6fdb6d7a1c4
+Revises: e2a4d117d11e
+Create Date: 2023-06-12 10:31:07.218406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b6fdb6d7a1c4"
+down_revision = "e2a4d117d11e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("srpm_builds", sa.Column("logs_reference", sa.String()))
+    op.add_column("sync_release_run_targets", sa.Column("logs_reference", sa.String()))
+
+
+def downgrade():
+    op.drop_column("sync_release_run_targets", "logs_reference")
+    op.drop_column("srpm_builds", "logs_reference")
@@ -0,0 +1,49 @@
+"""Add partial indexes of pending builds and test runs
+
+Revision ID: c1e0f3b4d9a7
+Revises: b6fdb6d7a1c4
+Create Date: 2023-06-14 08:52:19.604433
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c1e0f3b4d9a7"
+down_revision = "b6fdb6d7a1c4"
+branch_labels = None
+depends_on = None
+
+# index name -> (table, condition)
+PARTIAL_INDEXES = {
+    "ix_copr_build_targets_pending": ("copr_build_targets", "status = 'pending'"),
+    "ix_tft_test_run_targets_not_completed": (
+        "tft_test_run_targets",
+        "status IN ('new', 'queued', 'running')",
+    ),
+    "ix_vm_image_build_targets_pending": (
+        "vm_image_build_targets",
+        "status = 'pending'",
+    ),
+}
+
+
+def upgrade():
+    # created concurrently (outside of a transaction), not to block
+    # the writes to the tables while indexing the historical rows
+    with op.get_context().autocommit_block():
+        for index, (table, condition) in PARTIAL_INDEXES.items():
+            op.create_index(
+                index,
+                table,
+                ["id"],
+                postgresql_where=sa.text(condition),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index, (table, _) in PARTIAL_INDEXES.items():
+            op.drop_index(index, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,25 @@
+"""Add superseded status
+
+Revision ID: d3f1a9c27b58
+Revises: c1e0f3b4d9a7
+Create Date: 2026-10-17 09:12:41.305618
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d3f1a9c27b58"
+down_revision = "c1e0f3b4d9a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # builds and test runs of PRs superseded by a newer commit
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE buildstatus ADD VALUE 'superseded'")
+        op.execute("ALTER TYPE testingfarmresult ADD VALUE 'superseded'")
+
+
+def downgrade():
+    pass
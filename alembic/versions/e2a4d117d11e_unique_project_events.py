@@ -0,0 +1,184 @@
+"""Add unique constraints for get-or-create models
+
+Revision ID: e2a4d117d11e
+Revises: 4ee6ff1ac928
+Create Date: 2023-06-12 10:41:27.193420
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e2a4d117d11e"
+down_revision = "4ee6ff1ac928"
+branch_labels = None
+depends_on = None
+
+# table -> (columns identifying the row, type of the project events pointing to it)
+PROJECT_EVENT_OBJECTS = {
+    "pull_requests": (["project_id", "pr_id"], "pull_request"),
+    "git_branches": (["project_id", "name"], "branch_push"),
+    "project_releases": (["project_id", "tag_name"], "release"),
+    "project_issues": (["project_id", "issue_id"], "issue"),
+}
+
+
+def create_duplicates_table(table: str, columns: list[str]) -> None:
+    """
+    Create a temporary table mapping the IDs of the duplicate rows
+    to the ID of the oldest row with the same values of the columns.
+    """
+    op.execute("DROP TABLE IF EXISTS duplicates")
+    partition = ", ".join(columns)
+    op.execute(
+        f"""
+        CREATE TEMPORARY TABLE duplicates AS
+        SELECT id AS duplicate_id, original_id FROM (
+            SELECT id, min(id) OVER (PARTITION BY {partition}) AS original_id
+            FROM {table}
+        ) AS rows WHERE id != original_id
+        """
+    )
+
+
+def merge_duplicate_projects() -> None:
+    create_duplicates_table("git_projects", ["namespace", "repo_name", "project_url"])
+
+    for table in (*PROJECT_EVENT_OBJECTS, "project_authentication_issue"):
+        op.execute(
+            f"""
+            UPDATE {table} SET project_id = original_id
+            FROM duplicates WHERE project_id = duplicate_id
+            """
+        )
+
+    op.execute(
+        """
+        UPDATE github_installations
+        SET repositories = ARRAY(
+            SELECT DISTINCT coalesce(original_id, repository)
+            FROM unnest(repositories) AS repository
+            LEFT JOIN duplicates ON repository = duplicate_id
+        )
+        WHERE repositories && ARRAY(SELECT duplicate_id FROM duplicates)
+        """
+    )
+
+    # the counts of the duplicates are added to the counts of the original
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE merged_usage_rollups AS
+        SELECT day, previous_day, original_id AS project_id, project_event_type,
+            counted, sum(count) AS count
+        FROM usage_rollups
+        JOIN (
+            SELECT duplicate_id AS id, original_id FROM duplicates
+            UNION SELECT DISTINCT original_id AS id, original_id FROM duplicates
+        ) AS projects ON project_id = projects.id
+        GROUP BY day, previous_day, original_id, project_event_type, counted
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM usage_rollups WHERE project_id IN (
+            SELECT duplicate_id FROM duplicates UNION SELECT original_id FROM duplicates
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO usage_rollups
+            (day, previous_day, project_id, project_event_type, counted, count)
+        SELECT day, previous_day, project_id, project_event_type, counted, count
+        FROM merged_usage_rollups
+        """
+    )
+    op.execute("DROP TABLE merged_usage_rollups")
+
+    op.execute(
+        "DELETE FROM git_projects WHERE id IN (SELECT duplicate_id FROM duplicates)"
+    )
+
+
+def merge_duplicate_project_event_objects(table: str, columns: list[str], type_):
+    create_duplicates_table(table, columns)
+    op.execute(
+        f"""
+        UPDATE project_events SET event_id = original_id
+        FROM duplicates WHERE type = '{type_}' AND event_id = duplicate_id
+        """
+    )
+    if table == "pull_requests":
+        for column in ("source_git_pull_request_id", "dist_git_pull_request_id"):
+            # the column is unique, keep the link of the original if there is one,
+            # the oldest link of its duplicates otherwise
+            op.execute(
+                f"""
+                DELETE FROM source_git_pr_dist_git_pr AS link
+                USING duplicates WHERE link.{column} = duplicate_id AND (
+                    original_id IN (
+                        SELECT {column} FROM source_git_pr_dist_git_pr
+                        WHERE {column} IS NOT NULL
+                    )
+                    OR link.id > (
+                        SELECT min(other.id) FROM source_git_pr_dist_git_pr AS other
+                        JOIN duplicates AS other_duplicates
+                        ON other.{column} = other_duplicates.duplicate_id
+                        WHERE other_duplicates.original_id = duplicates.original_id
+                    )
+                )
+                """
+            )
+            op.execute(
+                f"""
+                UPDATE source_git_pr_dist_git_pr SET {column} = original_id
+                FROM duplicates WHERE {column} = duplicate_id
+                """
+            )
+    op.execute(f"DELETE FROM {table} WHERE id IN (SELECT duplicate_id FROM duplicates)")
+
+
+def merge_duplicate_project_events() -> None:
+    create_duplicates_table("project_events", ["type", "event_id"])
+    op.execute(
+        """
+        UPDATE pipelines SET project_event_id = original_id
+        FROM duplicates WHERE project_event_id = duplicate_id
+        """
+    )
+    op.execute(
+        "DELETE FROM project_events WHERE id IN (SELECT duplicate_id FROM duplicates)"
+    )
+
+
+def upgrade():
+    # the concurrently created duplicates have to be merged first
+    merge_duplicate_projects()
+    for table, (columns, type_) in PROJECT_EVENT_OBJECTS.items():
+        merge_duplicate_project_event_objects(table, columns, type_)
+    merge_duplicate_project_events()
+    op.execute("DROP TABLE duplicates")
+
+    op.create_unique_constraint(
+        "git_projects_namespace_repo_name_project_url_key",
+        "git_projects",
+        ["namespace", "repo_name", "project_url"],
+    )
+    for table, (columns, _) in PROJECT_EVENT_OBJECTS.items():
+        op.create_unique_constraint(f"{table}_{'_'.join(columns)}_key", table, columns)
+    op.create_unique_constraint(
+        "project_events_type_event_id_key", "project_events", ["type", "event_id"]
+    )
+
+
+def downgrade():
+    op.drop_constraint(
+        "project_events_type_event_id_key", "project_events", type_="unique"
+    )
+    for table, (columns, _) in PROJECT_EVENT_OBJECTS.items():
+        op.drop_constraint(f"{table}_{'_'.join(columns)}_key", table, type_="unique")
+    op.drop_constraint(
+        "git_projects_namespace_repo_name_project_url_key",
+        "git_projects",
+        type_="unique",
+    )
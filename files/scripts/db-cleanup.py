@@ -1,30 +1,16 @@
 #!/usr/bin/python3
 
 import argparse
-from sqlalchemy import create_engine, func, select, delete, distinct, union
-from packit_service.models import (
-    CoprBuildGroupModel,
-    CoprBuildTargetModel,
-    get_pg_url,
-    GitBranchModel,
-    GitProjectModel,
-    IssueModel,
-    JobTriggerModel,
-    JobTriggerModelType,
-    KojiBuildGroupModel,
-    KojiBuildTargetModel,
-    PipelineModel,
-    ProjectAuthenticationIssueModel,
-    ProjectReleaseModel,
-    PullRequestModel,
-    SRPMBuildModel,
-    SyncReleaseModel,
-    SyncReleaseTargetModel,
-    tf_copr_association_table,
-    TFTTestRunGroupModel,
-    TFTTestRunTargetModel,
-    VMImageBuildTargetModel,
+import logging
+
+from sqlalchemy import text
+
+from packit_service.constants import (
+    DEFAULT_RETENTION_BATCH_SIZE,
+    DEFAULT_RETENTION_BATCH_SLEEP,
 )
+from packit_service.models import sa_session
+from packit_service.worker.retention import Retention
 
 
 if __name__ == "__main__":
@@ -32,6 +18,9 @@ if __name__ == "__main__":
         description="""\
 Remove old data from the DB in order to speed up queries.
 
+The data are removed in batches, so the script can be stopped at any time
+and run again later to continue.
+
 Set POSTGRESQL_* environment variables to define the DB URL.
 See get_pg_url() for details.
 """
@@ -44,169 +33,36 @@ See get_pg_url() for details.
         help="Remove data older than this. For example: "
         "'1 year' or '6 months'. Defaults to '1 year'.",
     )
-    args = parser.parse_args()
-
-    engine = create_engine(
-        get_pg_url(),
-        echo=True,
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_RETENTION_BATCH_SIZE,
+        help="Number of rows removed at once. "
+        f"Defaults to {DEFAULT_RETENTION_BATCH_SIZE}.",
     )
-    with engine.begin() as conn:
-        # Delete the pipelines older than AGE
-        stmt = delete(PipelineModel).where(func.age(PipelineModel.datetime) >= args.age)
-        conn.execute(stmt)
-
-        # Delete JobTriggers, SRPMBuilds and VMImageBuilds which don't belong to a pipeline
-        attr = [
-            (JobTriggerModel, PipelineModel.job_trigger_id),
-            (SRPMBuildModel, PipelineModel.srpm_build_id),
-            (VMImageBuildTargetModel, PipelineModel.vm_image_build_id),
-        ]
-        for model, field in attr:
-            orphaned = (
-                select(distinct(model.id))
-                .outerjoin(PipelineModel, field == model.id)
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(model).where(model.id.in_(orphaned))
-            conn.execute(stmt)
-
-        # Delete CoprBuildTargets and tf-copr associations which don't belong to a pipeline
-        orphaned = (
-            select(distinct(CoprBuildTargetModel.id))
-            .outerjoin_from(
-                CoprBuildGroupModel,
-                CoprBuildTargetModel,
-                CoprBuildTargetModel.copr_build_group_id == CoprBuildGroupModel.id,
-            )
-            .outerjoin(
-                PipelineModel,
-                PipelineModel.copr_build_group_id == CoprBuildGroupModel.id,
-            )
-            .filter(PipelineModel.id == None)  # noqa
-        )
-        stmt = delete(tf_copr_association_table).where(
-            tf_copr_association_table.c.copr_id.in_(orphaned)
-        )
-        conn.execute(stmt)
-        stmt = delete(CoprBuildTargetModel).where(CoprBuildTargetModel.id.in_(orphaned))
-        conn.execute(stmt)
-
-        # Delete KojiBuildTargets, TFTTestRunTargets and SyncReleaseTargets
-        # which don't belong to any pipeline
-        attr = [
-            (
-                KojiBuildTargetModel,
-                KojiBuildGroupModel,
-                PipelineModel.koji_build_group_id,
-                KojiBuildTargetModel.koji_build_group_id,
-            ),
-            (
-                TFTTestRunTargetModel,
-                TFTTestRunGroupModel,
-                PipelineModel.test_run_group_id,
-                TFTTestRunTargetModel.tft_test_run_group_id,
-            ),
-            (
-                SyncReleaseTargetModel,
-                SyncReleaseModel,
-                PipelineModel.sync_release_run_id,
-                SyncReleaseTargetModel.sync_release_id,
-            ),
-        ]
-        for target_m, group_m, id_f, model_group_id in attr:
-            print(f"Working on {target_m}...")
-            orphaned = (
-                select(distinct(target_m.id))
-                .outerjoin_from(group_m, target_m, model_group_id == group_m.id)
-                .outerjoin(PipelineModel, id_f == group_m.id)
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(target_m).where(target_m.id.in_(orphaned))
-            conn.execute(stmt)
-
-        # Now that the targets are all cleaned up, let's get rid of the Groups
-        # which don't reference any targets and are not referenced by any pipeline.
-        #   - CoprBuildGroups
-        #   - KojiBuildGroups
-        #   - TFTTestRunGroups
-        #   - SynReleaseRuns
-        groups = [
-            (
-                CoprBuildGroupModel,
-                CoprBuildTargetModel,
-                CoprBuildTargetModel.copr_build_group_id,
-                PipelineModel.copr_build_group_id,
-            ),
-            (
-                KojiBuildGroupModel,
-                KojiBuildTargetModel,
-                KojiBuildTargetModel.koji_build_group_id,
-                PipelineModel.koji_build_group_id,
-            ),
-            (
-                TFTTestRunGroupModel,
-                TFTTestRunTargetModel,
-                TFTTestRunTargetModel.tft_test_run_group_id,
-                PipelineModel.test_run_group_id,
-            ),
-        ]
-        for group, target, target_group_id, pipeline_group_id in groups:
-            orphaned_groups = (
-                select(distinct(group.id))
-                .outerjoin(
-                    target,
-                    group.id == target_group_id,
-                )
-                .outerjoin(
-                    PipelineModel,
-                    pipeline_group_id == group.id,
-                )
-                .filter(target.id == None)  # noqa
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(group).where(group.id.in_(orphaned_groups))
-            conn.execute(stmt)
-
-        # Delete the trigger objects which are not referenced by any JobTriggers
-        #   - PullRequestModel
-        #   - GitBranchModel
-        #   - ProjectReleaseModel
-        #   - IssueModel
-
-        trigger_types = [
-            (JobTriggerModelType.pull_request, PullRequestModel),
-            (JobTriggerModelType.branch_push, GitBranchModel),
-            (JobTriggerModelType.release, ProjectReleaseModel),
-            (JobTriggerModelType.issue, IssueModel),
-        ]
-        for trigger_type, trigger_model in trigger_types:
-            triggers = (
-                select(JobTriggerModel)
-                .filter(JobTriggerModel.type == trigger_type)
-                .subquery()
-            )
-            orphaned_triggers = (
-                select(trigger_model.id)
-                .outerjoin(triggers, trigger_model.id == triggers.columns.trigger_id)
-                .filter(triggers.columns.trigger_id == None)  # noqa
-            )
-            stmt = delete(trigger_model).where(trigger_model.id.in_(orphaned_triggers))
-            conn.execute(stmt)
+    parser.add_argument(
+        "--batch-sleep",
+        type=float,
+        default=DEFAULT_RETENTION_BATCH_SLEEP,
+        help="Pause (in seconds) after each batch. "
+        f"Defaults to {DEFAULT_RETENTION_BATCH_SLEEP}.",
+    )
+    args = parser.parse_args()
 
-        # Delete the GitProjectModel not referenced by anything
-        # - PullRequestModel
-        # - GitBranchModel
-        # - ProjectReleaseModel
-        # - IssueModel
-        # - ProjectAuthenticationIssueModel
-        referenced_projects = union(
-            select(PullRequestModel.project_id),
-            select(GitBranchModel.project_id),
-            select(ProjectReleaseModel.project_id),
-            select(IssueModel.project_id),
-            select(ProjectAuthenticationIssueModel.project_id),
+    logging.basicConfig(level=logging.INFO)
+    # the times in the DB are in UTC (without a time zone)
+    before = (
+        sa_session()
+        .execute(
+            text("SELECT (now() AT TIME ZONE 'utc') - CAST(:age AS interval)"),
+            {"age": args.age},
         )
-        stmt = delete(GitProjectModel).where(
-            GitProjectModel.id.not_in(referenced_projects)
-        )
-        conn.execute(stmt)
+        .scalar()
+    )
+    Retention(
+        srpm_build_logs_before=before,
+        pipelines_before=before,
+        batch_size=args.batch_size,
+        batch_sleep=args.batch_sleep,
+        delete_orphaned_project_events=True,
+    ).run()
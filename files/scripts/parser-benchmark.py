@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Micro-benchmark of the parsing of the events
+
+Parses the JSON samples of the events (tests/data by default) and reports
+the number of events parsed per second for every event family.
+"""
+import json
+from collections import defaultdict
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+import click
+
+from packit_service.worker.parser import Parser
+
+DEFAULT_DATA_DIR = Path(__file__).parents[2] / "tests" / "data"
+
+
+def load_samples(data_dir: Path) -> Dict[Tuple[str, str], List[dict]]:
+    """Load the samples of the events grouped by their source and type."""
+    samples = defaultdict(list)
+    for path in sorted(data_dir.rglob("*.json")):
+        event = json.loads(path.read_text())
+        if not isinstance(event, dict):
+            continue
+        source, event_type = Parser.get_event_type(event)
+        if source:
+            samples[source, event_type].append(event)
+    return samples
+
+
+@click.command()
+@click.option(
+    "--data-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=DEFAULT_DATA_DIR,
+    show_default=True,
+    help="Directory with the JSON samples of the events.",
+)
+@click.option(
+    "--rounds",
+    type=int,
+    default=1000,
+    show_default=True,
+    help="How many times each sample is parsed.",
+)
+def benchmark(data_dir: Path, rounds: int):
+    """
+    Report events/sec of Parser.parse_event for every event family.
+
+    Some parsers query the database (e.g. the Testing Farm results),
+    those are reported as failed without it.
+    """
+    for (source, event_type), events in sorted(load_samples(data_dir).items()):
+        family = f"{source}/{event_type}"
+        start = perf_counter()
+        try:
+            for _ in range(rounds):
+                for event in events:
+                    Parser.parse_event(event)
+        except Exception as ex:
+            click.echo(f"{family:<50} failed: {ex!r}")
+            continue
+        elapsed = perf_counter() - start
+        click.echo(
+            f"{family:<50} {rounds * len(events) / elapsed:>12.0f} events/s "
+            f"({len(events)} samples)"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
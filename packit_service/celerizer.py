@@ -1,12 +1,11 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from os import getenv
-
 from celery import Celery
 from lazy_object_proxy import Proxy
 
 from packit_service.sentry_integration import configure_sentry
+from packit_service.utils import get_redis_url
 
 
 class Celerizer:
@@ -16,14 +15,8 @@ class Celerizer:
     @property
     def celery_app(self):
         if self._celery_app is None:
-            host = getenv("REDIS_SERVICE_HOST", "redis")
-            password = getenv("REDIS_PASSWORD", "")
-            port = getenv("REDIS_SERVICE_PORT", "6379")
-            db = getenv("REDIS_SERVICE_DB", "0")
-            broker_url = f"redis://:{password}@{host}:{port}/{db}"
-
             # http://docs.celeryq.dev/en/stable/reference/celery.html#celery.Celery
-            self._celery_app = Celery(broker=broker_url)
+            self._celery_app = Celery(broker=get_redis_url())
 
             # https://docs.celeryq.dev/en/stable/getting-started/first-steps-with-celery.html#configuration
             self._celery_app.config_from_object("packit_service.celery_config")
@@ -1,5 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
+from os import getenv
+
 from celery.schedules import crontab
 
 import packit_service.constants
@@ -7,6 +9,10 @@ import packit_service.constants
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_default_queue
 task_default_queue = packit_service.constants.CELERY_TASK_DEFAULT_QUEUE
 
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-compression
+# e.g. "zlib" or "gzip", the task messages are not compressed by default
+task_compression = getenv("CELERY_TASK_COMPRESSION")
+
 # https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html
 beat_schedule = {
     "update-pending-copr-builds": {
@@ -17,13 +23,19 @@ beat_schedule = {
     "update-pending-tft-runs": {
         "task": "packit_service.worker.tasks.babysit_pending_tft_runs",
         "schedule": 600.0,
-        "options": {"queue": "long-running"},
+        # don't pile up the runs when the queue is busy, the next one is coming
+        "options": {"queue": "long-running", "expires": 600.0},
     },
     "update-pending-vm-image-builds": {
         "task": "packit_service.worker.tasks.babysit_pending_vm_image_builds",
         "schedule": 3600.0,
         "options": {"queue": "long-running"},
     },
+    "refresh-usage-rollups": {
+        "task": "packit_service.worker.tasks.refresh_usage_rollups",
+        "schedule": 3600.0,
+        "options": {"queue": "long-running"},
+    },
     "database-maintenance": {
         "task": "packit_service.worker.tasks.database_maintenance",
         "schedule": crontab(minute=0, hour=1),  # nightly at 1AM
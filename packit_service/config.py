@@ -1,12 +1,17 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
 import logging
 import os
+import re
 from pathlib import Path
-from typing import List, NamedTuple, Optional, Set, Union
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional, Set, Union
 
+from cachetools import LRUCache
 from ogr.abstract import GitProject, Issue
+from redis.exceptions import RedisError
 from yaml import safe_load
 
 from packit.config import (
@@ -25,12 +30,19 @@ from packit_service.constants import (
     CONFIG_FILE_NAME,
     CONTACTS_URL,
     DOCS_HOW_TO_CONFIGURE_URL,
+    PACKAGE_CONFIG_CACHE_SIZE,
+    PACKAGE_CONFIG_CACHE_TTL,
     SANDCASTLE_DEFAULT_PROJECT,
     SANDCASTLE_IMAGE,
     SANDCASTLE_PVC,
     SANDCASTLE_WORK_DIR,
     TESTING_FARM_API_URL,
 )
+from packit_service.utils import dump_package_config, get_redis, load_package_config
+from packit_service.worker.monitoring import (
+    package_config_cache_hits,
+    package_config_cache_misses,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +121,7 @@ class ServiceConfig(Config):
         comment_command_prefix: str = "/packit",
         redhat_api_refresh_token: str = None,
         package_config_path_override: Optional[str] = None,
+        debounce_windows: Optional[Dict[str, int]] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -173,6 +186,11 @@ class ServiceConfig(Config):
         # default names.
         self.package_config_path_override = package_config_path_override
 
+        # Debounce windows (in seconds) per trigger ("pull_request", "commit"
+        # or "comment"), only the latest of the events for the same PR or branch
+        # arriving within the window is processed. Disabled by default.
+        self.debounce_windows: Dict[str, int] = debounce_windows or {}
+
     service_config = None
 
     def __repr__(self):
@@ -201,7 +219,8 @@ class ServiceConfig(Config):
             f"enabled_projects_for_srpm_in_copr= '{self.enabled_projects_for_srpm_in_copr}', "
             f"comment_command_prefix='{self.comment_command_prefix}', "
             f"redhat_api_refresh_token='{hide(self.redhat_api_refresh_token)}', "
-            f"package_config_path_override='{self.package_config_path_override}')"
+            f"package_config_path_override='{self.package_config_path_override}', "
+            f"debounce_windows='{self.debounce_windows}')"
         )
 
     @classmethod
@@ -275,6 +294,84 @@ class ServiceConfig(Config):
         }.get(self.deployment)
 
 
+class PackageConfigCache:
+    """
+    Cache of the package configs parsed from the repositories.
+
+    Only the configs loaded at a commit SHA are cached, since those can't change.
+    The configs are kept (serialized, so every caller gets its own copy)
+    in memory of the process and in Redis, shared by all the processes.
+    """
+
+    COMMIT_SHA = re.compile(r"[0-9a-f]{40}")
+
+    _local: LRUCache = LRUCache(maxsize=PACKAGE_CONFIG_CACHE_SIZE)
+    _lock = Lock()
+
+    @classmethod
+    def get_key(
+        cls,
+        project: GitProject,
+        reference: Optional[str],
+        package_config_path: Optional[str],
+    ) -> Optional[str]:
+        """
+        Get the cache key for the package config of the project at the reference.
+
+        Returns:
+            Key or `None` if the reference is not a commit SHA
+            and the package config can't be cached.
+        """
+        if not reference or not cls.COMMIT_SHA.fullmatch(reference):
+            return None
+
+        return (
+            f"packit-service:package-config:{project.service.instance_url}/"
+            f"{project.full_repo_name}:{reference}:{package_config_path or ''}"
+        )
+
+    @classmethod
+    def get(cls, key: str) -> Optional[PackageConfig]:
+        with cls._lock:
+            dumped_config = cls._local.get(key)
+        if dumped_config is not None:
+            package_config_cache_hits.labels(tier="memory").inc()
+            return load_package_config(dumped_config)
+
+        try:
+            cached = get_redis().get(key)
+        except RedisError as ex:
+            logger.warning(f"Failed to get the package config from Redis: {ex!r}")
+            cached = None
+        if cached is None:
+            package_config_cache_misses.inc()
+            return None
+
+        package_config_cache_hits.labels(tier="redis").inc()
+        dumped_config = json.loads(cached)
+        with cls._lock:
+            cls._local[key] = dumped_config
+        return load_package_config(dumped_config)
+
+    @classmethod
+    def set(cls, key: str, package_config: PackageConfig):
+        dumped_config = dump_package_config(package_config)
+        with cls._lock:
+            cls._local[key] = dumped_config
+        try:
+            get_redis().set(key, json.dumps(dumped_config), ex=PACKAGE_CONFIG_CACHE_TTL)
+        except RedisError as ex:
+            logger.warning(f"Failed to store the package config in Redis: {ex!r}")
+
+    @classmethod
+    def clear(cls):
+        """
+        Clear the in-memory cache of the process.
+        """
+        with cls._lock:
+            cls._local.clear()
+
+
 class PackageConfigGetter:
     @staticmethod
     def create_issue_if_needed(
@@ -319,11 +416,21 @@ class PackageConfigGetter:
             return None
 
         project_to_search_in = base_project or project
+        package_config_path = (
+            ServiceConfig.get_service_config().package_config_path_override
+        )
+        cache_key = PackageConfigCache.get_key(
+            project_to_search_in, reference, package_config_path
+        )
+        if cache_key and (package_config := PackageConfigCache.get(cache_key)):
+            logger.debug(f"Package config for {reference} taken from the cache.")
+            return package_config
+
         try:
             package_config: PackageConfig = get_package_config_from_repo(
                 project=project_to_search_in,
                 ref=reference,
-                package_config_path=ServiceConfig.get_service_config().package_config_path_override,
+                package_config_path=package_config_path,
             )
             if not package_config and fail_when_missing:
                 raise PackitMissingConfigException(
@@ -354,4 +461,7 @@ class PackageConfigGetter:
                 )
             raise ex
 
+        if cache_key and package_config:
+            PackageConfigCache.set(cache_key, package_config)
+
         return package_config
@@ -103,10 +103,58 @@ BASE_RETRY_INTERVAL_IN_SECONDS_FOR_INTERNAL_ERRORS = 10
 # timeout/internal error. Nothing should hopefully run for 7 days.
 DEFAULT_JOB_TIMEOUT = 7 * 24 * 3600
 
+# Number of Copr builds the periodic babysit task checks concurrently,
+# 1 means the pending builds are checked one after another.
+DEFAULT_BABYSIT_COPR_CONCURRENCY = 1
+# Wall-clock time (in seconds) one babysit run can spend on checking
+# the pending Copr builds, the rest is left for the next run.
+# Keep it below the celery task_time_limit (see celery_config.py).
+DEFAULT_BABYSIT_COPR_TIME_BUDGET = 12 * 60
+
+# Number of Testing Farm requests the periodic babysit task fetches concurrently.
+DEFAULT_BABYSIT_TF_CONCURRENCY = 4
+# Wall-clock time (in seconds) one babysit run can spend on checking
+# the pending Testing Farm runs. Keep it below the interval of the periodic
+# task (see celery_config.py) so that two runs never overlap.
+DEFAULT_BABYSIT_TF_TIME_BUDGET = 8 * 60
+# Timeout (in seconds) for a single request to the Testing Farm API.
+TESTING_FARM_API_TIMEOUT = 30
+# Age (in seconds) after which the cached list of Testing Farm composes
+# is refreshed in the background, the cached list is used in the meantime.
+TESTING_FARM_COMPOSES_REFRESH_INTERVAL = 10 * 60
+# Age (in seconds) after which the cached list of Testing Farm composes
+# is not used unless Testing Farm fails to provide a new one.
+TESTING_FARM_COMPOSES_MAX_AGE = 24 * 3600
+
+# Number of commit statuses (check runs, flags) set in parallel
+# when reporting the same state to multiple checks.
+DEFAULT_STATUS_REPORTING_CONCURRENCY = 8
+
+# Time (in seconds) a status update of a non-final state (pending, running) is held
+# back, so that only the latest one is sent if the state changes in the meantime.
+# 0 means the statuses are sent right away.
+DEFAULT_STATUS_COALESCING_WINDOW = 0
+# Time (in seconds) the last status set for a check is remembered
+# so that setting the same status again can be skipped.
+COMMIT_STATUS_CACHE_TTL = 24 * 3600
+
 # SRPM builds older than this number of days are considered
 # outdated and their logs can be discarded.
 SRPMBUILDS_OUTDATED_AFTER_DAYS = 30
 
+# Size (in bytes) of the parts of the database backup uploaded to S3 and number
+# of the parts uploaded at once, roughly their product is held in memory.
+BACKUP_MULTIPART_CHUNK_SIZE = 64 * 1024 * 1024
+BACKUP_UPLOAD_CONCURRENCY = 4
+
+# Number of rows removed (or updated) at once by the retention of the outdated data.
+DEFAULT_RETENTION_BATCH_SIZE = 1000
+# Pause (in seconds) after each batch, so that the retention doesn't load the database.
+DEFAULT_RETENTION_BATCH_SLEEP = 0.5
+# Time (in seconds) after which the retention is stopped (and continued by the next
+# run), so that the backup running after it fits in the time limit of the task.
+DEFAULT_RETENTION_TIME_LIMIT = 5 * 60
+
 ALLOWLIST_CONSTANTS = {
     "approved_automatically": "approved_automatically",
     "waiting": "waiting",
@@ -114,6 +162,77 @@ ALLOWLIST_CONSTANTS = {
     "denied": "denied",
 }
 
+# Prefix of the Redis keys of the package configs passed to the Celery tasks
+# by reference, and the time (in seconds) they are kept there.
+PACKAGE_CONFIG_REFERENCE_PREFIX = "packit-service:package-config-blob:"
+PACKAGE_CONFIG_REFERENCE_TTL = 7 * 24 * 3600
+
+# Prefix of the Redis keys registering the deliveries of the events, and the time
+# (in seconds) they are kept there, GitHub can redeliver webhooks up to 3 days old.
+DELIVERY_KEY_PREFIX = "packit-service:delivery:"
+DELIVERY_TTL = 3 * 24 * 3600
+
+# Prefix of the Redis keys holding the latest event for a PR or a branch
+# within its debounce window, see `debounce_windows` in the service config.
+DEBOUNCE_KEY_PREFIX = "packit-service:debounce:"
+# Triggers the debounce window can be configured for
+DEBOUNCE_TRIGGERS = ("pull_request", "commit", "comment")
+
+# Prefix of the Redis keys of the token buckets of the projects, which limit
+# the rate the handler tasks of a project are dispatched with.
+FAIR_SHARE_KEY_PREFIX = "packit-service:fair-share:"
+# Number of handler tasks per second a project can dispatch in the long run
+# (the rate its bucket is refilled with), the tasks over it are deferred.
+# 0 means the tasks are dispatched right away.
+DEFAULT_FAIR_SHARE_RATE = 0
+# Number of handler tasks a project can dispatch at once (capacity of its bucket).
+DEFAULT_FAIR_SHARE_BURST = 20
+# Maximum time (in seconds) a task is deferred by, well below the visibility
+# timeout of the Redis broker (1 hour) so that the deferred tasks aren't redelivered.
+FAIR_SHARE_MAX_DELAY = 30 * 60
+
+# Minimal time (in seconds) between two pushes of the metrics of a worker
+# to the pushgateway, the metrics updated in the meantime are pushed together.
+PUSHGATEWAY_PUSH_INTERVAL = 15
+# Timeout (in seconds) for pushing the metrics to the pushgateway.
+PUSHGATEWAY_TIMEOUT = 10
+
+# Number of parsed package configs kept in memory by each process.
+PACKAGE_CONFIG_CACHE_SIZE = 256
+# Time (in seconds) the parsed package configs are kept in Redis, configs
+# are cached only for commit SHAs so they can't change in the meantime.
+PACKAGE_CONFIG_CACHE_TTL = 7 * 24 * 3600
+
+# Number of the DB IDs of projects and project event objects (PRs, branches, …)
+# resolved from the events kept in memory by each process.
+DB_ID_CACHE_SIZE = 10_000
+# Time (in seconds) the resolved DB IDs are kept in memory of the process.
+DB_ID_CACHE_TTL = 3600
+# Time (in seconds) the resolved DB IDs are kept in Redis, shared by all
+# the processes, the IDs of the objects don't change.
+DB_ID_CACHE_REDIS_TTL = 7 * 24 * 3600
+
+# Size (in characters) of the chunks the logs are streamed from the log store in.
+LOG_STORE_CHUNK_SIZE = 64 * 1024
+
+# Time (in seconds) the logs in the log store are kept since they were stored (again)
+# even if no model refers to them, the model storing them may not be committed yet.
+LOG_STORE_DELETE_GRACE_PERIOD = 3600
+
+# Number of objects loaded at once when iterating over possibly many of them,
+# e.g. the pending builds checked by the babysitters.
+ITER_IN_CHUNKS_SIZE = 500
+
+# Redis key holding the version of the allowlist, it's increased with every change
+# so that the processes know they need to reload their in-memory allowlist index.
+ALLOWLIST_VERSION_KEY = "packit-service:allowlist-version"
+# Maximum age (in seconds) of the in-memory allowlist index, a safety net
+# for changes whose version bump didn't make it to Redis.
+ALLOWLIST_INDEX_MAX_AGE = 10 * 60
+
+# Timeout (in seconds) for connecting to and talking with Redis.
+REDIS_SOCKET_TIMEOUT = 5
+
 CELERY_TASK_DEFAULT_QUEUE = "short-running"
 
 CELERY_DEFAULT_MAIN_TASK_NAME = "task.steve_jobs.process_message"
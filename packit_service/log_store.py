@@ -0,0 +1,230 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Storage of the logs (of SRPM builds and sync release runs) outside of the database.
+
+The logs are stored gzip-compressed under the SHA-256 of their content
+and the database rows keep only the reference (`sha256:<digest>`) to them.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from gzip import GzipFile, compress
+from hashlib import sha256
+from io import TextIOWrapper
+from os import getenv, utime
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, Iterator, Optional
+from urllib.parse import urlparse
+
+from packit_service.constants import LOG_STORE_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_PREFIX = "sha256:"
+
+
+class LogStore(ABC):
+    """
+    Content-addressed store of compressed logs.
+    """
+
+    def put(self, logs: str) -> str:
+        """
+        Store the logs.
+
+        Returns:
+            Reference to the stored logs.
+        """
+        data = logs.encode()
+        digest = sha256(data).hexdigest()
+        self._write(self.get_name(digest), compress(data))
+        return f"{REFERENCE_PREFIX}{digest}"
+
+    def stream(self, reference: str) -> Iterator[str]:
+        """
+        Read the logs decompressed, chunk by chunk.
+        """
+        with TextIOWrapper(
+            GzipFile(fileobj=self._open(self._get_name(reference))),
+            encoding="utf-8",
+            errors="replace",
+        ) as logs:
+            while chunk := logs.read(LOG_STORE_CHUNK_SIZE):
+                yield chunk
+
+    def get(self, reference: str) -> str:
+        """
+        Read the whole logs.
+        """
+        return "".join(self.stream(reference))
+
+    def delete(self, reference: str, grace_period: Optional[int] = None) -> bool:
+        """
+        Delete the logs.
+
+        Args:
+            reference: Reference to the logs.
+            grace_period: Keep the logs if they were stored (again) within
+                the period (in seconds), a model not committed yet may refer
+                to them.
+
+        Returns:
+            Whether the logs were deleted.
+        """
+        name = self._get_name(reference)
+        if grace_period is not None:
+            modified = self._get_modified(name)
+            kept_since = datetime.now(timezone.utc) - timedelta(seconds=grace_period)
+            if modified and modified > kept_since:
+                logger.debug(f"Logs {reference} stored recently, not deleting them.")
+                return False
+
+        self._delete(name)
+        return True
+
+    @staticmethod
+    def get_name(digest: str) -> str:
+        """
+        Name of the object with the compressed logs.
+        """
+        return f"{digest[:2]}/{digest}.gz"
+
+    def _get_name(self, reference: str) -> str:
+        if not reference.startswith(REFERENCE_PREFIX):
+            raise ValueError(f"Invalid reference to logs: {reference}")
+        return self.get_name(reference.removeprefix(REFERENCE_PREFIX))
+
+    @abstractmethod
+    def _write(self, name: str, data: bytes) -> None:
+        """
+        Write the object. If it exists (the content would be the same),
+        at least update its modification time.
+        """
+
+    @abstractmethod
+    def _get_modified(self, name: str) -> Optional[datetime]:
+        """Time of the last modification of the object, `None` if it doesn't exist."""
+
+    @abstractmethod
+    def _open(self, name: str) -> BinaryIO:
+        """Open the object for reading."""
+
+    @abstractmethod
+    def _delete(self, name: str) -> None:
+        """Delete the object, if it exists."""
+
+
+class FilesystemLogStore(LogStore):
+    """
+    Logs stored in a directory, e.g. on a persistent volume.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def _write(self, name: str, data: bytes) -> None:
+        path = self.root / name
+        try:
+            # stored already, only make it recent, so that it's not deleted
+            # as unreferenced before the model referring to it is committed
+            utime(path)
+            return
+        except FileNotFoundError:
+            pass
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # written under a temporary name, so no one reads a partial object
+        with NamedTemporaryFile(dir=path.parent, delete=False) as file:
+            file.write(data)
+        Path(file.name).rename(path)
+
+    def _get_modified(self, name: str) -> Optional[datetime]:
+        try:
+            return datetime.fromtimestamp(
+                (self.root / name).stat().st_mtime, timezone.utc
+            )
+        except FileNotFoundError:
+            return None
+
+    def _open(self, name: str) -> BinaryIO:
+        return (self.root / name).open("rb")
+
+    def _delete(self, name: str) -> None:
+        (self.root / name).unlink(missing_ok=True)
+
+
+class S3LogStore(LogStore):
+    """
+    Logs stored in an S3(-compatible) bucket.
+    """
+
+    def __init__(
+        self, bucket: str, prefix: str = "", endpoint_url: Optional[str] = None
+    ):
+        # only the deployments storing the logs in S3 need boto3
+        from boto3 import client as boto3_client
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.s3_client = boto3_client("s3", endpoint_url=endpoint_url)
+
+    def _write(self, name: str, data: bytes) -> None:
+        # rewritten even if it exists, which updates its modification time
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=f"{self.prefix}{name}",
+            Body=data,
+            ContentType="application/gzip",
+        )
+
+    def _get_modified(self, name: str) -> Optional[datetime]:
+        try:
+            return self.s3_client.head_object(
+                Bucket=self.bucket, Key=f"{self.prefix}{name}"
+            )["LastModified"]
+        except self.s3_client.exceptions.ClientError as ex:
+            if ex.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+
+    def _open(self, name: str) -> BinaryIO:
+        return self.s3_client.get_object(
+            Bucket=self.bucket, Key=f"{self.prefix}{name}"
+        )["Body"]
+
+    def _delete(self, name: str) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket, Key=f"{self.prefix}{name}")
+
+
+@lru_cache
+def get_log_store() -> Optional[LogStore]:
+    """
+    Get the log store configured by the `LOG_STORE_URL` env. var.,
+    either `file:///path/to/directory` or `s3://bucket/prefix`
+    (`LOG_STORE_S3_ENDPOINT_URL` can point to an S3-compatible service).
+
+    Returns:
+        Log store or `None` if not configured and the logs are kept in the database.
+    """
+    url = getenv("LOG_STORE_URL")
+    if not url:
+        return None
+
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        return FilesystemLogStore(Path(parsed.path))
+    if parsed.scheme == "s3":
+        prefix = parsed.path.lstrip("/")
+        return S3LogStore(
+            bucket=parsed.netloc,
+            prefix=f"{prefix.rstrip('/')}/" if prefix else "",
+            endpoint_url=getenv("LOG_STORE_S3_ENDPOINT_URL"),
+        )
+
+    logger.error(f"Unsupported log store: {url}, keeping the logs in the database.")
+    return None
@@ -7,14 +7,17 @@ Data layer on top of PSQL using sqlalch
 
 import enum
 import logging
-from collections import Counter
+import threading
 from contextlib import contextmanager
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from os import getenv
 from typing import (
+    Any,
     Dict,
     Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     TYPE_CHECKING,
     Tuple,
@@ -25,39 +28,68 @@ from typing import (
 )
 from urllib.parse import urlparse
 
+from cachetools import TTLCache
 from cachetools.func import ttl_cache
+from redis.exceptions import RedisError
 from sqlalchemy import (
     Boolean,
     Column,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
     Text,
+    UniqueConstraint,
+    and_,
+    cast,
     create_engine,
     desc,
+    distinct,
+    exists,
     func,
+    insert,
+    literal,
     null,
+    or_,
     case,
+    select,
     Table,
+    text,
+    tuple_,
+    union_all,
+    update,
 )
-from sqlalchemy.dialects.postgresql import array as psql_array
+from sqlalchemy.dialects.postgresql import array as psql_array, insert as psql_insert
 from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import (
     Session as SQLASession,
+    aliased,
+    joinedload,
     relationship,
     scoped_session,
+    selectinload,
     sessionmaker,
 )
-from sqlalchemy.sql.functions import count
 from sqlalchemy.types import ARRAY
 
 from packit.config import JobConfigTriggerType
 from packit.exceptions import PackitException
-from packit_service.constants import ALLOWLIST_CONSTANTS
+from packit_service.constants import (
+    ALLOWLIST_CONSTANTS,
+    ALLOWLIST_VERSION_KEY,
+    DB_ID_CACHE_REDIS_TTL,
+    DB_ID_CACHE_SIZE,
+    DB_ID_CACHE_TTL,
+    ITER_IN_CHUNKS_SIZE,
+    LOG_STORE_DELETE_GRACE_PERIOD,
+)
+from packit_service.log_store import get_log_store
+from packit_service.utils import get_redis
 
 logger = logging.getLogger(__name__)
 
@@ -110,17 +142,30 @@ def sa_session() -> SQLASession:
     return singleton_session or Session()
 
 
+# depth of the sa_session_deferred_commit() contexts (of the current thread)
+_deferred_commit = threading.local()
+
+
 @contextmanager
 def sa_session_transaction() -> SQLASession:
     """
     Context manager for 'framing' of a transaction for cases where we
     commit data to the database. If all operations succeed
     the transaction is committed, otherwise rolled back.
+    Within `sa_session_deferred_commit()` the commit is left to it.
     https://docs.sqlalchemy.org/en/14/orm/session_basics.html#framing-out-a-begin-commit-rollback-block
     TODO: Replace usages of this function with the sessionmaker.begin[_nested]() as described in
     https://docs.sqlalchemy.org/en/14/orm/session_basics.html#using-a-sessionmaker
     """
     session = sa_session()
+    if getattr(_deferred_commit, "depth", 0):
+        # committed by the sa_session_deferred_commit() we are in
+        yield session
+        if session.new:
+            # the callers expect the new objects to have their IDs set
+            session.flush()
+        return
+
     try:
         yield session
         session.commit()
@@ -130,6 +175,156 @@ def sa_session_transaction() -> SQLASession:
         raise
 
 
+@contextmanager
+def sa_session_deferred_commit() -> SQLASession:
+    """
+    Context manager for grouping the changes done within it (e.g. by multiple
+    setters of a model called for a single state transition) into one transaction.
+
+    The `sa_session_transaction()`s within it don't commit, the changes
+    are committed at once when leaving the outermost context if all
+    the operations succeed, otherwise all of them are rolled back.
+    Updates of the existing rows are sent to the database during the commit
+    (unless a query flushes them earlier), so the rows are not locked
+    for the time between the changes.
+    """
+    session = sa_session()
+    depth = getattr(_deferred_commit, "depth", 0)
+    _deferred_commit.depth = depth + 1
+    try:
+        yield session
+        if not depth:
+            session.commit()
+    except Exception as ex:
+        if not depth:
+            logger.warning(f"Exception while working with database: {ex!r}")
+            session.rollback()
+        raise
+    finally:
+        _deferred_commit.depth = depth
+
+
+def _get_or_create(
+    session: SQLASession,
+    model: Type["Base"],
+    keys: Dict[str, Any],
+    values: Optional[Dict[str, Any]] = None,
+):
+    """
+    Get the object identified by the `keys` (backed by a unique constraint)
+    or create it, with the additional `values`, if it doesn't exist.
+
+    The object is created by `INSERT … ON CONFLICT DO NOTHING RETURNING`,
+    so if another worker creates the same object in the meantime, the existing
+    object is returned instead of creating a duplicate.
+    """
+    instance = session.query(model).filter_by(**keys).first()
+    if instance:
+        return instance
+
+    insert_statement = (
+        psql_insert(model.__table__)
+        .values(**keys, **(values or {}))
+        .on_conflict_do_nothing(index_elements=list(keys))
+        .returning(*model.__table__.columns)
+    )
+    instance = (
+        session.execute(select(model).from_statement(insert_statement))
+        .scalars()
+        .first()
+    )
+    if instance:
+        return instance
+
+    # created concurrently
+    return session.query(model).filter_by(**keys).one()
+
+
+class DbIdCache:
+    """
+    Cache of the DB IDs of the objects resolved from the events,
+    e.g. the pull request by the project URL, namespace, repo name and PR number.
+
+    The events of a project come in bursts, so the objects are then taken
+    by their primary key (from the session, if already loaded) instead of
+    querying for them again. The IDs are kept in memory of the process
+    and in Redis, shared by all the processes.
+    """
+
+    _local: TTLCache = TTLCache(maxsize=DB_ID_CACHE_SIZE, ttl=DB_ID_CACHE_TTL)
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_key(model: Type["Base"], *identifiers: Any) -> str:
+        return ":".join(
+            ["packit-service:db-id", model.__tablename__]
+            + [str(identifier) for identifier in identifiers]
+        )
+
+    @classmethod
+    def get(cls, key: str) -> Optional[int]:
+        with cls._lock:
+            id_ = cls._local.get(key)
+        if id_ is not None:
+            return id_
+
+        try:
+            id_ = get_redis().get(key)
+        except RedisError as ex:
+            logger.warning(f"Failed to get the cached DB ID: {ex!r}")
+            return None
+        if id_ is None:
+            return None
+
+        id_ = int(id_)
+        with cls._lock:
+            cls._local[key] = id_
+        return id_
+
+    @classmethod
+    def set(cls, key: str, id_: int) -> None:
+        with cls._lock:
+            cls._local[key] = id_
+        try:
+            get_redis().set(key, id_, ex=DB_ID_CACHE_REDIS_TTL)
+        except RedisError as ex:
+            logger.warning(f"Failed to cache the DB ID: {ex!r}")
+
+    @classmethod
+    def get_object(
+        cls, session: SQLASession, model: Type["Base"], key: str, **identity: Any
+    ):
+        """
+        Get the object of the model with the cached ID.
+
+        Args:
+            session: Session to get the object from.
+            model: Model of the object.
+            key: Cache key, see `get_key()`.
+            **identity: Attributes the object needs to have, so that an object
+                created in place of a deleted one isn't returned.
+
+        Returns:
+            The object or `None` if its ID is not cached (or outdated).
+        """
+        id_ = cls.get(key)
+        if id_ is None:
+            return None
+
+        instance = session.get(model, id_)
+        if instance is None or any(
+            getattr(instance, attribute) != value
+            for attribute, value in identity.items()
+        ):
+            return None
+        return instance
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._local.clear()
+
+
 def optional_time(
     datetime_object: Union[datetime, None], fmt: str = "%d/%m/%Y %H:%M:%S"
 ) -> Union[str, None]:
@@ -289,10 +484,23 @@ class BuildsAndTestsConnector:
     project_event_model_type: ProjectEventModelType
 
     def get_runs(self) -> List["PipelineModel"]:
+        session = sa_session()
+        key = DbIdCache.get_key(
+            ProjectEventModel, self.project_event_model_type.value, self.id
+        )
+        project_event = DbIdCache.get_object(
+            session,
+            ProjectEventModel,
+            key,
+            type=self.project_event_model_type,
+            event_id=self.id,
+        )
+        if project_event:
+            return project_event.runs
+
         try:
             project_event = (
-                sa_session()
-                .query(ProjectEventModel)
+                session.query(ProjectEventModel)
                 .filter_by(type=self.project_event_model_type, event_id=self.id)
                 .one_or_none()
             )
@@ -303,7 +511,11 @@ class BuildsAndTestsConnector:
             )
             logger.error(msg)
             raise PackitException(msg) from e
-        return project_event.runs if project_event else []
+        if not project_event:
+            return []
+
+        DbIdCache.set(key, project_event.id)
+        return project_event.runs
 
     def _get_run_item(
         self, model_type: Type["AbstractBuildTestDbType"]
@@ -430,6 +642,7 @@ class GroupModel:
 
 class GitProjectModel(Base):
     __tablename__ = "git_projects"
+    __table_args__ = (UniqueConstraint("namespace", "repo_name", "project_url"),)
     id = Column(Integer, primary_key=True)
     # github.com/NAMESPACE/REPO_NAME
     namespace = Column(String, index=True)
@@ -453,19 +666,25 @@ class GitProjectModel(Base):
     def get_or_create(
         cls, namespace: str, repo_name: str, project_url: str
     ) -> "GitProjectModel":
+        key = DbIdCache.get_key(cls, project_url, namespace, repo_name)
         with sa_session_transaction() as session:
-            project = (
-                session.query(GitProjectModel)
-                .filter_by(
-                    namespace=namespace, repo_name=repo_name, project_url=project_url
-                )
-                .first()
+            project = DbIdCache.get_object(
+                session, cls, key, namespace=namespace, repo_name=repo_name
             )
-            if not project:
-                project = cls(
-                    repo_name=repo_name, namespace=namespace, project_url=project_url
-                )
-                session.add(project)
+            if project:
+                return project
+
+            project = _get_or_create(
+                session,
+                cls,
+                keys={
+                    "namespace": namespace,
+                    "repo_name": repo_name,
+                    "project_url": project_url,
+                },
+                values={"instance_url": urlparse(project_url).hostname},
+            )
+            DbIdCache.set(key, project.id)
             return project
 
     @classmethod
@@ -519,9 +738,20 @@ class GitProjectModel(Base):
 
     @classmethod
     def get_project_prs(
-        cls, first: int, last: int, forge: str, namespace: str, repo_name: str
-    ) -> Iterable["PullRequestModel"]:
-        return (
+        cls,
+        first: int,
+        last: int,
+        forge: str,
+        namespace: str,
+        repo_name: str,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List["PullRequestModel"]:
+        """
+        Return a page of the PRs of the project, ordered by the PR IDs
+        from the newest. The cursors refer to the PR IDs (not the Packit IDs).
+        """
+        query = (
             sa_session()
             .query(PullRequestModel)
             .join(PullRequestModel.project)
@@ -529,9 +759,11 @@ class GitProjectModel(Base):
                 GitProjectModel.instance_url == forge,
                 GitProjectModel.namespace == namespace,
                 GitProjectModel.repo_name == repo_name,
+                *_cursor_conditions(PullRequestModel.pr_id, before_id, after_id),
             )
-            .order_by(desc(PullRequestModel.pr_id))
-            .slice(first, last)
+        )
+        return _paginate(
+            query, PullRequestModel.pr_id, first, last, before_id, after_id
         )
 
     @classmethod
@@ -582,7 +814,6 @@ class GitProjectModel(Base):
     # ACTIVE PROJECTS
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_active_projects(
         cls, top: Optional[int] = None, datetime_from=None, datetime_to=None
     ) -> list[str]:
@@ -597,36 +828,40 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_active_projects_count(cls, datetime_from=None, datetime_to=None) -> int:
         """
         Active project is the one with at least one activity (=one pipeline)
         during the given period.
         """
         return len(
-            cls.get_active_projects_usage_numbers(
-                top=None, datetime_from=datetime_from, datetime_to=datetime_to
+            UsageRollupModel.get_usage_numbers(
+                counted=PipelineModel.__tablename__,
+                datetime_from=datetime_from,
+                datetime_to=datetime_to,
             )
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_active_projects_usage_numbers(
         cls, top: Optional[int] = 10, datetime_from=None, datetime_to=None
     ) -> dict[str, int]:
         """
-        Get the most active projects sorted by the number of related pipelines.
+        Get the most active projects sorted by the number of related project events.
         """
-        all_usage_numbers: dict[str, int] = Counter()
-        for project_event_type in ProjectEventModelType:
-            all_usage_numbers.update(
-                cls.get_project_event_usage_numbers(
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to,
-                    top=None,
-                    project_event_type=project_event_type,
-                )
-            )
+        project_event_numbers = UsageRollupModel.get_usage_numbers(
+            counted=ProjectEventModel.__tablename__,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+        )
+        active_projects = UsageRollupModel.get_usage_numbers(
+            counted=PipelineModel.__tablename__,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+        )
+        all_usage_numbers = {
+            project_url: project_event_numbers.get(project_url, 0)
+            for project_url in active_projects
+        }
         return dict(
             sorted(all_usage_numbers.items(), key=lambda x: x[1], reverse=True)[:top]
         )
@@ -660,7 +895,6 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_instance_numbers_for_active_projects(
         cls, datetime_from=None, datetime_to=None
     ) -> Dict[str, int]:
@@ -668,49 +902,11 @@ class GitProjectModel(Base):
         Get the number of projects (at least one pipeline during the time period)
         per each GIT instances.
         """
-        projects_per_instance: dict[str, set[str]] = {}
-
-        for project_event_type in ProjectEventModelType:
-            project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-            query = (
-                sa_session()
-                .query(
-                    GitProjectModel.instance_url,
-                    GitProjectModel.project_url,
-                )
-                .join(
-                    project_event_model,
-                    GitProjectModel.id == project_event_model.project_id,
-                )
-                .join(
-                    ProjectEventModel,
-                    ProjectEventModel.event_id == project_event_model.id,
-                )
-                .join(
-                    PipelineModel,
-                    PipelineModel.project_event_id == ProjectEventModel.id,
-                )
-                .filter(ProjectEventModel.type == project_event_type)
-            )
-            if datetime_from:
-                query = query.filter(PipelineModel.datetime >= datetime_from)
-            if datetime_to:
-                query = query.filter(PipelineModel.datetime <= datetime_to)
-
-            query = query.group_by(
-                GitProjectModel.project_url, GitProjectModel.instance_url
-            )
-            for instance, project in query.all():
-                projects_per_instance.setdefault(instance, set())
-                projects_per_instance[instance].add(project)
-
-        return {
-            instance: len(projects)
-            for instance, projects in projects_per_instance.items()
-        }
+        return UsageRollupModel.get_instance_numbers(
+            datetime_from=datetime_from, datetime_to=datetime_to
+        )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_project_event_usage_count(
         cls,
         project_event_type: ProjectEventModelType,
@@ -720,8 +916,6 @@ class GitProjectModel(Base):
         """
         Get the number of triggers of a given type with at least one pipeline from the given period.
         """
-        # TODO: share the computation with _get_trigger_usage_numbers
-        #       (one query with top and one without)
         return sum(
             cls.get_project_event_usage_numbers(
                 datetime_from=datetime_from,
@@ -732,7 +926,6 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_project_event_usage_numbers(
         cls, project_event_type, datetime_from=None, datetime_to=None, top=None
     ) -> dict[str, int]:
@@ -743,53 +936,15 @@ class GitProjectModel(Base):
         Order from the highest numbers.
         All if `top` not set, the first `top` projects returned otherwise.
         """
-        project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-        query = (
-            sa_session()
-            .query(
-                GitProjectModel.project_url,
-                count(project_event_model.id).over(
-                    partition_by=GitProjectModel.project_url
-                ),
-            )
-            .join(
-                project_event_model,
-                GitProjectModel.id == project_event_model.project_id,
-            )
-            .join(
-                ProjectEventModel, ProjectEventModel.event_id == project_event_model.id
-            )
-            .join(
-                PipelineModel,
-                PipelineModel.project_event_id == ProjectEventModel.id,
-            )
-            .filter(ProjectEventModel.type == project_event_type)
-            .filter(GitProjectModel.instance_url != "src.fedoraproject.org")
+        return UsageRollupModel.get_usage_numbers(
+            counted=ProjectEventModel.__tablename__,
+            project_event_type=project_event_type,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+            top=top,
         )
-        if datetime_from:
-            query = query.filter(PipelineModel.datetime >= datetime_from)
-        if datetime_to:
-            query = query.filter(PipelineModel.datetime <= datetime_to)
-
-        query = (
-            query.group_by(GitProjectModel.project_url, project_event_model.id)
-            .distinct()
-            .order_by(
-                desc(
-                    count(project_event_model.id).over(
-                        partition_by=GitProjectModel.project_url
-                    )
-                )
-            )
-        )
-
-        if top:
-            query = query.limit(top)
-
-        return dict(query.all())
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_job_usage_numbers_count(
         cls,
         job_result_model,
@@ -812,7 +967,6 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_job_usage_numbers_count_all_project_events(
         cls,
         job_result_model,
@@ -833,7 +987,6 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_job_usage_numbers(
         cls,
         job_result_model,
@@ -849,60 +1002,15 @@ class GitProjectModel(Base):
         Order from the highest numbers.
         All if `top` not set, the first `top` projects returned otherwise.
         """
-        project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-        pipeline_attribute = {
-            SRPMBuildModel: PipelineModel.srpm_build_id,
-            CoprBuildGroupModel: PipelineModel.copr_build_group_id,
-            KojiBuildGroupModel: PipelineModel.koji_build_group_id,
-            VMImageBuildTargetModel: PipelineModel.vm_image_build_id,
-            TFTTestRunGroupModel: PipelineModel.test_run_group_id,
-            SyncReleaseModel: PipelineModel.sync_release_run_id,
-        }[job_result_model]
-
-        query = (
-            sa_session()
-            .query(
-                GitProjectModel.project_url,
-                count(job_result_model.id).over(
-                    partition_by=GitProjectModel.project_url
-                ),
-            )
-            .join(
-                project_event_model,
-                GitProjectModel.id == project_event_model.project_id,
-            )
-            .join(
-                ProjectEventModel, ProjectEventModel.event_id == project_event_model.id
-            )
-            .join(
-                PipelineModel,
-                PipelineModel.project_event_id == ProjectEventModel.id,
-            )
-            .join(job_result_model, job_result_model.id == pipeline_attribute)
-            .filter(ProjectEventModel.type == project_event_type)
-            # We have all the dist git projects in because of how we parse the events.
-            .filter(GitProjectModel.instance_url != "src.fedoraproject.org")
-        )
-        if datetime_from:
-            query = query.filter(PipelineModel.datetime >= datetime_from)
-        if datetime_to:
-            query = query.filter(PipelineModel.datetime <= datetime_to)
-        return dict(
-            query.group_by(GitProjectModel.project_url, job_result_model.id)
-            .distinct()
-            .order_by(
-                desc(
-                    count(job_result_model.id).over(
-                        partition_by=GitProjectModel.project_url
-                    )
-                )
-            )
-            .limit(top)
-            .all()
+        return UsageRollupModel.get_usage_numbers(
+            counted=job_result_model.__tablename__,
+            project_event_type=project_event_type,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+            top=top,
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
     def get_job_usage_numbers_all_project_events(
         cls,
         job_result_model,
@@ -913,19 +1021,11 @@ class GitProjectModel(Base):
         """
         For each job, get the per-project number of jobs from the given period.
         """
-        all_usage_numbers: dict[str, int] = Counter()
-        for project_event_type in ProjectEventModelType:
-            all_usage_numbers.update(
-                cls.get_job_usage_numbers(
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to,
-                    top=None,
-                    job_result_model=job_result_model,
-                    project_event_type=project_event_type,
-                )
-            )
-        return dict(
-            sorted(all_usage_numbers.items(), key=lambda x: x[1], reverse=True)[:top]
+        return UsageRollupModel.get_usage_numbers(
+            counted=job_result_model.__tablename__,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+            top=top,
         )
 
     def __repr__(self):
@@ -935,8 +1035,147 @@ class GitProjectModel(Base):
         )
 
 
+def _iter_in_chunks(query, model: Type[Base], group_column=None) -> Iterator:
+    """
+    Iterate over the objects of the query, loaded in chunks ordered by ID,
+    each chunk continuing after the last loaded ID (rather than at an offset),
+    so that the objects can be updated in the meantime.
+
+    If the group column (which must not be NULL) is given, the objects are
+    ordered by it first so that the objects of the same group follow each other.
+    """
+    order_by = [model.id] if group_column is None else [group_column, model.id]
+    last_object = None
+    while True:
+        chunk_query = query
+        if last_object is not None and group_column is None:
+            chunk_query = query.filter(model.id > last_object.id)
+        elif last_object is not None:
+            chunk_query = query.filter(
+                tuple_(group_column, model.id)
+                > tuple_(getattr(last_object, group_column.key), last_object.id)
+            )
+        chunk = chunk_query.order_by(*order_by).limit(ITER_IN_CHUNKS_SIZE).all()
+        yield from chunk
+        if len(chunk) < ITER_IN_CHUNKS_SIZE:
+            return
+        last_object = chunk[-1]
+
+
+def _cursor_conditions(
+    column, before_id: Optional[int] = None, after_id: Optional[int] = None
+) -> list:
+    """Conditions selecting the entries the keyset pagination cursor points to."""
+    if before_id is not None:
+        return [column < before_id]
+    if after_id is not None:
+        return [column > after_id]
+    return []
+
+
+def _paginate(
+    query,
+    order_by,
+    first: int,
+    last: int,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> list:
+    """
+    Get a page of the results of the query ordered descending by `order_by`.
+
+    Without a cursor, the page is given by the `first` and `last` indices.
+    Otherwise, the query has to be already restricted by the cursor
+    (see `_cursor_conditions()`) and the page is made of the entries that
+    follow `before_id` (next page) or precede `after_id` (previous page).
+    That way the database doesn't need to walk through all the entries
+    of the previous pages, as it needs to with an offset.
+    """
+    if before_id is not None:
+        return query.order_by(desc(order_by)).limit(last - first).all()
+    if after_id is not None:
+        return query.order_by(order_by).limit(last - first).all()[::-1]
+    return query.order_by(desc(order_by)).slice(first, last).all()
+
+
+def _page_of_groups(
+    model,
+    group_column,
+    limit: int,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    null_group: bool = False,
+):
+    """
+    Select the page of the groups of rows (with the same `group_column`) that
+    follows `before_id` or precedes `after_id`, each group represented by its row
+    with the lowest ID the cursors refer to.
+
+    The page is selected before merging the groups, so that only the groups
+    on the page are merged and not all of them on the side of the cursor.
+
+    Args:
+        model: Model of the table.
+        group_column: Column the rows are grouped by.
+        limit: Number of the groups on the page.
+        before_id: ID of the group the page follows.
+        after_id: ID of the group the page precedes.
+        null_group: Whether the rows not having the group (`group_column`
+            is `NULL`) make one group together (as with `GROUP BY`),
+            each of them is a group of its own otherwise.
+
+    Returns:
+        Subquery with the IDs of the rows representing the groups and the groups.
+    """
+    other = aliased(model)
+    other_group_column = getattr(other, group_column.key)
+    if null_group:
+        first_of_group = ~exists().where(
+            other_group_column.isnot_distinct_from(group_column),
+            other.id < model.id,
+        )
+    else:
+        first_of_group = or_(
+            group_column.is_(None),
+            ~exists().where(other_group_column == group_column, other.id < model.id),
+        )
+    return (
+        select(model.id, group_column.label("group"))
+        .where(
+            first_of_group,
+            *_cursor_conditions(model.id, before_id, after_id),
+        )
+        .order_by(model.id if after_id is not None else desc(model.id))
+        .limit(limit)
+        .subquery()
+    )
+
+
+def _query_by_project(
+    session: SQLASession,
+    model: Type[Base],
+    namespace: str,
+    repo_name: str,
+    project_url: str,
+):
+    """
+    Query the objects of the model (having `project_id`) belonging
+    to the given project, without looking up the project first.
+    """
+    return (
+        session.query(model)
+        .join(GitProjectModel, model.project_id == GitProjectModel.id)
+        .filter(
+            GitProjectModel.namespace == namespace,
+            GitProjectModel.repo_name == repo_name,
+            GitProjectModel.project_url == project_url,
+        )
+    )
+
+
 class PullRequestModel(BuildsAndTestsConnector, Base):
     __tablename__ = "pull_requests"
+    __table_args__ = (UniqueConstraint("project_id", "pr_id"),)
     id = Column(Integer, primary_key=True)  # our database PK
     # GitHub PR ID
     # this is not our PK b/c:
@@ -954,20 +1193,25 @@ class PullRequestModel(BuildsAndTestsConnector, Base):
     def get_or_create(
         cls, pr_id: int, namespace: str, repo_name: str, project_url: str
     ) -> "PullRequestModel":
+        key = DbIdCache.get_key(cls, project_url, namespace, repo_name, pr_id)
         with sa_session_transaction() as session:
-            project = GitProjectModel.get_or_create(
-                namespace=namespace, repo_name=repo_name, project_url=project_url
-            )
+            pr = DbIdCache.get_object(session, cls, key, pr_id=pr_id)
+            if pr:
+                return pr
+
             pr = (
-                session.query(PullRequestModel)
-                .filter_by(pr_id=pr_id, project_id=project.id)
+                _query_by_project(session, cls, namespace, repo_name, project_url)
+                .filter(cls.pr_id == pr_id)
                 .first()
             )
             if not pr:
-                pr = PullRequestModel()
-                pr.pr_id = pr_id
-                pr.project_id = project.id
-                session.add(pr)
+                project = GitProjectModel.get_or_create(
+                    namespace=namespace, repo_name=repo_name, project_url=project_url
+                )
+                pr = _get_or_create(
+                    session, cls, keys={"project_id": project.id, "pr_id": pr_id}
+                )
+            DbIdCache.set(key, pr.id)
             return pr
 
     @classmethod
@@ -988,12 +1232,122 @@ class PullRequestModel(BuildsAndTestsConnector, Base):
     def get_by_id(cls, id_: int) -> Optional["PullRequestModel"]:
         return sa_session().query(PullRequestModel).filter_by(id=id_).first()
 
+    def _pending_runs_of_other_commits(self, commit_sha: str) -> dict:
+        """
+        Conditions of the SRPM builds, Copr builds and Testing Farm runs
+        of the PR that are still in progress for other commits than the given one.
+        """
+        runs = (
+            select(
+                PipelineModel.srpm_build_id,
+                PipelineModel.copr_build_group_id,
+                PipelineModel.test_run_group_id,
+            )
+            .join(ProjectEventModel)
+            .where(
+                ProjectEventModel.type == ProjectEventModelType.pull_request,
+                ProjectEventModel.event_id == self.id,
+            )
+            .subquery()
+        )
+        return {
+            SRPMBuildModel: and_(
+                SRPMBuildModel.id.in_(select(runs.c.srpm_build_id)),
+                SRPMBuildModel.commit_sha != commit_sha,
+                SRPMBuildModel.status == BuildStatus.pending,
+            ),
+            CoprBuildTargetModel: and_(
+                CoprBuildTargetModel.copr_build_group_id.in_(
+                    select(runs.c.copr_build_group_id)
+                ),
+                CoprBuildTargetModel.commit_sha != commit_sha,
+                CoprBuildTargetModel.status.in_(
+                    [BuildStatus.pending, BuildStatus.waiting_for_srpm]
+                ),
+            ),
+            TFTTestRunTargetModel: and_(
+                TFTTestRunTargetModel.tft_test_run_group_id.in_(
+                    select(runs.c.test_run_group_id)
+                ),
+                TFTTestRunTargetModel.commit_sha != commit_sha,
+                TFTTestRunTargetModel.status.in_(
+                    [
+                        TestingFarmResult.new,
+                        TestingFarmResult.queued,
+                        TestingFarmResult.running,
+                    ]
+                ),
+            ),
+        }
+
+    def has_pending_runs_of_other_commits(self, commit_sha: str) -> bool:
+        """
+        Check whether any SRPM build, Copr build or Testing Farm run of the PR
+        is still in progress for other commits than the given one.
+        """
+        return (
+            sa_session()
+            .query(
+                or_(
+                    *(
+                        exists().where(condition)
+                        for condition in self._pending_runs_of_other_commits(
+                            commit_sha
+                        ).values()
+                    )
+                )
+            )
+            .scalar()
+        )
+
+    def supersede_pending_runs(self, commit_sha: str) -> Tuple[List[str], List[str]]:
+        """
+        Mark the SRPM builds, Copr builds and Testing Farm runs of the PR
+        that are still in progress for other commits than the given one
+        as superseded.
+
+        Args:
+            commit_sha: The current commit of the PR.
+
+        Returns:
+            IDs of the superseded Copr builds and Testing Farm requests.
+        """
+        pending = self._pending_runs_of_other_commits(commit_sha)
+        with sa_session_transaction() as session:
+            session.execute(
+                update(SRPMBuildModel)
+                .where(pending[SRPMBuildModel])
+                .values(status=BuildStatus.superseded)
+                .execution_options(synchronize_session=False)
+            )
+            copr_build_ids = session.execute(
+                update(CoprBuildTargetModel)
+                .where(pending[CoprBuildTargetModel])
+                .values(status=BuildStatus.superseded)
+                .returning(CoprBuildTargetModel.build_id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+            tf_request_ids = session.execute(
+                update(TFTTestRunTargetModel)
+                .where(pending[TFTTestRunTargetModel])
+                .values(status=TestingFarmResult.superseded)
+                .returning(TFTTestRunTargetModel.pipeline_id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+            # all the chroots of a Copr build share its ID, the runs waiting
+            # for a build aren't submitted to Testing Farm yet
+            return (
+                sorted({id_ for id_ in copr_build_ids if id_}),
+                sorted({id_ for id_ in tf_request_ids if id_}),
+            )
+
     def __repr__(self):
         return f"PullRequestModel(pr_id={self.pr_id}, project={self.project})"
 
 
 class IssueModel(BuildsAndTestsConnector, Base):
     __tablename__ = "project_issues"
+    __table_args__ = (UniqueConstraint("project_id", "issue_id"),)
     id = Column(Integer, primary_key=True)  # our database PK
     issue_id = Column(Integer, index=True)
     project_id = Column(Integer, ForeignKey("git_projects.id"), index=True)
@@ -1006,20 +1360,25 @@ class IssueModel(BuildsAndTestsConnector, Base):
     def get_or_create(
         cls, issue_id: int, namespace: str, repo_name: str, project_url: str
     ) -> "IssueModel":
+        key = DbIdCache.get_key(cls, project_url, namespace, repo_name, issue_id)
         with sa_session_transaction() as session:
-            project = GitProjectModel.get_or_create(
-                namespace=namespace, repo_name=repo_name, project_url=project_url
-            )
+            issue = DbIdCache.get_object(session, cls, key, issue_id=issue_id)
+            if issue:
+                return issue
+
             issue = (
-                session.query(IssueModel)
-                .filter_by(issue_id=issue_id, project_id=project.id)
+                _query_by_project(session, cls, namespace, repo_name, project_url)
+                .filter(cls.issue_id == issue_id)
                 .first()
             )
             if not issue:
-                issue = IssueModel()
-                issue.issue_id = issue_id
-                issue.project_id = project.id
-                session.add(issue)
+                project = GitProjectModel.get_or_create(
+                    namespace=namespace, repo_name=repo_name, project_url=project_url
+                )
+                issue = _get_or_create(
+                    session, cls, keys={"project_id": project.id, "issue_id": issue_id}
+                )
+            DbIdCache.set(key, issue.id)
             return issue
 
     @classmethod
@@ -1032,6 +1391,7 @@ class IssueModel(BuildsAndTestsConnector, Base):
 
 class GitBranchModel(BuildsAndTestsConnector, Base):
     __tablename__ = "git_branches"
+    __table_args__ = (UniqueConstraint("project_id", "name"),)
     id = Column(Integer, primary_key=True)  # our database PK
     name = Column(String)
     project_id = Column(Integer, ForeignKey("git_projects.id"), index=True)
@@ -1044,20 +1404,25 @@ class GitBranchModel(BuildsAndTestsConnector, Base):
     def get_or_create(
         cls, branch_name: str, namespace: str, repo_name: str, project_url: str
     ) -> "GitBranchModel":
+        key = DbIdCache.get_key(cls, project_url, namespace, repo_name, branch_name)
         with sa_session_transaction() as session:
-            project = GitProjectModel.get_or_create(
-                namespace=namespace, repo_name=repo_name, project_url=project_url
-            )
+            git_branch = DbIdCache.get_object(session, cls, key, name=branch_name)
+            if git_branch:
+                return git_branch
+
             git_branch = (
-                session.query(GitBranchModel)
-                .filter_by(name=branch_name, project_id=project.id)
+                _query_by_project(session, cls, namespace, repo_name, project_url)
+                .filter(cls.name == branch_name)
                 .first()
             )
             if not git_branch:
-                git_branch = GitBranchModel()
-                git_branch.name = branch_name
-                git_branch.project_id = project.id
-                session.add(git_branch)
+                project = GitProjectModel.get_or_create(
+                    namespace=namespace, repo_name=repo_name, project_url=project_url
+                )
+                git_branch = _get_or_create(
+                    session, cls, keys={"project_id": project.id, "name": branch_name}
+                )
+            DbIdCache.set(key, git_branch.id)
             return git_branch
 
     @classmethod
@@ -1070,6 +1435,7 @@ class GitBranchModel(BuildsAndTestsConnector, Base):
 
 class ProjectReleaseModel(Base):
     __tablename__ = "project_releases"
+    __table_args__ = (UniqueConstraint("project_id", "tag_name"),)
     id = Column(Integer, primary_key=True)  # our database PK
     tag_name = Column(String)
     commit_hash = Column(String)
@@ -1088,21 +1454,28 @@ class ProjectReleaseModel(Base):
         project_url: str,
         commit_hash: Optional[str] = None,
     ) -> "ProjectReleaseModel":
+        key = DbIdCache.get_key(cls, project_url, namespace, repo_name, tag_name)
         with sa_session_transaction() as session:
-            project = GitProjectModel.get_or_create(
-                namespace=namespace, repo_name=repo_name, project_url=project_url
-            )
+            project_release = DbIdCache.get_object(session, cls, key, tag_name=tag_name)
+            if project_release:
+                return project_release
+
             project_release = (
-                session.query(ProjectReleaseModel)
-                .filter_by(tag_name=tag_name, project_id=project.id)
+                _query_by_project(session, cls, namespace, repo_name, project_url)
+                .filter(cls.tag_name == tag_name)
                 .first()
             )
             if not project_release:
-                project_release = ProjectReleaseModel()
-                project_release.tag_name = tag_name
-                project_release.project = project
-                project_release.commit_hash = commit_hash
-                session.add(project_release)
+                project = GitProjectModel.get_or_create(
+                    namespace=namespace, repo_name=repo_name, project_url=project_url
+                )
+                project_release = _get_or_create(
+                    session,
+                    cls,
+                    keys={"project_id": project.id, "tag_name": tag_name},
+                    values={"commit_hash": commit_hash},
+                )
+            DbIdCache.set(key, project_release.id)
             return project_release
 
     @classmethod
@@ -1149,6 +1522,7 @@ class ProjectEventModel(Base):
     """
 
     __tablename__ = "project_events"
+    __table_args__ = (UniqueConstraint("type", "event_id"),)
     id = Column(Integer, primary_key=True)  # our database PK
     type = Column(Enum(ProjectEventModelType))
     event_id = Column(Integer, index=True)
@@ -1159,17 +1533,18 @@ class ProjectEventModel(Base):
     def get_or_create(
         cls, type: ProjectEventModelType, event_id: int
     ) -> "ProjectEventModel":
+        key = DbIdCache.get_key(cls, type.value, event_id)
         with sa_session_transaction() as session:
-            project_event = (
-                session.query(ProjectEventModel)
-                .filter_by(type=type, event_id=event_id)
-                .first()
+            project_event = DbIdCache.get_object(
+                session, cls, key, type=type, event_id=event_id
+            )
+            if project_event:
+                return project_event
+
+            project_event = _get_or_create(
+                session, cls, keys={"type": type, "event_id": event_id}
             )
-            if not project_event:
-                project_event = ProjectEventModel()
-                project_event.type = type
-                project_event.event_id = event_id
-                session.add(project_event)
+            DbIdCache.set(key, project_event.id)
             return project_event
 
     @classmethod
@@ -1188,6 +1563,41 @@ class ProjectEventModel(Base):
         return f"ProjectEventModel(type={self.type}, event_id={self.event_id})"
 
 
+class MergedRunsData(NamedTuple):
+    """
+    Models referenced by merged runs (see `PipelineModel.get_merged_runs_data`).
+
+    Attributes:
+        srpm_builds: SRPM builds by their IDs.
+        copr_build_groups: Copr build groups (with targets) by their IDs.
+        koji_build_groups: Koji build groups (with targets) by their IDs.
+        test_run_groups: Testing Farm run groups (with targets) by their IDs.
+        sync_release_runs: Sync release runs (with targets) by their IDs.
+        project_event_objects: Project event objects (with projects)
+            by the IDs of the ProjectEventModels.
+    """
+
+    srpm_builds: Dict[int, "SRPMBuildModel"]
+    copr_build_groups: Dict[int, "CoprBuildGroupModel"]
+    koji_build_groups: Dict[int, "KojiBuildGroupModel"]
+    test_run_groups: Dict[int, "TFTTestRunGroupModel"]
+    sync_release_runs: Dict[int, "SyncReleaseModel"]
+    project_event_objects: Dict[int, Optional[AbstractProjectEventDbType]]
+
+
+def _get_by_ids(model, ids: Set[int], *options) -> Dict[int, Base]:
+    """Get the models with the given IDs in a single query."""
+    if not ids:
+        return {}
+    return {
+        item.id: item
+        for item in sa_session()
+        .query(model)
+        .options(*options)
+        .filter(model.id.in_(ids))
+    }
+
+
 class PipelineModel(Base):
     """
     Represents one pipeline.
@@ -1207,7 +1617,7 @@ class PipelineModel(Base):
     id = Column(Integer, primary_key=True)  # our database PK
     # datetime.utcnow instead of datetime.utcnow() because it's an argument to the function,
     # so it will run when the model is initiated, not when the table is made
-    datetime = Column(DateTime, default=datetime.utcnow)
+    datetime = Column(DateTime, default=datetime.utcnow, index=True)
 
     project_event_id = Column(Integer, ForeignKey("project_events.id"))
     project_event = relationship("ProjectEventModel", back_populates="runs")
@@ -1259,6 +1669,7 @@ class PipelineModel(Base):
         return sa_session().query(
             func.min(PipelineModel.id).label("merged_id"),
             PipelineModel.srpm_build_id,
+            func.min(PipelineModel.project_event_id).label("project_event_id"),
             func.array_agg(psql_array([PipelineModel.copr_build_group_id])).label(
                 "copr_build_group_id"
             ),
@@ -1274,19 +1685,46 @@ class PipelineModel(Base):
         )
 
     @classmethod
-    def get_merged_chroots(cls, first: int, last: int) -> Iterable["PipelineModel"]:
-        return (
-            cls.__query_merged_runs()
-            .group_by(
+    def get_merged_chroots(
+        cls,
+        first: int,
+        last: int,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List["PipelineModel"]:
+        """
+        Return a page of the merged runs ordered from the newest.
+        The cursors refer to the `merged_id` of the runs.
+        """
+        query = cls.__query_merged_runs()
+        if before_id is not None or after_id is not None:
+            # Only the groups (all the pipelines of an SRPM build or a pipeline
+            # without an SRPM build) on the page are merged.
+            page = _page_of_groups(
+                PipelineModel,
                 PipelineModel.srpm_build_id,
-                case(
-                    [(PipelineModel.srpm_build_id.isnot(null()), 0)],
-                    else_=PipelineModel.id,
-                ),
+                last - first,
+                before_id,
+                after_id,
             )
-            .order_by(desc("merged_id"))
-            .slice(first, last)
+            query = query.filter(
+                or_(
+                    PipelineModel.srpm_build_id.in_(
+                        select(page.c.group).where(page.c.group.isnot(None))
+                    ),
+                    PipelineModel.id.in_(
+                        select(page.c.id).where(page.c.group.is_(None))
+                    ),
+                )
+            )
+        query = query.group_by(
+            PipelineModel.srpm_build_id,
+            case(
+                [(PipelineModel.srpm_build_id.isnot(null()), 0)],
+                else_=PipelineModel.id,
+            ),
         )
+        return _paginate(query, "merged_id", first, last, before_id, after_id)
 
     @classmethod
     def get_merged_run(cls, first_id: int) -> Optional[Iterable["PipelineModel"]]:
@@ -1303,6 +1741,78 @@ class PipelineModel(Base):
             .first()
         )
 
+    @classmethod
+    def get_merged_runs_data(cls, merged_runs: List) -> MergedRunsData:
+        """
+        Get all the models the given merged runs refer to. The number of queries
+        does not depend on the number of the merged runs.
+
+        Args:
+            merged_runs: Merged runs as returned by `get_merged_chroots`
+                or `get_merged_run`.
+
+        Returns:
+            Referenced models by their IDs.
+        """
+
+        def ids(column: str) -> Set[int]:
+            return {
+                id_
+                for merged_run in merged_runs
+                for (id_,) in getattr(merged_run, column)
+                if id_ is not None
+            }
+
+        project_events = _get_by_ids(
+            ProjectEventModel,
+            {merged_run.project_event_id for merged_run in merged_runs} - {None},
+        )
+        event_ids_by_type: Dict[ProjectEventModelType, Set[int]] = {}
+        for project_event in project_events.values():
+            event_ids_by_type.setdefault(project_event.type, set()).add(
+                project_event.event_id
+            )
+        project_event_objects = {}
+        for type_, event_ids in event_ids_by_type.items():
+            model = MODEL_FOR_PROJECT_EVENT[type_]
+            for event_id, project_event_object in _get_by_ids(
+                model, event_ids, joinedload(model.project)
+            ).items():
+                project_event_objects[type_, event_id] = project_event_object
+
+        return MergedRunsData(
+            srpm_builds=_get_by_ids(
+                SRPMBuildModel,
+                {merged_run.srpm_build_id for merged_run in merged_runs} - {None},
+            ),
+            copr_build_groups=_get_by_ids(
+                CoprBuildGroupModel,
+                ids("copr_build_group_id"),
+                selectinload(CoprBuildGroupModel.copr_build_targets),
+            ),
+            koji_build_groups=_get_by_ids(
+                KojiBuildGroupModel,
+                ids("koji_build_group_id"),
+                selectinload(KojiBuildGroupModel.koji_build_targets),
+            ),
+            test_run_groups=_get_by_ids(
+                TFTTestRunGroupModel,
+                ids("test_run_group_id"),
+                selectinload(TFTTestRunGroupModel.tft_test_run_targets),
+            ),
+            sync_release_runs=_get_by_ids(
+                SyncReleaseModel,
+                ids("sync_release_run_id"),
+                selectinload(SyncReleaseModel.sync_release_targets),
+            ),
+            project_event_objects={
+                project_event.id: project_event_objects.get(
+                    (project_event.type, project_event.event_id)
+                )
+                for project_event in project_events.values()
+            },
+        )
+
     @classmethod
     def get_run(cls, id_: int) -> Optional["PipelineModel"]:
         return sa_session().query(PipelineModel).filter_by(id=id_).first()
@@ -1361,6 +1871,7 @@ class BuildStatus(str, enum.Enum):
     error = "error"
     waiting_for_srpm = "waiting_for_srpm"
     retry = "retry"
+    superseded = "superseded"
 
 
 class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
@@ -1369,6 +1880,13 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
     """
 
     __tablename__ = "copr_build_targets"
+    __table_args__ = (
+        Index(
+            "ix_copr_build_targets_pending",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
     id = Column(Integer, primary_key=True)
     build_id = Column(String, index=True)  # copr build id
 
@@ -1474,13 +1992,19 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
 
     @classmethod
     def get_merged_chroots(
-        cls, first: int, last: int
-    ) -> Iterable["CoprBuildTargetModel"]:
+        cls,
+        first: int,
+        last: int,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List["CoprBuildTargetModel"]:
         """Returns a list of unique build ids with merged status, chroots
         Details:
         https://github.com/packit/packit-service/pull/674#discussion_r439819852
+
+        The cursors refer to the `new_id` of the merged builds.
         """
-        return (
+        query = (
             sa_session()
             .query(
                 # We need something to order our merged builds by,
@@ -1500,9 +2024,29 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
                 ),
             )
             .group_by(CoprBuildTargetModel.build_id)  # Group by identical element(s)
-            .order_by(desc("new_id"))
-            .slice(first, last)
         )
+        if before_id is not None or after_id is not None:
+            # Only the builds on the page are merged.
+            # The builds without a build ID are merged into one, as without
+            # a cursor.
+            page = _page_of_groups(
+                CoprBuildTargetModel,
+                CoprBuildTargetModel.build_id,
+                last - first,
+                before_id,
+                after_id,
+                null_group=True,
+            )
+            query = query.filter(
+                or_(
+                    CoprBuildTargetModel.build_id.in_(select(page.c.group)),
+                    and_(
+                        CoprBuildTargetModel.build_id.is_(None),
+                        select(page.c.id).where(page.c.group.is_(None)).exists(),
+                    ),
+                )
+            )
+        return _paginate(query, "new_id", first, last, before_id, after_id)
 
     # Returns all builds with that build_id, irrespective of target
     @classmethod
@@ -1516,8 +2060,18 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
 
     @classmethod
     def get_all_by_status(cls, status: BuildStatus) -> Iterable["CoprBuildTargetModel"]:
-        """Returns all builds which currently have the given status."""
-        return sa_session().query(CoprBuildTargetModel).filter_by(status=status)
+        """
+        Returns all builds which currently have the given status, in chunks,
+        the builds (chroots) of the same Copr build following each other.
+        """
+        return _iter_in_chunks(
+            sa_session()
+            .query(CoprBuildTargetModel)
+            .filter_by(status=status)
+            .filter(CoprBuildTargetModel.build_id.isnot(None)),
+            cls,
+            group_column=cls.build_id,
+        )
 
     # returns the build matching the build_id and the target
     @classmethod
@@ -1576,22 +2130,54 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         copr_build_group: "CoprBuildGroupModel",
         task_accepted_time: Optional[datetime] = None,
     ) -> "CoprBuildTargetModel":
+        return cls.bulk_create(
+            targets=[target],
+            build_id=build_id,
+            commit_sha=commit_sha,
+            project_name=project_name,
+            owner=owner,
+            web_url=web_url,
+            status=status,
+            copr_build_group=copr_build_group,
+            task_accepted_time=task_accepted_time,
+        )[0]
+
+    @classmethod
+    def bulk_create(
+        cls,
+        targets: Iterable[str],
+        build_id: Optional[str],
+        commit_sha: str,
+        project_name: str,
+        owner: str,
+        web_url: Optional[str],
+        status: BuildStatus,
+        copr_build_group: "CoprBuildGroupModel",
+        task_accepted_time: Optional[datetime] = None,
+    ) -> List["CoprBuildTargetModel"]:
+        """
+        Create the builds for all the targets of the group in one transaction,
+        the rows are inserted in a single batch.
+        """
         with sa_session_transaction() as session:
-            build = cls()
-            build.build_id = build_id
-            build.status = status
-            build.project_name = project_name
-            build.owner = owner
-            build.commit_sha = commit_sha
-            build.web_url = web_url
-            build.target = target
-            build.task_accepted_time = task_accepted_time
-            session.add(build)
-
-            copr_build_group.copr_build_targets.append(build)
+            builds = []
+            for target in targets:
+                build = cls()
+                build.build_id = build_id
+                build.status = status
+                build.project_name = project_name
+                build.owner = owner
+                build.commit_sha = commit_sha
+                build.web_url = web_url
+                build.target = target
+                build.task_accepted_time = task_accepted_time
+                builds.append(build)
+            session.add_all(builds)
+
+            copr_build_group.copr_build_targets.extend(builds)
             session.add(copr_build_group)
 
-            return build
+            return builds
 
     @classmethod
     def get(
@@ -1743,12 +2329,20 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
         return sa_session().query(KojiBuildTargetModel)
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["KojiBuildTargetModel"]:
-        return (
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List["KojiBuildTargetModel"]:
+        query = (
             sa_session()
             .query(KojiBuildTargetModel)
-            .order_by(desc(KojiBuildTargetModel.id))
-            .slice(first, last)
+            .filter(*_cursor_conditions(KojiBuildTargetModel.id, before_id, after_id))
+        )
+        return _paginate(
+            query, KojiBuildTargetModel.id, first, last, before_id, after_id
         )
 
     @classmethod
@@ -1792,20 +2386,48 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
         scratch: bool,
         koji_build_group: "KojiBuildGroupModel",
     ) -> "KojiBuildTargetModel":
+        return cls.bulk_create(
+            targets=[target],
+            build_id=build_id,
+            commit_sha=commit_sha,
+            web_url=web_url,
+            status=status,
+            scratch=scratch,
+            koji_build_group=koji_build_group,
+        )[0]
+
+    @classmethod
+    def bulk_create(
+        cls,
+        targets: Iterable[str],
+        build_id: Optional[str],
+        commit_sha: str,
+        web_url: Optional[str],
+        status: str,
+        scratch: bool,
+        koji_build_group: "KojiBuildGroupModel",
+    ) -> List["KojiBuildTargetModel"]:
+        """
+        Create the builds for all the targets of the group in one transaction,
+        the rows are inserted in a single batch.
+        """
         with sa_session_transaction() as session:
-            build = cls()
-            build.build_id = build_id
-            build.status = status
-            build.commit_sha = commit_sha
-            build.web_url = web_url
-            build.target = target
-            build.scratch = scratch
-            session.add(build)
-
-            koji_build_group.koji_build_targets.append(build)
+            builds = []
+            for target in targets:
+                build = cls()
+                build.build_id = build_id
+                build.status = status
+                build.commit_sha = commit_sha
+                build.web_url = web_url
+                build.target = target
+                build.scratch = scratch
+                builds.append(build)
+            session.add_all(builds)
+
+            koji_build_group.koji_build_targets.extend(builds)
             session.add(koji_build_group)
 
-            return build
+            return builds
 
     @classmethod
     def get(
@@ -1822,12 +2444,111 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
         )
 
 
-class SRPMBuildModel(ProjectAndTriggersConnector, Base):
+class StoredLogsMixin:
+    """
+    Logs of the model kept in the log store, if configured, or in the database.
+    """
+
+    id: int
+    logs: Optional[str]
+    logs_reference: Optional[str]
+
+    def set_logs(self, logs: Optional[str]) -> None:
+        log_store = get_log_store()
+        old_reference = self.logs_reference
+        reference = None
+        if logs is not None and log_store:
+            try:
+                reference = log_store.put(logs)
+            except Exception as ex:
+                logger.warning(
+                    f"Failed to store the logs of {self!r}, "
+                    f"keeping them in the database: {ex!r}"
+                )
+
+        unreferenced = set()
+        with sa_session_transaction() as session:
+            self.logs = null() if logs is None or reference else logs
+            self.logs_reference = reference or null()
+            session.add(self)
+            if old_reference and old_reference != reference and log_store:
+                session.flush()
+                # the same logs of other models are stored in the same object
+                unreferenced = get_unreferenced_logs(session, [old_reference])
+
+        for unreferenced_reference in unreferenced:
+            try:
+                # the same logs may have just been stored for another model
+                log_store.delete(
+                    unreferenced_reference, grace_period=LOG_STORE_DELETE_GRACE_PERIOD
+                )
+            except Exception as ex:
+                logger.warning(
+                    f"Failed to delete the logs {unreferenced_reference}: {ex!r}"
+                )
+
+    def iter_logs(self) -> Iterator[str]:
+        """
+        Get the logs, streamed (decompressed) from the log store chunk by chunk.
+        """
+        if not self.logs_reference:
+            if self.logs:
+                yield self.logs
+            return
+
+        if not (log_store := get_log_store()):
+            logger.warning(
+                f"Logs {self.logs_reference} of {self!r} can't be read, "
+                "log store is not configured."
+            )
+            return
+
+        try:
+            yield from log_store.stream(self.logs_reference)
+        except Exception as ex:
+            logger.warning(
+                f"Failed to read the logs {self.logs_reference} of {self!r}: {ex!r}"
+            )
+
+    def get_logs(self) -> Optional[str]:
+        if not (self.logs or self.logs_reference):
+            return None
+        return "".join(self.iter_logs()) or None
+
+
+def get_unreferenced_logs(session: SQLASession, references: Iterable[str]) -> Set[str]:
+    """
+    Get the references to the logs in the log store not used by any model anymore,
+    the objects are shared by all the models with the same logs.
+
+    Args:
+        session: Session to query the models within.
+        references: References to the logs.
+
+    Returns:
+        References not used by any model.
+    """
+    references = set(references)
+    if not references:
+        return references
+
+    used = union_all(
+        *(
+            select(model.logs_reference).where(model.logs_reference.in_(references))
+            for model in (SRPMBuildModel, SyncReleaseTargetModel)
+        )
+    )
+    return references - set(session.execute(used).scalars())
+
+
+class SRPMBuildModel(ProjectAndTriggersConnector, StoredLogsMixin, Base):
     __tablename__ = "srpm_builds"
     id = Column(Integer, primary_key=True)
     status = Column(Enum(BuildStatus))
-    # our logs we want to show to the user
+    # our logs we want to show to the user,
+    # kept in the log store (and referenced) if it's configured
     logs = Column(Text)
+    logs_reference = Column(String)
     build_submitted_time = Column(DateTime, default=datetime.utcnow)
     build_start_time = Column(DateTime)
     build_finished_time = Column(DateTime)
@@ -1898,13 +2619,19 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
         return sa_session().query(SRPMBuildModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["SRPMBuildModel"]:
-        return (
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List["SRPMBuildModel"]:
+        query = (
             sa_session()
             .query(SRPMBuildModel)
-            .order_by(desc(SRPMBuildModel.id))
-            .slice(first, last)
+            .filter(*_cursor_conditions(SRPMBuildModel.id, before_id, after_id))
         )
+        return _paginate(query, SRPMBuildModel.id, first, last, before_id, after_id)
 
     @classmethod
     def get_by_copr_build_id(
@@ -1928,7 +2655,10 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
             .query(SRPMBuildModel)
             .filter(
                 SRPMBuildModel.build_submitted_time < delta_ago,
-                SRPMBuildModel.logs.isnot(None),
+                or_(
+                    SRPMBuildModel.logs.isnot(None),
+                    SRPMBuildModel.logs_reference.isnot(None),
+                ),
             )
         )
 
@@ -1937,11 +2667,6 @@ class SRPMBuildModel(ProjectAndTriggersConnector, Base):
             self.url = null() if url is None else url
             session.add(self)
 
-    def set_logs(self, logs: Optional[str]) -> None:
-        with sa_session_transaction() as session:
-            self.logs = null() if logs is None else logs
-            session.add(self)
-
     def set_copr_build_id(self, copr_build_id: str) -> None:
         with sa_session_transaction() as session:
             self.copr_build_id = copr_build_id
@@ -2021,7 +2746,9 @@ class AllowlistModel(Base):
                 namespace_entry.fas_account = fas_account
 
             session.add(namespace_entry)
-            return namespace_entry
+
+        cls.increase_version()
+        return namespace_entry
 
     @classmethod
     def get_namespace(cls, namespace: str) -> Optional["AllowlistModel"]:
@@ -2059,10 +2786,40 @@ class AllowlistModel(Base):
             if namespace_entry.one_or_none():
                 namespace_entry.delete()
 
+        cls.increase_version()
+
     @classmethod
     def get_all(cls) -> Iterable["AllowlistModel"]:
         return sa_session().query(AllowlistModel)
 
+    @classmethod
+    def get_version(cls) -> Optional[int]:
+        """
+        Get the version of the allowlist, it's increased with every change
+        of the allowlist.
+
+        Returns:
+            Version of the allowlist or `None` if it can't be obtained.
+        """
+        try:
+            version = get_redis().get(ALLOWLIST_VERSION_KEY)
+        except RedisError as ex:
+            logger.warning(f"Failed to get the version of the allowlist: {ex!r}")
+            return None
+
+        return int(version or 0)
+
+    @classmethod
+    def increase_version(cls):
+        """
+        Increase the version of the allowlist so that the in-memory indexes
+        of the allowlist get reloaded.
+        """
+        try:
+            get_redis().incr(ALLOWLIST_VERSION_KEY)
+        except RedisError as ex:
+            logger.warning(f"Failed to increase the version of the allowlist: {ex!r}")
+
     def to_dict(self) -> Dict[str, str]:
         return {
             "namespace": self.namespace,
@@ -2102,6 +2859,7 @@ class TestingFarmResult(str, enum.Enum):
     needs_inspection = "needs_inspection"
     retry = "retry"
     complete = "complete"
+    superseded = "superseded"
 
 
 class TFTTestRunGroupModel(ProjectAndTriggersConnector, GroupModel, Base):
@@ -2153,6 +2911,13 @@ class TFTTestRunGroupModel(ProjectAndTriggersConnector, GroupModel, Base):
 
 class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
     __tablename__ = "tft_test_run_targets"
+    __table_args__ = (
+        Index(
+            "ix_tft_test_run_targets_not_completed",
+            "id",
+            postgresql_where=text("status IN ('new', 'queued', 'running')"),
+        ),
+    )
     id = Column(Integer, primary_key=True)
     pipeline_id = Column(String, index=True)
     identifier = Column(String)
@@ -2213,22 +2978,56 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
         identifier: Optional[str] = None,
         copr_build_targets: Optional[List[CoprBuildTargetModel]] = None,
     ) -> "TFTTestRunTargetModel":
+        return cls.bulk_create(
+            targets={target: copr_build_targets},
+            pipeline_id=pipeline_id,
+            commit_sha=commit_sha,
+            status=status,
+            test_run_group=test_run_group,
+            web_url=web_url,
+            data=data,
+            identifier=identifier,
+        )[0]
+
+    @classmethod
+    def bulk_create(
+        cls,
+        targets: Dict[str, Optional[List[CoprBuildTargetModel]]],
+        pipeline_id: Optional[str],
+        commit_sha: str,
+        status: TestingFarmResult,
+        test_run_group: "TFTTestRunGroupModel",
+        web_url: Optional[str] = None,
+        data: dict = None,
+        identifier: Optional[str] = None,
+    ) -> List["TFTTestRunTargetModel"]:
+        """
+        Create the test runs for all the targets of the group in one transaction,
+        the rows are inserted in a single batch.
+
+        Args:
+            targets: Dict mapping the targets to the Copr builds to be tested.
+        """
         with sa_session_transaction() as session:
-            test_run = cls()
-            test_run.pipeline_id = pipeline_id
-            test_run.identifier = identifier
-            test_run.commit_sha = commit_sha
-            test_run.status = status
-            test_run.target = target
-            test_run.web_url = web_url
-            test_run.data = data
-            if copr_build_targets:
-                test_run.copr_builds.extend(copr_build_targets)
-            session.add(test_run)
-            test_run_group.tft_test_run_targets.append(test_run)
+            test_runs = []
+            for target, copr_build_targets in targets.items():
+                test_run = cls()
+                test_run.pipeline_id = pipeline_id
+                test_run.identifier = identifier
+                test_run.commit_sha = commit_sha
+                test_run.status = status
+                test_run.target = target
+                test_run.web_url = web_url
+                test_run.data = data
+                if copr_build_targets:
+                    test_run.copr_builds.extend(copr_build_targets)
+                test_runs.append(test_run)
+            session.add_all(test_runs)
+
+            test_run_group.tft_test_run_targets.extend(test_runs)
             session.add(test_run_group)
 
-            return test_run
+            return test_runs
 
     @classmethod
     def get_by_pipeline_id(cls, pipeline_id: str) -> Optional["TFTTestRunTargetModel"]:
@@ -2244,11 +3043,12 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
         cls, *status: TestingFarmResult
     ) -> Iterable["TFTTestRunTargetModel"]:
         """Returns all runs which currently have their status set to one
-        of the requested statuses."""
-        return (
+        of the requested statuses, in chunks."""
+        return _iter_in_chunks(
             sa_session()
             .query(TFTTestRunTargetModel)
-            .filter(TFTTestRunTargetModel.status.in_(status))
+            .filter(TFTTestRunTargetModel.status.in_(status)),
+            cls,
         )
 
     @classmethod
@@ -2270,12 +3070,20 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
         return sa_session().query(TFTTestRunTargetModel).filter_by(**non_none_args)
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["TFTTestRunTargetModel"]:
-        return (
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List["TFTTestRunTargetModel"]:
+        query = (
             sa_session()
             .query(TFTTestRunTargetModel)
-            .order_by(desc(TFTTestRunTargetModel.id))
-            .slice(first, last)
+            .filter(*_cursor_conditions(TFTTestRunTargetModel.id, before_id, after_id))
+        )
+        return _paginate(
+            query, TFTTestRunTargetModel.id, first, last, before_id, after_id
         )
 
     def __repr__(self):
@@ -2290,7 +3098,7 @@ class SyncReleaseTargetStatus(str, enum.Enum):
     submitted = "submitted"
 
 
-class SyncReleaseTargetModel(ProjectAndTriggersConnector, Base):
+class SyncReleaseTargetModel(ProjectAndTriggersConnector, StoredLogsMixin, Base):
     __tablename__ = "sync_release_run_targets"
     id = Column(Integer, primary_key=True)
     branch = Column(String, default="unknown")
@@ -2300,6 +3108,7 @@ class SyncReleaseTargetModel(ProjectAndTriggersConnector, Base):
     start_time = Column(DateTime)
     finished_time = Column(DateTime)
     logs = Column(Text)
+    logs_reference = Column(String)
     sync_release_id = Column(Integer, ForeignKey("sync_release_runs.id"), index=True)
 
     sync_release = relationship(
@@ -2340,11 +3149,6 @@ class SyncReleaseTargetModel(ProjectAndTriggersConnector, Base):
             self.finished_time = finished_time
             session.add(self)
 
-    def set_logs(self, logs: str) -> None:
-        with sa_session_transaction() as session:
-            self.logs = logs
-            session.add(self)
-
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["SyncReleaseTargetModel"]:
         return sa_session().query(SyncReleaseTargetModel).filter_by(id=id_).first()
@@ -2441,14 +3245,16 @@ class SyncReleaseModel(ProjectAndTriggersConnector, Base):
         first: int,
         last: int,
         job_type: SyncReleaseJobType = SyncReleaseJobType.propose_downstream,
-    ) -> Iterable["SyncReleaseModel"]:
-        return (
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List["SyncReleaseModel"]:
+        query = (
             sa_session()
             .query(SyncReleaseModel)
-            .order_by(desc(SyncReleaseModel.id))
             .filter_by(job_type=job_type)
-            .slice(first, last)
+            .filter(*_cursor_conditions(SyncReleaseModel.id, before_id, after_id))
         )
+        return _paginate(query, SyncReleaseModel.id, first, last, before_id, after_id)
 
 
 AbstractBuildTestDbType = Union[
@@ -2692,6 +3498,13 @@ class VMImageBuildTargetModel(ProjectAndTriggersConnector, Base):
     """
 
     __tablename__ = "vm_image_build_targets"
+    __table_args__ = (
+        Index(
+            "ix_vm_image_build_targets_pending",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
     id = Column(Integer, primary_key=True)
     build_id = Column(String, index=True)  # vm image build id
 
@@ -2767,8 +3580,10 @@ class VMImageBuildTargetModel(ProjectAndTriggersConnector, Base):
     def get_all_by_status(
         cls, status: VMImageBuildStatus
     ) -> Iterable["VMImageBuildTargetModel"]:
-        """Returns all builds which currently have the given status."""
-        return sa_session().query(VMImageBuildTargetModel).filter_by(status=status)
+        """Returns all builds which currently have the given status, in chunks."""
+        return _iter_in_chunks(
+            sa_session().query(VMImageBuildTargetModel).filter_by(status=status), cls
+        )
 
     @classmethod
     def get_by_build_id(
@@ -2869,3 +3684,243 @@ class VMImageBuildTargetModel(ProjectAndTriggersConnector, Base):
             f"VMImageBuildTargetModel(id={self.id}, "
             f"build_submitted_time={self.build_submitted_time})"
         )
+
+
+class UsageRollupModel(Base):
+    """
+    Daily usage numbers precomputed from the pipelines,
+    refreshed periodically by `refresh()`.
+
+    Each row is the number of objects of one kind (pipelines, project events or jobs
+    like SRPM builds or Copr build groups) for one project and project event type
+    that had at least one pipeline on the given day and were active the last time
+    before on the previous day (`None` if never). An object active in a period
+    is counted just once there, by the row of its first day in the period,
+    so the numbers for any period are obtained by summing the rows of its days
+    with no previous day in the period.
+    """
+
+    __tablename__ = "usage_rollups"
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)
+    previous_day = Column(Date)
+    project_id = Column(Integer, ForeignKey("git_projects.id"), nullable=False)
+    project_event_type = Column(Enum(ProjectEventModelType), nullable=False)
+    # table name of the counted objects
+    counted = Column(String, nullable=False)
+    count = Column(Integer, nullable=False)
+
+    __table_args__ = (Index("ix_usage_rollups_counted_day", counted, day),)
+
+    # table name of the counted objects -> their reference in the pipelines table
+    COUNTED_PIPELINE_ATTRIBUTES: Dict[str, str] = {
+        PipelineModel.__tablename__: "id",
+        ProjectEventModel.__tablename__: "project_event_id",
+        SRPMBuildModel.__tablename__: "srpm_build_id",
+        CoprBuildGroupModel.__tablename__: "copr_build_group_id",
+        KojiBuildGroupModel.__tablename__: "koji_build_group_id",
+        VMImageBuildTargetModel.__tablename__: "vm_image_build_id",
+        TFTTestRunGroupModel.__tablename__: "test_run_group_id",
+        SyncReleaseModel.__tablename__: "sync_release_run_id",
+    }
+
+    @classmethod
+    def refresh(cls, since: Optional[date] = None) -> None:
+        """
+        Recompute the daily rows starting with the given day.
+
+        Args:
+            since: First day to recompute. Defaults to the last day already
+                computed (it could have been incomplete), everything is
+                recomputed if there are no rows yet.
+        """
+        with sa_session_transaction() as session:
+            if since is None:
+                since = session.query(func.max(cls.day)).scalar()
+            logger.info(f"Refreshing the usage rollups since {since}.")
+
+            query = session.query(cls)
+            if since:
+                query = query.filter(cls.day >= since)
+            query.delete(synchronize_session=False)
+
+            project_events = cls._project_events()
+            for counted, attribute in cls.COUNTED_PIPELINE_ATTRIBUTES.items():
+                counted_id = getattr(PipelineModel, attribute)
+                active_days = (
+                    select(
+                        cast(PipelineModel.datetime, Date).label("day"),
+                        counted_id.label("counted_id"),
+                        project_events.c.project_id,
+                        project_events.c.project_event_type,
+                    )
+                    .join(
+                        project_events,
+                        project_events.c.project_event_id
+                        == PipelineModel.project_event_id,
+                    )
+                    .where(counted_id.isnot(None))
+                    .distinct()
+                )
+                if since:
+                    since_datetime = datetime.combine(since, time.min)
+                    # the previous days of the recent objects are needed as well
+                    recent_pipeline = aliased(PipelineModel)
+                    active_days = active_days.where(
+                        counted_id.in_(
+                            select(getattr(recent_pipeline, attribute)).where(
+                                recent_pipeline.datetime >= since_datetime
+                            )
+                        )
+                    )
+                active_days = active_days.subquery()
+
+                previous_day = (
+                    func.lag(active_days.c.day)
+                    .over(
+                        partition_by=(
+                            active_days.c.counted_id,
+                            active_days.c.project_id,
+                            active_days.c.project_event_type,
+                        ),
+                        order_by=active_days.c.day,
+                    )
+                    .label("previous_day")
+                )
+                days = select(
+                    active_days.c.day,
+                    previous_day,
+                    active_days.c.project_id,
+                    active_days.c.project_event_type,
+                ).subquery()
+
+                rollup = select(
+                    days.c.day,
+                    days.c.previous_day,
+                    days.c.project_id,
+                    days.c.project_event_type,
+                    literal(counted, String),
+                    func.count(),
+                ).group_by(
+                    days.c.day,
+                    days.c.previous_day,
+                    days.c.project_id,
+                    days.c.project_event_type,
+                )
+                if since:
+                    rollup = rollup.where(days.c.day >= since)
+                session.execute(
+                    insert(cls).from_select(
+                        [
+                            "day",
+                            "previous_day",
+                            "project_id",
+                            "project_event_type",
+                            "counted",
+                            "count",
+                        ],
+                        rollup,
+                    )
+                )
+
+    @staticmethod
+    def _project_events():
+        """Project events with the projects and types of their objects."""
+        return union_all(
+            *(
+                select(
+                    ProjectEventModel.id.label("project_event_id"),
+                    ProjectEventModel.type.label("project_event_type"),
+                    project_event_model.project_id.label("project_id"),
+                )
+                .join(
+                    project_event_model,
+                    ProjectEventModel.event_id == project_event_model.id,
+                )
+                .where(ProjectEventModel.type == project_event_type)
+                for project_event_type, project_event_model in (
+                    MODEL_FOR_PROJECT_EVENT.items()
+                )
+            )
+        ).subquery()
+
+    @classmethod
+    def get_usage_numbers(
+        cls,
+        counted: str,
+        project_event_type: Optional[ProjectEventModelType] = None,
+        datetime_from=None,
+        datetime_to=None,
+        top: Optional[int] = None,
+    ) -> dict[str, int]:
+        """
+        For each project, get the number of the counted objects with at least
+        one pipeline from the given period (whole days are taken).
+
+        Order from the highest numbers.
+        All if `top` not set, the first `top` projects returned otherwise.
+        """
+        total = func.sum(cls.count)
+        query = (
+            cls._filter(
+                sa_session().query(GitProjectModel.project_url, total),
+                counted=counted,
+                datetime_from=datetime_from,
+                datetime_to=datetime_to,
+            )
+            # We have all the dist git projects in because of how we parse the events.
+            .filter(GitProjectModel.instance_url != "src.fedoraproject.org")
+            .group_by(GitProjectModel.project_url)
+            .order_by(desc(total))
+        )
+        if project_event_type:
+            query = query.filter(cls.project_event_type == project_event_type)
+        if top is not None:
+            query = query.limit(top)
+        return {project_url: int(number) for project_url, number in query}
+
+    @classmethod
+    def get_instance_numbers(
+        cls, datetime_from=None, datetime_to=None
+    ) -> dict[str, int]:
+        """
+        Get the number of projects with at least one pipeline
+        during the given period per each GIT instance.
+        """
+        return dict(
+            cls._filter(
+                sa_session().query(
+                    GitProjectModel.instance_url,
+                    func.count(distinct(GitProjectModel.id)),
+                ),
+                counted=PipelineModel.__tablename__,
+                datetime_from=datetime_from,
+                datetime_to=datetime_to,
+            )
+            .group_by(GitProjectModel.instance_url)
+            .all()
+        )
+
+    @classmethod
+    def _filter(cls, query, counted: str, datetime_from=None, datetime_to=None):
+        query = query.join(cls, cls.project_id == GitProjectModel.id).filter(
+            cls.counted == counted
+        )
+        if datetime_from:
+            day_from = _to_date(datetime_from)
+            # only the first day of each object in the period is counted
+            query = query.filter(
+                cls.day >= day_from,
+                or_(cls.previous_day.is_(None), cls.previous_day < day_from),
+            )
+        else:
+            query = query.filter(cls.previous_day.is_(None))
+        if datetime_to:
+            query = query.filter(cls.day <= _to_date(datetime_to))
+        return query
+
+
+def _to_date(value: Union[str, date, datetime]) -> date:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.date() if isinstance(value, datetime) else value
@@ -3,11 +3,12 @@
 
 import typing
 
-from marshmallow import Schema, ValidationError, fields, post_load
+from marshmallow import Schema, ValidationError, fields, post_load, validate
 
 from packit.config.common_package_config import Deployment
 from packit.schema import UserConfigSchema
 from packit_service.config import MRTarget, ProjectToSync, ServiceConfig
+from packit_service.constants import DEBOUNCE_TRIGGERS
 
 
 class DeploymentField(fields.Field):
@@ -81,6 +82,10 @@ class ServiceConfigSchema(UserConfigSchema):
     enabled_projects_for_srpm_in_copr = fields.List(fields.String())
     comment_command_prefix = fields.String()
     package_config_path_override = fields.String()
+    debounce_windows = fields.Dict(
+        keys=fields.String(validate=validate.OneOf(DEBOUNCE_TRIGGERS)),
+        values=fields.Integer(validate=validate.Range(min=0)),
+    )
 
     @post_load
     def make_instance(self, data, **kwargs):
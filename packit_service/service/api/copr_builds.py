@@ -12,8 +12,16 @@ from packit_service.models import (
     BuildStatus,
     CoprBuildGroupModel,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import (
+    cursors,
+    indices,
+    pagination_arguments,
+)
+from packit_service.service.api.utils import (
+    add_cursor_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -33,7 +41,8 @@ class CoprBuildsList(Resource):
         result = []
 
         first, last = indices()
-        for build in CoprBuildTargetModel.get_merged_chroots(first, last):
+        builds = CoprBuildTargetModel.get_merged_chroots(first, last, *cursors())
+        for build in builds:
             build_info = CoprBuildTargetModel.get_by_build_id(build.build_id, None)
             if build_info.status == BuildStatus.waiting_for_srpm:
                 continue
@@ -70,6 +79,7 @@ class CoprBuildsList(Resource):
             status=HTTPStatus.PARTIAL_CONTENT,
         )
         resp.headers["Content-Range"] = f"copr-builds {first + 1}-{last}/*"
+        add_cursor_headers(resp, [build.new_id for build in builds])
         return resp
 
 
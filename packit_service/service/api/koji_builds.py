@@ -11,8 +11,16 @@ from packit_service.models import (
     optional_timestamp,
     KojiBuildGroupModel,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import (
+    cursors,
+    indices,
+    pagination_arguments,
+)
+from packit_service.service.api.utils import (
+    add_cursor_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -29,7 +37,8 @@ class KojiBuildsList(Resource):
         first, last = indices()
         result = []
 
-        for build in KojiBuildTargetModel.get_range(first, last):
+        builds = KojiBuildTargetModel.get_range(first, last, *cursors())
+        for build in builds:
             build_dict = {
                 "packit_id": build.id,
                 "build_id": build.build_id,
@@ -56,6 +65,7 @@ class KojiBuildsList(Resource):
             status=HTTPStatus.PARTIAL_CONTENT,
         )
         resp.headers["Content-Range"] = f"koji-builds {first + 1}-{last}/*"
+        add_cursor_headers(resp, [build.id for build in builds])
         return resp
 
 
@@ -1,6 +1,8 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+from typing import Optional, Tuple
+
 from flask import request
 
 from flask_restx import reqparse
@@ -20,6 +22,20 @@ pagination_arguments.add_argument(
     default=DEFAULT_PER_PAGE,
     help="Results per page",
 )
+pagination_arguments.add_argument(
+    "before_id",
+    type=int,
+    required=False,
+    help="Return the page following the entry with this ID "
+    "(see the X-Before-Id header of the response) instead of the page number",
+)
+pagination_arguments.add_argument(
+    "after_id",
+    type=int,
+    required=False,
+    help="Return the page preceding the entry with this ID "
+    "(see the X-After-Id header of the response) instead of the page number",
+)
 
 
 def indices():
@@ -32,3 +48,9 @@ def indices():
     first = (page - 1) * per_page
     last = page * per_page
     return first, last
+
+
+def cursors() -> Tuple[Optional[int], Optional[int]]:
+    """Return the keyset pagination cursors (before_id, after_id) from request arguments"""
+    args = pagination_arguments.parse_args(request)
+    return args.get("before_id"), args.get("after_id")
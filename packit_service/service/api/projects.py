@@ -7,8 +7,12 @@ from logging import getLogger
 from flask_restx import Namespace, Resource
 
 from packit_service.models import GitProjectModel
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import response_maker
+from packit_service.service.api.parsers import (
+    cursors,
+    indices,
+    pagination_arguments,
+)
+from packit_service.service.api.utils import add_cursor_headers, response_maker
 from packit_service.service.urls import get_srpm_build_info_url
 
 logger = getLogger("packit_service")
@@ -145,9 +149,11 @@ class ProjectsPRs(Resource):
         result = []
         first, last = indices()
 
-        for pr in GitProjectModel.get_project_prs(
-            first, last, forge, namespace, repo_name
-        ):
+        before_id, after_id = cursors()
+        prs = GitProjectModel.get_project_prs(
+            first, last, forge, namespace, repo_name, before_id, after_id
+        )
+        for pr in prs:
             pr_info = {
                 "pr_id": pr.pr_id,
                 "builds": [],
@@ -199,6 +205,7 @@ class ProjectsPRs(Resource):
         )
 
         resp.headers["Content-Range"] = f"git-project-prs {first + 1}-{last}/*"
+        add_cursor_headers(resp, [pr.pr_id for pr in prs])
         return resp
 
 
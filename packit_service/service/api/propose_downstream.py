@@ -11,11 +11,17 @@ from packit_service.models import (
     SyncReleaseModel,
     SyncReleaseJobType,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import (
+    cursors,
+    indices,
+    pagination_arguments,
+)
 from packit_service.service.api.utils import (
+    add_cursor_headers,
     response_maker,
     get_sync_release_info,
     get_sync_release_target_info,
+    logs_response_maker,
 )
 
 logger = getLogger("packit_service")
@@ -32,13 +38,20 @@ class ProposeDownstreamList(Resource):
 
         result = []
         first, last = indices()
-        for propose_downstream_results in SyncReleaseModel.get_range(
-            first, last, job_type=SyncReleaseJobType.propose_downstream
-        ):
+        before_id, after_id = cursors()
+        sync_releases = SyncReleaseModel.get_range(
+            first,
+            last,
+            job_type=SyncReleaseJobType.propose_downstream,
+            before_id=before_id,
+            after_id=after_id,
+        )
+        for propose_downstream_results in sync_releases:
             result.append(get_sync_release_info(propose_downstream_results))
 
         resp = response_maker(result, status=HTTPStatus.PARTIAL_CONTENT)
         resp.headers["Content-Range"] = f"propose-downstreams {first + 1}-{last}/*"
+        add_cursor_headers(resp, [sync_release.id for sync_release in sync_releases])
         return resp
 
 
@@ -67,3 +80,27 @@ class ProposeResult(Resource):
             )
 
         return response_maker(get_sync_release_target_info(sync_release_target_model))
+
+
+@ns.route("/<int:id>/logs")
+@ns.param("id", "Packit id of the propose downstream run target")
+class ProposeResultLogs(Resource):
+    @ns.response(HTTPStatus.OK.value, "OK, propose downstream target logs follow")
+    @ns.response(
+        HTTPStatus.NOT_FOUND.value,
+        "No info about propose downstream target stored in DB",
+    )
+    def get(self, id):
+        """Logs of a specific propose-downstream job"""
+        sync_release_target_model = SyncReleaseTargetModel.get_by_id(id_=int(id))
+        if (
+            not sync_release_target_model
+            or sync_release_target_model.sync_release.job_type
+            != SyncReleaseJobType.propose_downstream
+        ):
+            return response_maker(
+                {"error": "No info about propose downstream target stored in DB"},
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        return logs_response_maker(sync_release_target_model)
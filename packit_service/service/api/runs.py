@@ -8,19 +8,21 @@ from typing import Dict
 from flask_restx import Namespace, Resource
 
 from packit_service.models import (
-    CoprBuildGroupModel,
-    KojiBuildGroupModel,
     PipelineModel,
     SyncReleaseModel,
-    SRPMBuildModel,
     TFTTestRunTargetModel,
     optional_timestamp,
     BuildStatus,
-    TFTTestRunGroupModel,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import (
+    cursors,
+    indices,
+    pagination_arguments,
+)
 from packit_service.service.api.utils import (
+    add_cursor_headers,
     get_project_info_from_build,
+    get_project_info_from_project_event_object,
     response_maker,
 )
 
@@ -29,7 +31,7 @@ logger = getLogger("packit_service")
 ns = Namespace("runs", description="Pipelines")
 
 
-def _add_sync_release(run: SyncReleaseModel, response_dict: Dict):
+def _add_sync_release(run: SyncReleaseModel, response_dict: Dict, trigger: Dict):
     targets = response_dict[run.job_type.value]
 
     for target in run.sync_release_targets:
@@ -43,7 +45,7 @@ def _add_sync_release(run: SyncReleaseModel, response_dict: Dict):
 
     if "trigger" not in response_dict:
         response_dict["time_submitted"] = optional_timestamp(run.submitted_time)
-        response_dict["trigger"] = get_project_info_from_build(run)
+        response_dict["trigger"] = trigger
 
 
 def flatten_and_remove_none(ids):
@@ -55,12 +57,17 @@ def process_runs(runs):
     Process `PipelineModel`s and construct a JSON that is returned from the endpoints
     that return merged chroots.
 
+    All the referenced models are obtained at once, so the number of queries
+    does not depend on the number of runs.
+
     Args:
         runs: Iterator over merged `PipelineModel`s.
 
     Returns:
         List of JSON objects where each represents pipelines run on single SRPM.
     """
+    runs = list(runs)
+    data = PipelineModel.get_merged_runs_data(runs)
     result = []
 
     for pipeline in runs:
@@ -73,8 +80,11 @@ def process_runs(runs):
             "propose_downstream": [],
             "pull_from_upstream": [],
         }
+        trigger = get_project_info_from_project_event_object(
+            data.project_event_objects.get(pipeline.project_event_id)
+        )
 
-        if srpm_build := SRPMBuildModel.get_by_id(pipeline.srpm_build_id):
+        if srpm_build := data.srpm_builds.get(pipeline.srpm_build_id):
             response_dict["srpm"] = {
                 "packit_id": srpm_build.id,
                 "status": srpm_build.status,
@@ -82,15 +92,15 @@ def process_runs(runs):
             response_dict["time_submitted"] = optional_timestamp(
                 srpm_build.build_submitted_time
             )
-            response_dict["trigger"] = get_project_info_from_build(srpm_build)
+            response_dict["trigger"] = trigger
 
-        for model_type, Model, packit_ids in (
-            ("copr", CoprBuildGroupModel, pipeline.copr_build_group_id),
-            ("koji", KojiBuildGroupModel, pipeline.koji_build_group_id),
-            ("test_run", TFTTestRunGroupModel, pipeline.test_run_group_id),
+        for model_type, groups, packit_ids in (
+            ("copr", data.copr_build_groups, pipeline.copr_build_group_id),
+            ("koji", data.koji_build_groups, pipeline.koji_build_group_id),
+            ("test_run", data.test_run_groups, pipeline.test_run_group_id),
         ):
             for packit_id in set(flatten_and_remove_none(packit_ids)):
-                group_row = Model.get_by_id(packit_id)
+                group_row = groups[packit_id]
                 for row in group_row.grouped_targets:
                     if row.status == BuildStatus.waiting_for_srpm:
                         continue
@@ -110,13 +120,14 @@ def process_runs(runs):
                         response_dict["time_submitted"] = optional_timestamp(
                             submitted_time
                         )
-                        response_dict["trigger"] = get_project_info_from_build(row)
+                        response_dict["trigger"] = trigger
 
         # handle propose-downstream and pull-from-upstream
         if sync_release := list(flatten_and_remove_none(pipeline.sync_release_run_id)):
             _add_sync_release(
-                SyncReleaseModel.get_by_id(sync_release[0]),
+                data.sync_release_runs[sync_release[0]],
                 response_dict,
+                trigger,
             )
 
         result.append(response_dict)
@@ -131,12 +142,14 @@ class RunsList(Resource):
     def get(self):
         """List all runs."""
         first, last = indices()
-        result = process_runs(PipelineModel.get_merged_chroots(first, last))
+        runs = PipelineModel.get_merged_chroots(first, last, *cursors())
+        result = process_runs(runs)
         resp = response_maker(
             result,
             status=HTTPStatus.PARTIAL_CONTENT,
         )
         resp.headers["Content-Range"] = f"runs {first + 1}-{last}/*"
+        add_cursor_headers(resp, [run.merged_id for run in runs])
         return resp
 
 
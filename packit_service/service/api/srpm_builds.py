@@ -8,8 +8,17 @@ from packit_service.service.urls import get_srpm_build_info_url
 from flask_restx import Namespace, Resource
 
 from packit_service.models import SRPMBuildModel, optional_timestamp
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import (
+    cursors,
+    indices,
+    pagination_arguments,
+)
+from packit_service.service.api.utils import (
+    add_cursor_headers,
+    get_project_info_from_build,
+    logs_response_maker,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -26,7 +35,8 @@ class SRPMBuildsList(Resource):
         result = []
 
         first, last = indices()
-        for build in SRPMBuildModel.get_range(first, last):
+        builds = SRPMBuildModel.get_range(first, last, *cursors())
+        for build in builds:
             build_dict = {
                 "srpm_build_id": build.id,
                 "status": build.status,
@@ -49,6 +59,7 @@ class SRPMBuildsList(Resource):
             status=HTTPStatus.PARTIAL_CONTENT,
         )
         resp.headers["Content-Range"] = f"srpm-builds {first + 1}-{last}/*"
+        add_cursor_headers(resp, [build.id for build in builds])
         return resp
 
 
@@ -72,7 +83,7 @@ class SRPMBuildItem(Resource):
             "build_start_time": optional_timestamp(build.build_start_time),
             "build_finished_time": optional_timestamp(build.build_finished_time),
             "url": build.url,
-            "logs": build.logs,
+            "logs": build.get_logs(),
             "logs_url": build.logs_url,
             "copr_build_id": build.copr_build_id,
             "copr_web_url": build.copr_web_url,
@@ -81,3 +92,20 @@ class SRPMBuildItem(Resource):
 
         build_dict.update(get_project_info_from_build(build))
         return response_maker(build_dict)
+
+
+@ns.route("/<int:id>/logs")
+@ns.param("id", "Packit id of the SRPM build")
+class SRPMBuildLogs(Resource):
+    @ns.response(HTTPStatus.OK.value, "OK, SRPM build logs follow")
+    @ns.response(HTTPStatus.NOT_FOUND.value, "SRPM build identifier not in db/hash")
+    def get(self, id):
+        """Logs of a specific SRPM build."""
+        build = SRPMBuildModel.get_by_id(int(id))
+        if not build:
+            return response_maker(
+                {"error": "No info about build stored in DB"},
+                status=HTTPStatus.NOT_FOUND,
+            )
+
+        return logs_response_maker(build)
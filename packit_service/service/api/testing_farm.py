@@ -17,8 +17,16 @@ from packit_service.models import (
     TFTTestRunGroupModel,
 )
 from packit_service.service.api.errors import ValidationFailed
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import (
+    cursors,
+    indices,
+    pagination_arguments,
+)
+from packit_service.service.api.utils import (
+    add_cursor_headers,
+    get_project_info_from_build,
+    response_maker,
+)
 
 logger = logging.getLogger("packit_service")
 
@@ -114,7 +122,8 @@ class TestingFarmResults(Resource):
         first, last = indices()
         # results have nothing other than ref in common, so it doesn't make sense to
         # merge them like copr builds
-        for tf_result in TFTTestRunTargetModel.get_range(first, last):
+        tf_results = TFTTestRunTargetModel.get_range(first, last, *cursors())
+        for tf_result in tf_results:
             result_dict = {
                 "packit_id": tf_result.id,
                 "pipeline_id": tf_result.pipeline_id,
@@ -138,6 +147,7 @@ class TestingFarmResults(Resource):
             status=HTTPStatus.PARTIAL_CONTENT,
         )
         resp.headers["Content-Range"] = f"test-results {first + 1}-{last}/*"
+        add_cursor_headers(resp, [tf_result.id for tf_result in tf_results])
         return resp
 
 
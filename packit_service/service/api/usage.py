@@ -36,6 +36,9 @@ class Usage(Resource):
         (e.g. `/api/usage?from=2022-01-30`).
         Also, you can use `top` argument to specify number of project
         in the top_projects_by_something parts of the response.
+
+        The numbers are precomputed per day and refreshed every hour,
+        the time range is therefore rounded to whole days.
         """
 
         top = int(request.args.get("top")) if "top" in request.args else None
@@ -59,6 +62,9 @@ class ProjectUsage(Resource):
 
         You can use `from` and `to` arguments to specify a time range
         (e.g. `api/usage/project/github.com/packit/ogr?from=2022-01-30`).
+
+        The numbers are precomputed per day and refreshed every hour,
+        the time range is therefore rounded to whole days.
         """
 
         datetime_from = request.args.get("from")
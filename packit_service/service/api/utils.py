@@ -3,11 +3,12 @@
 
 from http import HTTPStatus
 from json import dumps
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Union
 
-from flask import make_response
+from flask import Response, make_response, stream_with_context
 
 from packit_service.models import (
+    AbstractProjectEventDbType,
     CoprBuildTargetModel,
     CoprBuildGroupModel,
     KojiBuildTargetModel,
@@ -17,6 +18,11 @@ from packit_service.models import (
     TFTTestRunGroupModel,
     SyncReleaseModel,
     SyncReleaseTargetModel,
+    GitBranchModel,
+    IssueModel,
+    ProjectReleaseModel,
+    PullRequestModel,
+    StoredLogsMixin,
     optional_timestamp,
 )
 
@@ -29,6 +35,30 @@ def response_maker(result: Any, status: HTTPStatus = HTTPStatus.OK):
     return resp
 
 
+def add_cursor_headers(resp: Response, ids: List[int]) -> None:
+    """
+    Add the keyset pagination cursors of the neighbouring pages to the response.
+
+    Args:
+        resp: Response with a page of the list.
+        ids: IDs the page is ordered by, as used for the `before_id`
+            and `after_id` request arguments.
+    """
+    if ids:
+        resp.headers["X-Before-Id"] = str(ids[-1])
+        resp.headers["X-After-Id"] = str(ids[0])
+    resp.headers[
+        "Access-Control-Expose-Headers"
+    ] = "Content-Range, X-Before-Id, X-After-Id"
+
+
+def logs_response_maker(model: StoredLogsMixin):
+    """Stream the logs of the model as plain text."""
+    resp = Response(stream_with_context(model.iter_logs()), mimetype="text/plain")
+    resp.headers["Access-Control-Allow-Origin"] = "*"
+    return resp
+
+
 def get_project_info_from_build(
     build: Union[
         SRPMBuildModel,
@@ -41,17 +71,31 @@ def get_project_info_from_build(
         SyncReleaseModel,
     ]
 ) -> Dict[str, Any]:
-    if not (project := build.get_project()):
+    return get_project_info_from_project_event_object(build.get_project_event_object())
+
+
+def get_project_info_from_project_event_object(
+    project_event_object: Optional[AbstractProjectEventDbType],
+) -> Dict[str, Any]:
+    if not (project_event_object and (project := project_event_object.project)):
         return {}
 
     return {
         "repo_namespace": project.namespace,
         "repo_name": project.repo_name,
         "git_repo": project.project_url,
-        "pr_id": build.get_pr_id(),
-        "issue_id": build.get_issue_id(),
-        "branch_name": build.get_branch_name(),
-        "release": build.get_release_tag(),
+        "pr_id": project_event_object.pr_id
+        if isinstance(project_event_object, PullRequestModel)
+        else None,
+        "issue_id": project_event_object.issue_id
+        if isinstance(project_event_object, IssueModel)
+        else None,
+        "branch_name": project_event_object.name
+        if isinstance(project_event_object, GitBranchModel)
+        else None,
+        "release": project_event_object.tag_name
+        if isinstance(project_event_object, ProjectReleaseModel)
+        else None,
     }
 
 
@@ -63,7 +107,7 @@ def get_sync_release_target_info(sync_release_model: SyncReleaseTargetModel):
         "submitted_time": optional_timestamp(sync_release_model.submitted_time),
         "start_time": optional_timestamp(sync_release_model.start_time),
         "finished_time": optional_timestamp(sync_release_model.finished_time),
-        "logs": sync_release_model.logs,
+        "logs": sync_release_model.get_logs(),
     }
 
     job_result_dict.update(get_project_info_from_build(sync_release_model.sync_release))
@@ -8,6 +8,7 @@ from hashlib import sha256
 from http import HTTPStatus
 from logging import getLogger
 from os import getenv
+from typing import Optional
 
 import jwt
 from flask import request
@@ -20,6 +21,7 @@ from packit_service.config import ServiceConfig
 from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME, GITLAB_ISSUE
 from packit_service.models import ProjectAuthenticationIssueModel
 from packit_service.service.api.errors import ValidationFailed
+from packit_service.utils import get_event_hash, register_delivery, unregister_delivery
 
 logger = getLogger("packit_service")
 config = ServiceConfig.get_service_config()
@@ -52,6 +54,51 @@ github_webhook_calls = Counter(
     ["result", "process_id"],
 )
 
+webhook_duplicates = Counter(
+    "webhook_duplicates",
+    "Number of redelivered webhooks dropped as duplicates",
+    ["source", "process_id"],
+)
+
+
+def accept_delivery(
+    msg: dict, source: str, event_type: Optional[str], delivery_id: str
+) -> bool:
+    """
+    Send the event to the workers, unless the delivery is a duplicate
+    of one already accepted (redelivered by the forge or by the user).
+
+    Args:
+        msg: Payload of the webhook.
+        source: Source of the event, for example: "github".
+        event_type: Type of the event.
+        delivery_id: ID of the delivery, or hash of the payload if the forge
+            doesn't provide it.
+
+    Returns:
+        Whether the event was sent to the workers.
+    """
+    if not register_delivery(delivery_id, stage="received"):
+        logger.info(f"/webhooks/{source}: dropping duplicate delivery {delivery_id}")
+        webhook_duplicates.labels(source=source, process_id=os.getpid()).inc()
+        return False
+
+    try:
+        celery_app.send_task(
+            name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
+            kwargs={
+                "event": msg,
+                "source": source,
+                "event_type": event_type,
+                "delivery_id": delivery_id,
+            },
+        )
+    except Exception:
+        # let the forge (or the user) redeliver it
+        unregister_delivery(delivery_id, stage="received")
+        raise
+    return True
+
 
 @ns.route("/github")
 class GithubWebhook(Resource):
@@ -94,14 +141,17 @@ class GithubWebhook(Resource):
             ).inc()
             return "Thanks but we don't care about this event", HTTPStatus.ACCEPTED
 
-        celery_app.send_task(
-            name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={
-                "event": msg,
-                "source": "github",
-                "event_type": request.headers.get("X-GitHub-Event"),
-            },
-        )
+        if not accept_delivery(
+            msg,
+            source="github",
+            event_type=request.headers.get("X-GitHub-Event"),
+            delivery_id=request.headers.get("X-GitHub-Delivery") or get_event_hash(msg),
+        ):
+            github_webhook_calls.labels(
+                result="duplicate", process_id=os.getpid()
+            ).inc()
+            return "This delivery has already been accepted.", HTTPStatus.ACCEPTED
+
         github_webhook_calls.labels(result="accepted", process_id=os.getpid()).inc()
 
         return "Webhook accepted. We thank you, Github.", HTTPStatus.ACCEPTED
@@ -197,14 +247,14 @@ class GitlabWebhook(Resource):
         if not self.interested():
             return "Thanks but we don't care about this event", HTTPStatus.ACCEPTED
 
-        celery_app.send_task(
-            name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={
-                "event": msg,
-                "source": "gitlab",
-                "event_type": request.headers.get("X-Gitlab-Event"),
-            },
-        )
+        if not accept_delivery(
+            msg,
+            source="gitlab",
+            event_type=request.headers.get("X-Gitlab-Event"),
+            delivery_id=request.headers.get("X-Gitlab-Event-UUID")
+            or get_event_hash(msg),
+        ):
+            return "This delivery has already been accepted.", HTTPStatus.ACCEPTED
 
         return "Webhook accepted. We thank you, Gitlab.", HTTPStatus.ACCEPTED
 
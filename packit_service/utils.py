@@ -1,15 +1,31 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import sha256
 from io import StringIO
 from logging import StreamHandler
-from typing import List, Tuple
+from os import getenv
+from typing import List, Optional, Tuple, Union
+
+from redis import Redis
+from redis.exceptions import RedisError
 
 from packit.config import JobConfig, PackageConfig
+from packit.exceptions import PackitException
 from packit.schema import JobConfigSchema, PackageConfigSchema
 from packit.utils import PackitFormatter
+from packit_service.constants import (
+    DEBOUNCE_KEY_PREFIX,
+    DELIVERY_KEY_PREFIX,
+    DELIVERY_TTL,
+    PACKAGE_CONFIG_REFERENCE_PREFIX,
+    PACKAGE_CONFIG_REFERENCE_TTL,
+    REDIS_SOCKET_TIMEOUT,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +55,10 @@ class only_once:
 
 
 # wrappers for dumping/loading of configs
-def load_package_config(package_config: dict):
+def load_package_config(package_config: Union[dict, str, None]):
+    if isinstance(package_config, str):
+        package_config = get_package_config_by_reference(package_config)
+
     package_config_obj = (
         PackageConfigSchema().load(package_config) if package_config else None
     )
@@ -50,6 +69,150 @@ def dump_package_config(package_config: PackageConfig):
     return PackageConfigSchema().dump(package_config) if package_config else None
 
 
+def dump_package_config_by_reference(
+    package_config: Optional[PackageConfig],
+) -> Union[dict, str, None]:
+    """
+    Dump the package config and store it in Redis under the hash of its content,
+    so that the Celery tasks for the jobs of one event can share a single copy
+    instead of carrying it in each of their messages.
+
+    Returns:
+        Reference to the stored package config, or the dumped package config
+        itself if it can't be stored.
+    """
+    if not (dumped_config := dump_package_config(package_config)):
+        return None
+
+    serialized_config = json.dumps(dumped_config, sort_keys=True)
+    reference = (
+        f"{PACKAGE_CONFIG_REFERENCE_PREFIX}"
+        f"{sha256(serialized_config.encode()).hexdigest()}"
+    )
+    try:
+        get_redis().set(reference, serialized_config, ex=PACKAGE_CONFIG_REFERENCE_TTL)
+    except RedisError as ex:
+        logger.warning(f"Failed to store the package config in Redis: {ex!r}")
+        return dumped_config
+
+    return reference
+
+
+class PackageConfigReferenceNotFound(PackitException):
+    """The package config stored by reference has expired or is not available."""
+
+
+def get_package_config_by_reference(reference: str) -> dict:
+    """
+    Get the dumped package config stored by `dump_package_config_by_reference`.
+
+    Raises:
+        PackageConfigReferenceNotFound: If the package config is not available.
+            It's not loaded from the repository again instead, it could differ
+            from the one the task was dispatched with (e.g. the config of one
+            package of a monorepo or the config adjusted for the event), so the
+            task is retried and fails if it doesn't become available.
+    """
+    try:
+        serialized_config = get_redis().get(reference)
+    except RedisError as ex:
+        raise PackageConfigReferenceNotFound(
+            f"Failed to get the package config {reference!r} from Redis: {ex!r}"
+        ) from ex
+    if not serialized_config:
+        raise PackageConfigReferenceNotFound(
+            f"Package config {reference!r} not found in Redis."
+        )
+
+    return json.loads(serialized_config)
+
+
+def get_event_hash(event: dict) -> str:
+    """
+    Get the hash of the event content, identifies the deliveries of the events
+    that come without a delivery ID.
+    """
+    return sha256(json.dumps(event, sort_keys=True).encode()).hexdigest()
+
+
+def register_delivery(delivery_id: str, stage: str) -> bool:
+    """
+    Register the delivery of an event in Redis, so that its redeliveries
+    can be dropped.
+
+    Args:
+        delivery_id: ID of the delivery, e.g. the X-GitHub-Delivery header.
+        stage: Stage of the processing the delivery is registered in,
+            the duplicates are detected in each stage separately.
+
+    Returns:
+        False if the delivery has already been registered in the stage,
+        i.e. it's a duplicate, True otherwise (also if Redis is not available).
+    """
+    try:
+        return bool(
+            get_redis().set(
+                f"{DELIVERY_KEY_PREFIX}{stage}:{delivery_id}",
+                1,
+                ex=DELIVERY_TTL,
+                nx=True,
+            )
+        )
+    except RedisError as ex:
+        logger.warning(f"Failed to register the delivery {delivery_id}: {ex!r}")
+        return True
+
+
+def unregister_delivery(delivery_id: str, stage: str) -> None:
+    """
+    Unregister the delivery of an event which failed to be processed,
+    so that it can be redelivered.
+    """
+    try:
+        get_redis().delete(f"{DELIVERY_KEY_PREFIX}{stage}:{delivery_id}")
+    except RedisError as ex:
+        logger.warning(f"Failed to unregister the delivery {delivery_id}: {ex!r}")
+
+
+def set_latest_debounced_event(subject: str, token: str, window: int) -> bool:
+    """
+    Mark the event as the latest one for the subject (PR or branch)
+    within the debounce window.
+
+    Args:
+        subject: Identifier of the PR or branch the event is for.
+        token: Unique identifier of the event.
+        window: Length of the debounce window in seconds.
+
+    Returns:
+        Whether the event was marked, False if Redis is not available.
+    """
+    try:
+        # outlive the window, the delayed tasks don't run precisely on time
+        get_redis().set(f"{DEBOUNCE_KEY_PREFIX}{subject}", token, ex=2 * window + 60)
+        return True
+    except RedisError as ex:
+        logger.warning(f"Failed to debounce the event for {subject}: {ex!r}")
+        return False
+
+
+def is_latest_debounced_event(subject: str, token: str) -> bool:
+    """
+    Check whether no newer event for the subject arrived
+    within the debounce window.
+
+    The event is considered the latest one also if it can't be decided.
+    """
+    try:
+        latest = get_redis().get(f"{DEBOUNCE_KEY_PREFIX}{subject}")
+    except RedisError as ex:
+        logger.warning(f"Failed to get the latest event for {subject}: {ex!r}")
+        return True
+    if isinstance(latest, bytes):
+        latest = latest.decode()
+    return latest is None or latest == token
+
+
 def load_job_config(job_config: dict):
     return JobConfigSchema().load(job_config) if job_config else None
 
@@ -203,3 +366,28 @@ def get_packit_commands_from_comment(
             return packit_command
 
     return []
+
+
+def get_redis_url() -> str:
+    """
+    Get the URL of the Redis instance used by the service (Celery broker included).
+    """
+    host = getenv("REDIS_SERVICE_HOST", "redis")
+    password = getenv("REDIS_PASSWORD", "")
+    port = getenv("REDIS_SERVICE_PORT", "6379")
+    db = getenv("REDIS_SERVICE_DB", "0")
+    return f"redis://:{password}@{host}:{port}/{db}"
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """
+    Get a client for the Redis instance shared by all the service processes.
+
+    The client keeps a connection pool, therefore it's created only once per process.
+    """
+    return Redis.from_url(
+        get_redis_url(),
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+    )
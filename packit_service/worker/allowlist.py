@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import time
 from typing import Any, Iterable, Optional, Union, Callable, List, Tuple, Dict, Type
 from urllib.parse import urlparse
 
@@ -14,6 +15,7 @@ from packit.config.job_config import JobConfig, JobType
 from packit.exceptions import PackitException, PackitCommandFailedError
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
+    ALLOWLIST_INDEX_MAX_AGE,
     FASJSON_URL,
     NAMESPACE_NOT_ALLOWED_MARKDOWN_DESCRIPTION,
     NAMESPACE_NOT_ALLOWED_MARKDOWN_ISSUE_INSTRUCTIONS,
@@ -65,6 +67,82 @@ UncheckedEvent = Union[
 ]
 
 
+class AllowlistIndex:
+    """
+    In-memory index of the allowlist: the namespaces split by `/` are stored
+    in a prefix tree, so that the statuses of a namespace and all its parents
+    can be found in a single walk without querying the database.
+
+    The index is shared within the process and reloaded when the version
+    of the allowlist (increased with every change) differs from the loaded one
+    or when the index is older than `ALLOWLIST_INDEX_MAX_AGE` seconds.
+    """
+
+    class Node:
+        __slots__ = ("children", "status")
+
+        def __init__(self):
+            self.children: Dict[str, "AllowlistIndex.Node"] = {}
+            self.status: Optional[AllowlistStatus] = None
+
+    _instance: Optional["AllowlistIndex"] = None
+    _version: Optional[int] = None
+    _loaded_at: float = 0.0
+
+    def __init__(self, entries: Iterable[AllowlistModel]):
+        self.root = AllowlistIndex.Node()
+        for entry in entries:
+            node = self.root
+            for part in entry.namespace.split("/"):
+                node = node.children.setdefault(part, AllowlistIndex.Node())
+            node.status = AllowlistStatus(entry.status)
+
+    @classmethod
+    def get(cls) -> "AllowlistIndex":
+        """
+        Get the index of the current allowlist, reload it if it's outdated.
+
+        Returns:
+            Index of the allowlist.
+        """
+        version = AllowlistModel.get_version()
+        if (
+            cls._instance is None
+            # if the version can't be obtained, only the age of the index is checked
+            or (version is not None and version != cls._version)
+            or time.monotonic() - cls._loaded_at > ALLOWLIST_INDEX_MAX_AGE
+        ):
+            logger.debug(f"Loading the allowlist index (version {version}).")
+            cls._instance = cls(AllowlistModel.get_all())
+            cls._version = version
+            cls._loaded_at = time.monotonic()
+
+        return cls._instance
+
+    def get_statuses(self, namespace: str) -> List[AllowlistStatus]:
+        """
+        Get statuses of the namespace and its parent namespaces.
+
+        Args:
+            namespace (str): Namespace in format `example.com/namespace/repository.git`,
+                where `/repository.git` is optional.
+
+        Returns:
+            Statuses of the namespaces present in the allowlist, starting with
+            the most specific one.
+        """
+        statuses = []
+        node = self.root
+        for part in namespace.split("/"):
+            node = node.children.get(part)
+            if node is None:
+                break
+            if node.status is not None:
+                statuses.append(node.status)
+
+        return statuses[::-1]
+
+
 class Allowlist:
     def __init__(self, service_config: ServiceConfig):
         self.service_config = service_config
@@ -191,17 +269,12 @@ class Allowlist:
         if not namespace:
             return False
 
-        separated_path = [namespace, None]
-        while len(separated_path) > 1:
-            if matching_namespace := AllowlistModel.get_namespace(separated_path[0]):
-                status = AllowlistStatus(matching_namespace.status)
-                if status != AllowlistStatus.waiting:
-                    return status in (
-                        AllowlistStatus.approved_automatically,
-                        AllowlistStatus.approved_manually,
-                    )
-
-            separated_path = separated_path[0].rsplit("/", 1)
+        for status in AllowlistIndex.get().get_statuses(namespace):
+            if status != AllowlistStatus.waiting:
+                return status in (
+                    AllowlistStatus.approved_automatically,
+                    AllowlistStatus.approved_manually,
+                )
 
         logger.info(f"Could not find approved entry for: {namespace}")
         return False
@@ -221,15 +294,9 @@ class Allowlist:
         if not namespace:
             return False
 
-        separated_path = [namespace, None]
-        while len(separated_path) > 1:
-            if matching_namespace := AllowlistModel.get_namespace(separated_path[0]):
-                status = AllowlistStatus(matching_namespace.status)
-                if status == AllowlistStatus.denied:
-                    logger.info(f"Namespace {namespace} is denied.")
-                    return True
-
-            separated_path = separated_path[0].rsplit("/", 1)
+        if AllowlistStatus.denied in AllowlistIndex.get().get_statuses(namespace):
+            logger.info(f"Namespace {namespace} is denied.")
+            return True
 
         logger.info(f"Could not find denied entry for: {namespace}")
         return False
@@ -6,6 +6,7 @@ import logging
 from packit_service.constants import (
     INTERNAL_TF_BUILDS_AND_TESTS_NOT_ALLOWED,
 )
+from packit_service.models import BuildStatus
 from packit_service.worker.checker.abstract import (
     ActorChecker,
     Checker,
@@ -82,6 +83,18 @@ class BuildNotAlreadyStarted(Checker, GetCoprSRPMBuildMixin):
         return not bool(build.build_start_time)
 
 
+class BuildNotSuperseded(Checker, GetCoprSRPMBuildMixin):
+    def pre_check(self) -> bool:
+        build = self.build
+        if build and build.status == BuildStatus.superseded:
+            logger.debug(
+                f"Build {self.copr_event.build_id} was superseded "
+                "by a newer commit, skipping reporting."
+            )
+            return False
+        return True
+
+
 class CanActorRunTestsJob(ActorChecker, GetCoprBuildJobHelperMixin):
     """For external contributors, we need to be more careful when running jobs.
     This is a handler-specific permission check
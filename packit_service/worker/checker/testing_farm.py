@@ -8,6 +8,7 @@ from packit_service.constants import (
     INTERNAL_TF_TESTS_NOT_ALLOWED,
     DOCS_TESTING_FARM,
 )
+from packit_service.models import TestingFarmResult, TFTTestRunTargetModel
 from packit_service.worker.checker.abstract import (
     ActorChecker,
     Checker,
@@ -63,6 +64,19 @@ class IsEventForJob(Checker):
         return True
 
 
+class IsTestRunNotSuperseded(Checker):
+    def pre_check(self) -> bool:
+        pipeline_id = self.data.event_dict.get("pipeline_id")
+        test_run = TFTTestRunTargetModel.get_by_pipeline_id(pipeline_id=pipeline_id)
+        if test_run and test_run.status == TestingFarmResult.superseded:
+            logger.debug(
+                f"Testing Farm request {pipeline_id} was superseded "
+                "by a newer commit, skipping reporting."
+            )
+            return False
+        return True
+
+
 class CanActorRunJob(ActorChecker, GetTestingFarmJobHelperMixin):
     """For external contributors, we need to be more careful when running jobs.
     This is a handler-specific permission check
@@ -1,80 +1,64 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import timedelta
-from gzip import open as gzip_open
-from logging import getLogger, DEBUG, INFO
+import time
+from logging import getLogger
 from os import getenv
-from pathlib import Path
-from shutil import copyfileobj
+from subprocess import PIPE, Popen
+from threading import Thread
+from typing import List
 
 from boto3 import client as boto3_client
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
-from packit.utils.commands import run_command
-from packit_service.constants import SRPMBUILDS_OUTDATED_AFTER_DAYS
-from packit_service.models import get_pg_url, SRPMBuildModel
+from packit.exceptions import PackitCommandFailedError
+from packit_service.constants import (
+    BACKUP_MULTIPART_CHUNK_SIZE,
+    BACKUP_UPLOAD_CONCURRENCY,
+)
+from packit_service.models import get_pg_url
+from packit_service.worker.monitoring import Pushgateway
 
 logger = getLogger(__name__)
 
 DB_NAME = getenv("POSTGRESQL_DATABASE")
 
 
-def discard_old_srpm_build_logs():
-    """Called periodically (see celery_config.py) to discard logs of old SRPM builds."""
-    logger.info("About to discard old SRPM build logs & artifact urls.")
-    outdated_after_days = getenv(
-        "SRPMBUILDS_OUTDATED_AFTER_DAYS", SRPMBUILDS_OUTDATED_AFTER_DAYS
-    )
-    ago = timedelta(days=int(outdated_after_days))
-    for build in SRPMBuildModel.get_older_than(ago):
-        logger.debug(
-            f"SRPM build {build.id} is older than '{ago}'. "
-            "Discarding log and artifact url."
-        )
-        build.set_logs(None)
-        build.set_url(None)
-
-
-def gzip_file(file: Path) -> Path:
-    """Gzip compress given file into {file}.gz
-
-    Args:
-        file: File to be compressed.
-    Returns:
-        Compressed file.
-    Raises:
-        OSError: If the 'file' can't be opened.
+class DumpStream:
     """
-    compressed_file = Path(f"{file}.gz")
-    try:
-        with file.open(mode="rb") as f_in:
-            with gzip_open(compressed_file, mode="wb") as f_out:
-                logger.info(f"Compressing {file} into {compressed_file}")
-                copyfileobj(f_in, f_out)
-    except OSError as e:
-        logger.error(e)
-        raise
-    return compressed_file
-
-
-def upload_to_s3(
-    file: Path, bucket: str = f"arr-packit-{getenv('DEPLOYMENT', 'dev')}"
-) -> None:
-    """Upload a file to an S3 bucket.
+    Output of a running pg_dump, read by the upload.
 
-    Args:
-        file: File to upload.
-        bucket: Bucket to upload to.
+    Reaching the end of the output fails if pg_dump failed, so that
+    the upload is aborted instead of storing an incomplete dump.
     """
 
-    s3_client = boto3_client("s3")
-    try:
-        logger.info(f"Uploading {file} to S3 ({bucket})")
-        s3_client.upload_file(str(file), bucket, file.name)
-    except ClientError as e:
-        logger.error(e)
-        raise
+    def __init__(self, process: Popen):
+        self.process = process
+        self.size = 0
+        # drained in the background, so that pg_dump isn't blocked on a full pipe
+        self._stderr: List[bytes] = []
+        self._stderr_reader = Thread(
+            target=lambda: self._stderr.append(process.stderr.read()), daemon=True
+        )
+        self._stderr_reader.start()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.process.stdout.read(size)
+        self.size += len(data)
+        if not data and size != 0:
+            self._check()
+        return data
+
+    def _check(self) -> None:
+        returncode = self.process.wait()
+        self._stderr_reader.join()
+        if returncode:
+            raise PackitCommandFailedError(
+                f"pg_dump failed with exit code {returncode}",
+                stdout_output="",
+                stderr_output=b"".join(self._stderr).decode(errors="replace"),
+            )
 
 
 def is_aws_configured() -> bool:
@@ -82,52 +66,67 @@ def is_aws_configured() -> bool:
     return bool(getenv("AWS_ACCESS_KEY_ID") and getenv("AWS_SECRET_ACCESS_KEY"))
 
 
-def dump_to(file: Path):
-    """Dump 'packit' database into a file.
-
-    To restore db from this file, run:
-    psql -d packit < database_packit.sql
+def start_dump() -> Popen:
+    """Start dumping 'packit' database to the stdout of the returned process.
 
-    Args:
-        file: File where to put the dump.
-    Raises:
-        PackitCommandFailedError: When pg_dump fails.
+    The dump is in the (compressed) custom format, to restore the db from it, run:
+    pg_restore --dbname=packit packit_database_packit.dump
     """
     # We have to specify libpq connection string to be able to pass the
     # password to the pg_dump. Luckily get_pg_url() does almost what we need.
+    # The command is not logged, so that the password doesn't leak into logs.
     pg_connection = get_pg_url().replace("+psycopg2", "")
-    cmd = ["pg_dump", f"--file={file}", f"--dbname={pg_connection}"]
-    packit_logger = getLogger("packit")
-    was_debug = packit_logger.level == DEBUG
-
     logger.info(f"Running pg_dump to create '{DB_NAME}' database backup")
-    try:
-        if was_debug:
-            # Temporarily increase log level to avoid password leaking into logs
-            packit_logger.setLevel(INFO)
-        run_command(cmd=cmd)
-    finally:
-        if was_debug:
-            packit_logger.setLevel(DEBUG)
+    return Popen(
+        ["pg_dump", "--format=custom", f"--dbname={pg_connection}"],
+        stdout=PIPE,
+        stderr=PIPE,
+    )
 
 
-def backup():
-    """Dump the 'packit' database into a file, compress and upload to S3."""
+def backup(bucket: str = f"arr-packit-{getenv('DEPLOYMENT', 'dev')}"):
+    """Dump the 'packit' database and upload it to S3.
+
+    The (compressed) dump is streamed right into a multipart upload,
+    the parts are uploaded in parallel and only a few of them are kept
+    in memory at a time.
+    `BACKUP_S3_ENDPOINT_URL` can point to an S3-compatible service.
+    """
     if not is_aws_configured():
         logger.info("Not backing up database since AWS is not configured.")
         # probably dev/test deployment
         return
 
-    project = getenv("PROJECT", "packit")
-    file = Path(f"/tmp/{project}_database_{DB_NAME}.sql")
-    compressed_file = None
+    key = f"{getenv('PROJECT', 'packit')}_database_{DB_NAME}.dump"
+    s3_client = boto3_client("s3", endpoint_url=getenv("BACKUP_S3_ENDPOINT_URL"))
+    logger.info(f"About to backup database to S3 ({bucket}/{key})")
+    start = time.monotonic()
+    process = start_dump()
+    dump = DumpStream(process)
     try:
-        logger.info("About to backup database")
-        dump_to(file)
-        compressed_file = gzip_file(file)
-        upload_to_s3(compressed_file)
-        logger.info("Backup complete")
+        s3_client.upload_fileobj(
+            dump,
+            bucket,
+            key,
+            Config=TransferConfig(
+                multipart_chunksize=BACKUP_MULTIPART_CHUNK_SIZE,
+                max_concurrency=BACKUP_UPLOAD_CONCURRENCY,
+            ),
+        )
+    except (ClientError, PackitCommandFailedError) as e:
+        logger.error(e)
+        raise
     finally:
-        file.unlink(missing_ok=True)
-        if compressed_file:
-            compressed_file.unlink()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    duration = time.monotonic() - start
+    logger.info(
+        f"Backup complete: {dump.size / 2**20:.1f} MiB in {duration:.0f}s "
+        f"({dump.size / 2**20 / max(duration, 1e-3):.1f} MiB/s)"
+    )
+    pushgateway = Pushgateway()
+    pushgateway.database_backup_time.set(duration)
+    pushgateway.database_backup_size.set(dump.size)
+    pushgateway.push()
@@ -20,6 +20,8 @@ logger = getLogger(__name__)
 
 
 class AbstractCommentEvent(AbstractForgeIndependentEvent):
+    not_serialized = AbstractForgeIndependentEvent.not_serialized | {"_comment_object"}
+
     def __init__(
         self,
         project_url: str,
@@ -39,13 +41,14 @@ class AbstractCommentEvent(AbstractForgeIndependentEvent):
     def comment_object(self) -> Optional[Comment]:
         raise NotImplementedError("Use subclass instead.")
 
-    def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
-        result = super().get_dict()
-        result.pop("_comment_object")
-        return result
-
 
 class AbstractPRCommentEvent(AddPullRequestDbTrigger, AbstractCommentEvent):
+    # the overrides are serialized via their properties
+    not_serialized = AbstractCommentEvent.not_serialized | {
+        "_build_targets_override",
+        "_tests_targets_override",
+    }
+
     def __init__(
         self,
         pr_id: int,
@@ -114,8 +117,6 @@ class AbstractPRCommentEvent(AddPullRequestDbTrigger, AbstractCommentEvent):
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
         result["commit_sha"] = self.commit_sha
-        result.pop("_build_targets_override")
-        result.pop("_tests_targets_override")
         return result
 
 
@@ -22,6 +22,7 @@ logger = getLogger(__name__)
 
 class AbstractCoprBuildEvent(AbstractResultEvent):
     build: Optional[Union[SRPMBuildModel, CoprBuildTargetModel]]
+    not_serialized = AbstractResultEvent.not_serialized | {"build"}
 
     def __init__(
         self,
@@ -136,7 +137,6 @@ class AbstractCoprBuildEvent(AbstractResultEvent):
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
         result["topic"] = result["topic"].value
-        result.pop("build")
         return result
 
     def get_copr_build_url(self) -> str:
@@ -4,7 +4,6 @@
 """
 Generic/abstract event classes.
 """
-import copy
 from datetime import datetime, timezone
 from logging import getLogger
 from typing import Dict, Optional, Type, Union, Set, List
@@ -212,8 +211,12 @@ class EventData:
         return self._db_project_event
 
     def get_dict(self) -> dict:
-        d = self.__dict__
-        d = copy.deepcopy(d)
+        # the lazily loaded objects can't be serialized, leave them out
+        d = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_project", "_db_project_event")
+        }
         task_accepted_time = d.get("task_accepted_time")
         d["task_accepted_time"] = (
             int(task_accepted_time.timestamp()) if task_accepted_time else None
@@ -224,8 +227,6 @@ class EventData:
             d["tests_targets_override"] = list(self.tests_targets_override)
         if self.branches_override:
             d["branches_override"] = list(self.branches_override)
-        d.pop("_project", None)
-        d.pop("_db_project_event", None)
         return d
 
     def get_project(self) -> Optional[GitProject]:
@@ -239,6 +240,17 @@ class EventData:
 class Event:
     task_accepted_time: Optional[datetime] = None
     actor: Optional[str]
+    # attributes left out of the dictionary representation of the event
+    # (lazily loaded objects that are not JSON serializable); the rest are
+    # the arguments the event is recreated from in the tasks, so the event
+    # classes only list what is loaded lazily or cached instead of repeating
+    # all their constructor arguments in a whitelist
+    not_serialized: Set[str] = {
+        "_project",
+        "_base_project",
+        "_package_config",
+        "_db_project_event",
+    }
 
     def __init__(self, created_at: Union[int, float, str] = None):
         self.created_at: datetime
@@ -260,16 +272,17 @@ class Event:
         self._db_project_event: Optional[AbstractProjectEventDbType] = None
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
-        d = default_dict or self.__dict__
-        d = copy.deepcopy(d)
-        # whole dict has to be JSON serializable because of redis
+        # whole dict has to be JSON serializable because of redis,
+        # the values are plain data, so a shallow copy is enough
+        d = {
+            key: value
+            for key, value in (default_dict or self.__dict__).items()
+            if key not in self.not_serialized
+        }
         d["event_type"] = self.__class__.__name__
 
         # we are trying to be lazy => don't touch database if it is not needed
         d["event_id"] = self._db_project_event.id if self._db_project_event else None
-        # we don't want to save non-serializable object
-        d.pop("_db_project_event")
-
         d["created_at"] = int(d["created_at"].timestamp())
         task_accepted_time = d.get("task_accepted_time")
         d["task_accepted_time"] = (
@@ -285,10 +298,6 @@ class Event:
         if self.branches_override:
             d["branches_override"] = list(self.branches_override)
 
-        # so that it is JSON serializable (because of Celery tasks)
-        d.pop("_project")
-        d.pop("_base_project")
-        d.pop("_package_config")
         return d
 
     def get_db_trigger(self) -> Optional[AbstractProjectEventDbType]:
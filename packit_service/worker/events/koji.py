@@ -26,6 +26,11 @@ from packit_service.worker.events.event import (
 
 
 class AbstractKojiEvent(AbstractResultEvent):
+    not_serialized = AbstractResultEvent.not_serialized | {
+        "_build_model",
+        "_build_model_searched",
+    }
+
     def __init__(
         self,
         build_id: int,
@@ -69,12 +74,6 @@ class AbstractKojiEvent(AbstractResultEvent):
         """
         return f"{koji_web_url}/koji/taskinfo?taskID={rpm_build_task_id}"
 
-    def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
-        result = super().get_dict()
-        result.pop("_build_model")
-        result.pop("_build_model_searched")
-        return result
-
 
 @use_for_job_config_trigger(trigger_type=JobConfigTriggerType.commit)
 class KojiBuildEvent(AbstractKojiEvent):
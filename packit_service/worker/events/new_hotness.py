@@ -19,6 +19,8 @@ logger = getLogger(__name__)
 # but we still want to report from pre_check of the PullFromUpstreamHandler
 @use_for_job_config_trigger(trigger_type=JobConfigTriggerType.release)
 class NewHotnessUpdateEvent(Event):
+    not_serialized = Event.not_serialized | {"_repo_url"}
+
     def __init__(
         self,
         package_name: str,
@@ -124,6 +126,4 @@ class NewHotnessUpdateEvent(Event):
         d["tag_name"] = self.tag_name
         d["repo_name"] = self.repo_name
         d["repo_namespace"] = self.repo_namespace
-        result = super().get_dict(d)
-        result.pop("_repo_url")
-        return result
+        return super().get_dict(d)
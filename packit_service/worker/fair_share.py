@@ -0,0 +1,137 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Fair share of the Celery queues among the projects.
+
+Every project has a token bucket in Redis, refilled with `FAIR_SHARE_RATE`
+tokens per second up to `FAIR_SHARE_BURST` tokens. Dispatching a handler task
+takes one token. The tasks for which no token is left reserve the future ones
+and are sent with a countdown until the token is there, so the tasks of a project
+dispatching many of them at once are spread over time and the tasks of the other
+projects get into the queues in between.
+"""
+
+import logging
+from math import ceil
+from os import getenv
+from typing import List, Optional, Tuple
+
+import celery
+from celery.canvas import Signature
+from redis.exceptions import RedisError
+
+from packit_service.constants import (
+    DEFAULT_FAIR_SHARE_BURST,
+    DEFAULT_FAIR_SHARE_RATE,
+    FAIR_SHARE_KEY_PREFIX,
+    FAIR_SHARE_MAX_DELAY,
+)
+from packit_service.utils import get_redis
+from packit_service.worker.monitoring import Pushgateway
+
+logger = logging.getLogger(__name__)
+
+# Takes ARGV[3] tokens from the bucket KEYS[1], refilled with ARGV[1] tokens
+# per second up to ARGV[2] tokens. The bucket goes below zero for the tasks
+# that have to wait, but at most by the tokens refilled in ARGV[4] seconds,
+# the longest delay. The tasks over that don't take any token and get
+# the longest delay, so the bucket doesn't stay empty long after a flood.
+# Returns the delays of the tasks and the tokens left.
+TAKE_TOKENS_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local count = tonumber(ARGV[3])
+local min_tokens = -rate * tonumber(ARGV[4])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "timestamp")
+local tokens = tonumber(bucket[1]) or burst
+local timestamp = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - timestamp) * rate)
+
+local delays = {}
+for i = 1, count do
+    tokens = math.max(min_tokens, tokens - 1)
+    delays[i] = tostring(math.max(0, -tokens / rate))
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "timestamp", tostring(now))
+-- the bucket is full again by then
+redis.call("EXPIRE", KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+return {delays, tostring(tokens)}
+"""
+
+
+def take_tokens(
+    project_url: str,
+    count: int,
+    rate: float,
+    burst: int,
+    max_delay: float = FAIR_SHARE_MAX_DELAY,
+) -> Tuple[List[float], float]:
+    """
+    Take tokens for the tasks from the bucket of the project.
+
+    Args:
+        project_url: URL of the project the tasks are for.
+        count: Number of the tasks.
+        rate: Number of tokens the bucket is refilled with per second.
+        burst: Capacity of the bucket.
+        max_delay: Longest delay of a task (in seconds), the tasks over it
+            are delayed by it without taking a token.
+
+    Returns:
+        Delays (in seconds) of the tasks and the tokens left in the bucket,
+        negative if some tasks wait for the tokens.
+    """
+    take = get_redis().register_script(TAKE_TOKENS_SCRIPT)
+    delays, tokens = take(
+        keys=[f"{FAIR_SHARE_KEY_PREFIX}{project_url}"],
+        args=[rate, burst, count, max_delay],
+    )
+    return [float(delay) for delay in delays], float(tokens)
+
+
+def dispatch(project_url: Optional[str], signatures: List[Signature]) -> None:
+    """
+    Send the handler tasks of the project, the ones over its fair share
+    are deferred.
+
+    Args:
+        project_url: URL of the project the tasks are for.
+        signatures: Signatures of the tasks.
+    """
+    rate = float(getenv("FAIR_SHARE_RATE", DEFAULT_FAIR_SHARE_RATE))
+    if rate <= 0 or not project_url or not signatures:
+        # https://docs.celeryq.dev/en/stable/userguide/canvas.html#groups
+        celery.group(signatures).apply_async()
+        return
+
+    burst = int(getenv("FAIR_SHARE_BURST", DEFAULT_FAIR_SHARE_BURST))
+    try:
+        delays, tokens = take_tokens(project_url, len(signatures), rate, burst)
+    except RedisError as ex:
+        logger.warning(f"Failed to take the tokens of {project_url}: {ex!r}")
+        celery.group(signatures).apply_async()
+        return
+
+    now = [sig for sig, delay in zip(signatures, delays) if delay <= 0]
+    deferred = [(sig, delay) for sig, delay in zip(signatures, delays) if delay > 0]
+    if now:
+        celery.group(now).apply_async()
+    for sig, delay in deferred:
+        sig.apply_async(countdown=min(delay, FAIR_SHARE_MAX_DELAY))
+
+    pushgateway = Pushgateway()
+    pushgateway.fair_share_queue_depth.labels(project=project_url).set(
+        max(0, ceil(-tokens))
+    )
+    if deferred:
+        logger.info(
+            f"Deferring {len(deferred)} tasks of {project_url} over its fair share "
+            f"by up to {min(deferred[-1][1], FAIR_SHARE_MAX_DELAY):.0f}s."
+        )
+        pushgateway.fair_share_deferred.labels(project=project_url).inc(len(deferred))
+    pushgateway.push()
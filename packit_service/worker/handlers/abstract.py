@@ -24,10 +24,11 @@ from packit_service.models import (
     AbstractProjectEventDbType,
 )
 from packit_service.sentry_integration import push_scope_to_sentry
-from packit_service.utils import dump_job_config, dump_package_config
+from packit_service.utils import dump_job_config, dump_package_config_by_reference
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.events import Event, EventData
 from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.reporting import StatusReporter
 from packit_service.worker.result import TaskResults
 from packit_service.worker.checker.abstract import Checker
 
@@ -306,7 +307,12 @@ class JobHandler(Handler):
         job_results: Dict[str, TaskResults] = {}
         current_time = datetime.now().strftime(DATETIME_FORMAT)
         result_key = f"{job_type}-{current_time}"
-        job_results[result_key] = self.run_n_clean()
+        try:
+            job_results[result_key] = self.run_n_clean()
+        finally:
+            # don't leave the statuses of the job waiting for the coalescing window,
+            # they have to be sent before the task ends
+            StatusReporter.flush_deferred()
         logger.debug("Job finished!")
 
         for result in job_results.values():
@@ -331,7 +337,7 @@ class JobHandler(Handler):
         return signature(
             cls.task_name.value,
             kwargs={
-                "package_config": dump_package_config(
+                "package_config": dump_package_config_by_reference(
                     event.packages_config.get_package_config_for(job)
                     if event.packages_config
                     else None
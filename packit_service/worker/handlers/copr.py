@@ -3,7 +3,7 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Tuple, Type, Optional
+from typing import List, Tuple, Type, Optional
 
 from celery import signature, Task
 
@@ -22,11 +22,12 @@ from packit_service.constants import (
 from packit_service.models import (
     CoprBuildTargetModel,
     BuildStatus,
+    sa_session_deferred_commit,
 )
 from packit_service.service.urls import get_copr_build_info_url, get_srpm_build_info_url
 from packit_service.utils import (
     dump_job_config,
-    dump_package_config,
+    dump_package_config_by_reference,
     elapsed_seconds,
 )
 from packit_service.worker.checker.abstract import Checker
@@ -35,6 +36,7 @@ from packit_service.worker.checker.copr import (
     AreOwnerAndProjectMatchingJob,
     IsGitForgeProjectAndEventOk,
     BuildNotAlreadyStarted,
+    BuildNotSuperseded,
     IsJobConfigTriggerMatching,
 )
 from packit_service.worker.events import (
@@ -129,7 +131,7 @@ class AbstractCoprBuildReportHandler(
 ):
     @staticmethod
     def get_checkers() -> Tuple[Type[Checker], ...]:
-        return (AreOwnerAndProjectMatchingJob,)
+        return (AreOwnerAndProjectMatchingJob, BuildNotSuperseded)
 
 
 @configured_as(job_type=JobType.copr_build)
@@ -174,8 +176,6 @@ class CoprBuildStartHandler(AbstractCoprBuildReportHandler):
                 f" processed."
             )
 
-        self.set_logs_url()
-
         if self.copr_event.chroot == COPR_SRPM_CHROOT:
             url = get_srpm_build_info_url(self.build.id)
             self.copr_build_helper.report_status_to_all(
@@ -184,12 +184,13 @@ class CoprBuildStartHandler(AbstractCoprBuildReportHandler):
                 url=url,
             )
             msg = "SRPM build in Copr has started..."
-            self.set_start_time()
+            with sa_session_deferred_commit():
+                self.set_logs_url()
+                self.set_start_time()
             return TaskResults(success=True, details={"msg": msg})
 
         self.pushgateway.copr_builds_started.inc()
         url = get_copr_build_info_url(self.build.id)
-        self.build.set_status(BuildStatus.pending)
 
         self.copr_build_helper.report_status_to_all_for_chroot(
             description="RPM build is in progress...",
@@ -198,7 +199,10 @@ class CoprBuildStartHandler(AbstractCoprBuildReportHandler):
             chroot=self.copr_event.chroot,
         )
         msg = f"Build on {self.copr_event.chroot} in copr has started..."
-        self.set_start_time()
+        with sa_session_deferred_commit():
+            self.set_logs_url()
+            self.build.set_status(BuildStatus.pending)
+            self.set_start_time()
         return TaskResults(success=True, details={"msg": msg})
 
 
@@ -252,15 +256,14 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
 
         self.pushgateway.copr_build_end_reported_after_time.observe(reported_after_time)
 
-    def set_built_packages(self):
+    def get_built_packages(self) -> Optional[List]:
+        """Get the built packages from Copr, `None` if they have been already set."""
         if self.build.built_packages:
-            # packages have been already set
-            return
+            return None
 
-        built_packages = self.copr_build_helper.get_built_packages(
+        return self.copr_build_helper.get_built_packages(
             int(self.build.build_id), self.build.target
         )
-        self.build.set_built_packages(built_packages)
 
     def run(self):
         if not self.build:
@@ -285,6 +288,7 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             logger.info(msg)
             return TaskResults(success=True, details={"msg": msg})
 
+        # recorded before reporting, which may fail
         self.set_end_time()
         self.set_srpm_url()
 
@@ -316,8 +320,13 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
         self.report_successful_build()
         self.measure_time_after_reporting()
 
-        self.set_built_packages()
-        self.build.set_status(BuildStatus.success)
+        # get them from Copr first, so that nothing is locked while waiting for it
+        built_packages = self.get_built_packages()
+        with sa_session_deferred_commit():
+            if built_packages is not None:
+                self.build.set_built_packages(built_packages)
+            self.build.set_status(BuildStatus.success)
+        # the tests can see the build as finished from now on
         self.handle_testing_farm()
 
         return TaskResults(success=True, details={})
@@ -375,13 +384,14 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
             )
             return TaskResults(success=False, details={"msg": failed_msg})
 
-        for build in CoprBuildTargetModel.get_all_by_build_id(
-            str(self.copr_event.build_id)
-        ):
-            # from waiting_for_srpm to pending
-            build.set_status(BuildStatus.pending)
+        with sa_session_deferred_commit():
+            for build in CoprBuildTargetModel.get_all_by_build_id(
+                str(self.copr_event.build_id)
+            ):
+                # from waiting_for_srpm to pending
+                build.set_status(BuildStatus.pending)
 
-        self.build.set_status(BuildStatus.success)
+            self.build.set_status(BuildStatus.success)
         self.copr_build_helper.report_status_to_all(
             state=BaseCommitStatus.running,
             description="SRPM build succeeded. Waiting for RPM build to start...",
@@ -410,7 +420,9 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
                     signature(
                         TaskName.testing_farm.value,
                         kwargs={
-                            "package_config": dump_package_config(self.package_config),
+                            "package_config": dump_package_config_by_reference(
+                                self.package_config
+                            ),
                             "job_config": dump_job_config(job_config),
                             "event": event_dict,
                             "build_id": self.build.id,
@@ -26,7 +26,11 @@ from packit_service.service.urls import (
     get_testing_farm_info_url,
     get_copr_build_info_url,
 )
-from packit_service.utils import dump_job_config, dump_package_config, elapsed_seconds
+from packit_service.utils import (
+    dump_job_config,
+    dump_package_config_by_reference,
+    elapsed_seconds,
+)
 from packit_service.worker.checker.abstract import Checker
 from packit_service.worker.checker.testing_farm import (
     CanActorRunJob,
@@ -36,6 +40,7 @@ from packit_service.worker.checker.testing_farm import (
     IsCoprBuildDefined,
     IsIdentifierFromCommentMatching,
     IsLabelFromCommentMatching,
+    IsTestRunNotSuperseded,
 )
 from packit_service.worker.events import (
     TestingFarmResultsEvent,
@@ -164,24 +169,20 @@ class TestingFarmHandler(
             if not run_model.test_run_group
             else run_model.test_run_group
         )
-        runs = []
-        for target, build in builds.items():
-            test_builds = [build] if build else []
-            runs.append(
-                TFTTestRunTargetModel.create(
-                    pipeline_id=None,
-                    identifier=self.job_config.identifier,
-                    commit_sha=self.data.commit_sha,
-                    status=TestingFarmResult.new,
-                    target=target,
-                    web_url=None,
-                    test_run_group=group,
-                    copr_build_targets=test_builds,
-                    # In _payload() we ask TF to test commit_sha of fork (PR's source).
-                    # Store original url. If this proves to work, make it a separate column.
-                    data={"base_project_url": self.project.get_web_url()},
-                )
-            )
+        runs = TFTTestRunTargetModel.bulk_create(
+            targets={
+                target: [build] if build else [] for target, build in builds.items()
+            },
+            pipeline_id=None,
+            identifier=self.job_config.identifier,
+            commit_sha=self.data.commit_sha,
+            status=TestingFarmResult.new,
+            web_url=None,
+            test_run_group=group,
+            # In _payload() we ask TF to test commit_sha of fork (PR's source).
+            # Store original url. If this proves to work, make it a separate column.
+            data={"base_project_url": self.project.get_web_url()},
+        )
 
         return group, runs
 
@@ -192,7 +193,7 @@ class TestingFarmHandler(
         signature(
             TaskName.copr_build.value,
             kwargs={
-                "package_config": dump_package_config(self.package_config),
+                "package_config": dump_package_config_by_reference(self.package_config),
                 "job_config": dump_job_config(
                     job_config=self.testing_farm_job_helper.job_build_or_job_config
                 ),
@@ -374,7 +375,7 @@ class TestingFarmResultsHandler(
 
     @staticmethod
     def get_checkers() -> Tuple[Type[Checker], ...]:
-        return (IsEventForJob,)
+        return (IsEventForJob, IsTestRunNotSuperseded)
 
     @property
     def db_project_event(self) -> Optional[AbstractProjectEventDbType]:
@@ -428,6 +429,7 @@ class TestingFarmResultsHandler(
             )
             self.pushgateway.test_run_finished_time.observe(test_run_time)
 
+        # recorded before reporting, which may fail
         test_run_model.set_web_url(self.log_url)
 
         self.testing_farm_job_helper.report_status_to_tests_for_test_target(
@@ -2,11 +2,27 @@
 # SPDX-License-Identifier: MIT
 
 import collections
+import itertools
 import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from enum import Enum
+from os import getenv
 from requests import HTTPError
 from datetime import datetime, timezone
-from typing import Iterable, Type, Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 import copr.v3
 import requests
@@ -17,7 +33,13 @@ from packit_service.constants import (
     COPR_API_SUCC_STATE,
     COPR_SUCC_STATE,
     TESTING_FARM_API_URL,
+    DEFAULT_BABYSIT_COPR_CONCURRENCY,
+    DEFAULT_BABYSIT_COPR_TIME_BUDGET,
+    DEFAULT_BABYSIT_TF_CONCURRENCY,
+    DEFAULT_BABYSIT_TF_TIME_BUDGET,
     DEFAULT_JOB_TIMEOUT,
+    ITER_IN_CHUNKS_SIZE,
+    TESTING_FARM_API_TIMEOUT,
 )
 from packit_service.models import (
     CoprBuildTargetModel,
@@ -45,13 +67,59 @@ from packit_service.worker.handlers import (
 )
 from packit_service.worker.handlers.copr import AbstractCoprBuildReportHandler
 from packit_service.worker.jobs import SteveJobs
+from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.parser import Parser
 
 logger = logging.getLogger(__name__)
 
 
-def check_pending_testing_farm_runs() -> None:
-    """Checks the status of pending TFT runs and updates it if needed."""
+@dataclass
+class BabysitStats:
+    """
+    Summary of one run of a babysit task.
+
+    Attributes:
+        checked: Number of builds/runs whose state was obtained and processed.
+        updated: Number of builds/runs which have ended and were updated in the DB.
+        skipped: Number of builds/runs left for the next run (time budget exceeded
+            or the external service could not be reached).
+    """
+
+    checked: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+
+def check_pending_testing_farm_runs(
+    concurrency: Optional[int] = None, time_budget: Optional[float] = None
+) -> BabysitStats:
+    """
+    Checks the status of pending TFT runs and updates it if needed.
+
+    The states of the runs are fetched concurrently using a single HTTP session,
+    the finished runs are grouped by the project and commit so that the package
+    config and job configs are obtained only once per group.
+
+    Args:
+        concurrency: How many Testing Farm requests to fetch concurrently,
+            defaults to the BABYSIT_TF_CONCURRENCY env. var.
+        time_budget: Wall-clock time (in seconds) this run can take,
+            defaults to the BABYSIT_TF_TIME_BUDGET env. var.
+
+    Returns:
+        Number of TFT runs checked, updated and skipped.
+    """
+    if concurrency is None:
+        concurrency = int(
+            getenv("BABYSIT_TF_CONCURRENCY", DEFAULT_BABYSIT_TF_CONCURRENCY)
+        )
+    if time_budget is None:
+        time_budget = float(
+            getenv("BABYSIT_TF_TIME_BUDGET", DEFAULT_BABYSIT_TF_TIME_BUDGET)
+        )
+    start = time.monotonic()
+    deadline = start + time_budget
+
     logger.info("Getting pending TFT runs from DB")
     current_time = datetime.now(timezone.utc)
     not_completed = (
@@ -60,8 +128,8 @@ def check_pending_testing_farm_runs() -> None:
         TestingFarmResult.running,
     )
     pending_test_runs = TFTTestRunTargetModel.get_all_by_status(*not_completed)
+    runs_to_check = []
     for run in pending_test_runs:
-        logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
         # .submitted_time can be None, we'll set it later
         if run.submitted_time:
             elapsed = elapsed_seconds(begin=run.submitted_time, end=current_time)
@@ -73,65 +141,189 @@ def check_pending_testing_farm_runs() -> None:
                 )
                 run.set_status(TestingFarmResult.error)
                 continue
-        run_url = f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}"
-        response = requests.get(run_url)
-        if not response.ok:
-            logger.info(
-                f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
-                f"Status code {response.status_code}. Reason: {response.reason}."
+        runs_to_check.append(run)
+
+    stats = BabysitStats()
+    if not runs_to_check:
+        return stats
+
+    # (project URL, commit SHA, PR ID, job config trigger type) -> events
+    events_grouped = collections.defaultdict(list)
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency, max_retries=3)
+        session.mount("https://", adapter)
+
+        for run, response in fetch_testing_farm_requests(
+            session, runs_to_check, concurrency=concurrency, deadline=deadline
+        ):
+            stats.checked += 1
+            if not response.ok:
+                logger.info(
+                    f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
+                    f"Status code {response.status_code}. Reason: {response.reason}."
+                )
+                run.set_status(TestingFarmResult.error)
+                continue
+
+            details = response.json()
+            (
+                project_url,
+                ref,
+                result,
+                summary,
+                copr_build_id,
+                copr_chroot,
+                compose,
+                log_url,
+                created,
+                identifier,
+            ) = Parser.parse_data_from_testing_farm(run, details)
+
+            logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {result}.")
+            if result in not_completed:
+                logger.debug("Skip updating a pipeline which is not yet completed.")
+                continue
+
+            event = TestingFarmResultsEvent(
+                pipeline_id=details["id"],
+                result=result,
+                compose=compose,
+                summary=summary,
+                log_url=log_url,
+                copr_build_id=copr_build_id,
+                copr_chroot=copr_chroot,
+                commit_sha=ref,
+                project_url=project_url,
+                created=created,
+                identifier=identifier,
             )
-            run.set_status(TestingFarmResult.error)
+            events_grouped[
+                (project_url, ref, event.pr_id, event.job_config_trigger_type)
+            ].append(event)
+
+    for events in events_grouped.values():
+        if time.monotonic() >= deadline:
+            # leave the rest for the next run so that the runs don't overlap
+            stats.checked -= len(events)
             continue
+        stats.updated += update_testing_farm_runs(events)
+    stats.skipped = len(runs_to_check) - stats.checked
 
-        details = response.json()
-        (
-            project_url,
-            ref,
-            result,
-            summary,
-            copr_build_id,
-            copr_chroot,
-            compose,
-            log_url,
-            created,
-            identifier,
-        ) = Parser.parse_data_from_testing_farm(run, details)
-
-        logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {result}.")
-        if result in not_completed:
-            logger.debug("Skip updating a pipeline which is not yet completed.")
-            continue
+    sweep_time = time.monotonic() - start
+    logger.info(
+        f"Pending TFT runs: {stats.checked} checked, {stats.updated} updated, "
+        f"{stats.skipped} skipped in {sweep_time:.1f}s."
+    )
+    pushgateway = Pushgateway()
+    pushgateway.tf_runs_sweep_time.observe(sweep_time)
+    pushgateway.push()
+    return stats
+
+
+def fetch_testing_farm_requests(
+    session: requests.Session,
+    runs: List["TFTTestRunTargetModel"],
+    concurrency: int,
+    deadline: float,
+) -> Iterator[Tuple["TFTTestRunTargetModel", requests.Response]]:
+    """
+    Fetches the Testing Farm requests of the given runs using a bounded pool
+    of threads and yields them as they come so that they can be processed
+    while the rest is still being fetched.
 
-        event = TestingFarmResultsEvent(
-            pipeline_id=details["id"],
-            result=result,
-            compose=compose,
-            summary=summary,
-            log_url=log_url,
-            copr_build_id=copr_build_id,
-            copr_chroot=copr_chroot,
-            commit_sha=ref,
-            project_url=project_url,
-            created=created,
-            identifier=identifier,
-        )
+    Runs whose request can't be obtained (e.g. connection error or timeout)
+    or that are not fetched before the deadline are not yielded and
+    will be checked during the next run.
 
-        packages_config = event.get_packages_config()
-        if not packages_config:
-            logger.info(f"No config found for {run.pipeline_id}. Skipping.")
-            continue
+    Args:
+        session: HTTP session shared by all the requests.
+        runs: Runs to fetch the Testing Farm requests for.
+        concurrency: Maximum number of concurrent requests.
+        deadline: Value of `time.monotonic()` after which no more runs are fetched.
+
+    Yields:
+        Pairs of the run and the response from the Testing Farm API.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="babysit-tf"
+    )
+    in_flight: Dict[Future, "TFTTestRunTargetModel"] = {}
+    runs_iter = iter(runs)
+
+    def submit_runs():
+        while len(in_flight) < concurrency:
+            run = next(runs_iter, None)
+            if run is None:
+                return
+            logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
+            future = executor.submit(
+                session.get,
+                f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}",
+                timeout=TESTING_FARM_API_TIMEOUT,
+            )
+            in_flight[future] = run
+
+    try:
+        submit_runs()
+        while in_flight:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                logger.info("Time budget for checking TFT runs exceeded.")
+                break
+
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                run = in_flight.pop(future)
+                try:
+                    response = future.result()
+                except Exception as ex:
+                    logger.warning(
+                        f"Failed to obtain state of TF pipeline {run.pipeline_id}: "
+                        f"{ex!r}"
+                    )
+                    continue
+                yield run, response
+
+            submit_runs()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def update_testing_farm_runs(events: List[TestingFarmResultsEvent]) -> int:
+    """
+    Runs the TestingFarmResultsHandler for the given finished TFT runs.
+
+    All the events need to share the project, commit and trigger so that
+    the package config and job configs are obtained only once.
+
+    Args:
+        events: Events for the finished TFT runs.
 
-        job_configs = SteveJobs(event).get_config_for_handler_kls(
-            handler_kls=TestingFarmResultsHandler,
+    Returns:
+        Number of TFT runs which were updated.
+    """
+    first_event = events[0]
+    packages_config = first_event.packages_config
+    if not packages_config:
+        logger.info(
+            f"No config found for {[event.pipeline_id for event in events]}. Skipping."
         )
+        return 0
+
+    job_configs = SteveJobs(first_event).get_config_for_handler_kls(
+        handler_kls=TestingFarmResultsHandler,
+    )
+
+    updated = 0
+    for event in events:
+        # reuse the config found for the first event of the group
+        event._package_config = packages_config
+        event._package_config_searched = True
 
         event_dict = event.get_dict()
+        handled = False
         for job_config in job_configs:
-            package_config = (
-                event.packages_config.get_package_config_for(job_config)
-                if event.packages_config
-                else None
-            )
+            package_config = packages_config.get_package_config_for(job_config)
             handler = TestingFarmResultsHandler(
                 package_config=package_config,
                 job_config=job_config,
@@ -140,18 +332,220 @@ def check_pending_testing_farm_runs() -> None:
             # check for identifiers equality
             if handler.pre_check(package_config, job_config, event_dict):
                 handler.run_job()
+                handled = True
+        updated += handled
+    return updated
+
+
+def check_pending_copr_builds(
+    concurrency: Optional[int] = None, time_budget: Optional[float] = None
+) -> BabysitStats:
+    """
+    Checks the status of pending copr builds and updates it if needed.
+
+    Args:
+        concurrency: How many Copr builds to check concurrently,
+            defaults to the BABYSIT_COPR_CONCURRENCY env. var.
+        time_budget: Wall-clock time (in seconds) this run can take,
+            defaults to the BABYSIT_COPR_TIME_BUDGET env. var.
 
+    Returns:
+        Number of Copr builds checked, updated and skipped.
+    """
+    if concurrency is None:
+        concurrency = int(
+            getenv("BABYSIT_COPR_CONCURRENCY", DEFAULT_BABYSIT_COPR_CONCURRENCY)
+        )
+    if time_budget is None:
+        time_budget = float(
+            getenv("BABYSIT_COPR_TIME_BUDGET", DEFAULT_BABYSIT_COPR_TIME_BUDGET)
+        )
+    deadline = time.monotonic() + time_budget
+
+    stats = BabysitStats()
+    for builds_grouped_by_id in iter_copr_builds_grouped_by_id(
+        CoprBuildTargetModel.get_all_by_status(BuildStatus.pending)
+    ):
+        if time.monotonic() >= deadline:
+            # the rest of the builds is still loaded to be counted as skipped
+            stats.skipped += len(builds_grouped_by_id)
+            continue
+
+        if concurrency > 1:
+            batch_stats = check_copr_builds_concurrently(
+                builds_grouped_by_id, concurrency=concurrency, deadline=deadline
+            )
+            stats.checked += batch_stats.checked
+            stats.updated += batch_stats.updated
+            stats.skipped += batch_stats.skipped
+            continue
+
+        for build_id, builds in builds_grouped_by_id.items():
+            if time.monotonic() >= deadline:
+                stats.skipped += 1
+                continue
+            stats.checked += 1
+            if update_copr_builds(build_id, builds):
+                stats.updated += 1
+
+    logger.info(
+        f"Pending Copr builds: {stats.checked} checked, {stats.updated} updated, "
+        f"{stats.skipped} skipped."
+    )
+    return stats
 
-def check_pending_copr_builds() -> None:
-    """Checks the status of pending copr builds and updates it if needed."""
-    pending_copr_builds = CoprBuildTargetModel.get_all_by_status(BuildStatus.pending)
-    builds_grouped_by_id = collections.defaultdict(list)
-    for build in pending_copr_builds:
+
+def iter_copr_builds_grouped_by_id(
+    builds: Iterable["CoprBuildTargetModel"],
+) -> Iterator[Dict[int, List["CoprBuildTargetModel"]]]:
+    """
+    Groups the builds by the Copr build ID, in batches of about
+    `ITER_IN_CHUNKS_SIZE` builds, so that the builds of one batch can be checked
+    before the next batch is loaded.
+
+    Args:
+        builds: Builds ordered by the Copr build ID.
+
+    Yields:
+        Builds grouped by the Copr build ID, all the builds of a Copr build
+        being in the same batch.
+    """
+    batch: Dict[int, List[CoprBuildTargetModel]] = {}
+    batch_size = 0
+    for build_id, group in itertools.groupby(builds, key=lambda b: b.build_id):
+        group = list(group)
         # our DB uses str(build_id) but our code expects int(build_id)
-        builds_grouped_by_id[int(build.build_id)].append(build)
+        batch.setdefault(int(build_id), []).extend(group)
+        batch_size += len(group)
+        if batch_size >= ITER_IN_CHUNKS_SIZE:
+            yield batch
+            batch, batch_size = {}, 0
+    if batch:
+        yield batch
+
+
+def check_copr_builds_concurrently(
+    builds_grouped_by_id: Dict[int, List["CoprBuildTargetModel"]],
+    concurrency: int,
+    deadline: float,
+) -> BabysitStats:
+    """
+    Checks the given copr builds using a bounded pool of threads.
+
+    Only the blocking Copr API calls are done in the pool, the builds are updated
+    (and the handlers are run) in the calling thread so that the SQLAlchemy session
+    is never shared between threads. Once the whole Copr build is obtained,
+    the requests for all of its chroots are issued together.
+
+    Builds that are not processed before the deadline are skipped and
+    will be checked during the next run.
+
+    Args:
+        builds_grouped_by_id: Builds from the DB grouped by the Copr build ID.
+        concurrency: Maximum number of concurrent Copr API calls.
+        deadline: Value of `time.monotonic()` after which no more builds are processed.
+
+    Returns:
+        Number of Copr builds checked, updated and skipped.
+    """
+    stats = BabysitStats()
+    copr_client = CoprClient.create_from_config_file()
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="babysit-copr"
+    )
+    # future -> (Copr build ID, chroot), chroot is None for the whole Copr build
+    in_flight: Dict[Future, Tuple[int, Optional[str]]] = {}
+    copr_builds: Dict[int, Any] = {}
+    chroot_builds: Dict[int, Dict[str, Any]] = collections.defaultdict(dict)
+    chroots_to_fetch: Dict[int, int] = {}
+    failed: Set[int] = set()
+    build_ids = iter(builds_grouped_by_id)
+
+    def submit_builds():
+        # Don't queue all the builds at once so that the chroots of already
+        # obtained builds don't wait for the rest of the builds.
+        while len(in_flight) < concurrency:
+            build_id = next(build_ids, None)
+            if build_id is None:
+                return
+            future = executor.submit(get_copr_build, copr_client, build_id)
+            in_flight[future] = (build_id, None)
 
-    for build_id, builds in builds_grouped_by_id.items():
-        update_copr_builds(build_id, builds)
+    try:
+        submit_builds()
+        while in_flight:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                logger.info("Time budget for checking Copr builds exceeded.")
+                break
+
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                build_id, chroot = in_flight.pop(future)
+                if build_id in failed:
+                    continue
+                try:
+                    result = future.result()
+                except Exception as ex:
+                    logger.warning(
+                        f"Failed to get the state of Copr build {build_id} "
+                        f"(chroot: {chroot}): {ex!r}"
+                    )
+                    failed.add(build_id)
+                    continue
+
+                builds = builds_grouped_by_id[build_id]
+                if chroot is None:
+                    copr_builds[build_id] = result
+                    chroots = (
+                        {
+                            build.target
+                            for build in builds
+                            if build.status
+                            in (BuildStatus.pending, BuildStatus.waiting_for_srpm)
+                        }
+                        if result and (result.ended_on or result.started_on)
+                        else set()
+                    )
+                    chroots_to_fetch[build_id] = len(chroots)
+                    for target in chroots:
+                        chroot_future = executor.submit(
+                            copr_client.build_chroot_proxy.get, build_id, target
+                        )
+                        in_flight[chroot_future] = (build_id, target)
+                else:
+                    chroot_builds[build_id][chroot] = result
+                    chroots_to_fetch[build_id] -= 1
+
+                if chroots_to_fetch[build_id] == 0:
+                    stats.checked += 1
+                    if update_copr_builds_with_copr_data(
+                        build_id,
+                        builds,
+                        build_copr=copr_builds[build_id],
+                        get_chroot_build=chroot_builds[build_id].__getitem__,
+                    ):
+                        stats.updated += 1
+
+            submit_builds()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    stats.skipped = len(builds_grouped_by_id) - stats.checked
+    return stats
+
+
+def get_copr_build(copr_client: CoprClient, build_id: int) -> Optional[Any]:
+    """
+    Get the data of the Copr build.
+
+    Returns:
+        Copr build data or None if the build no longer exists in Copr.
+    """
+    try:
+        return copr_client.build_proxy.get(build_id)
+    except copr.v3.CoprNoResultException:
+        return None
 
 
 def check_copr_build(build_id: int) -> bool:
@@ -193,9 +587,39 @@ def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"])
         False signals the need to retry again.
     """
     copr_client = CoprClient.create_from_config_file()
-    try:
-        build_copr = copr_client.build_proxy.get(build_id)
-    except copr.v3.CoprNoResultException:
+    return update_copr_builds_with_copr_data(
+        build_id,
+        builds,
+        build_copr=get_copr_build(copr_client, build_id),
+        get_chroot_build=lambda target: copr_client.build_chroot_proxy.get(
+            build_id, target
+        ),
+    )
+
+
+def update_copr_builds_with_copr_data(
+    build_id: int,
+    builds: Iterable["CoprBuildTargetModel"],
+    build_copr: Optional[Any],
+    get_chroot_build: Callable[[str], Any],
+) -> bool:
+    """
+    Updates the state of copr builds using the data obtained from Copr.
+
+    See `update_copr_builds` for details.
+
+    Args:
+        build_id: ID of the copr build to update.
+        builds: List of builds corresponding to the given ``build_id``.
+        build_copr: Data of the whole copr build from the copr API,
+            None if the build no longer exists.
+        get_chroot_build: Returns the data of the build chroot with the given name.
+
+    Returns:
+        Whether the run was successful and the build has ended,
+        False signals the need to retry again.
+    """
+    if build_copr is None:
         logger.info(
             f"Copr build {build_id} no longer available. Setting it to error status and "
             f"not checking it anymore."
@@ -227,7 +651,7 @@ def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"])
                 "things were taken care of already, skipping."
             )
             continue
-        chroot_build = copr_client.build_chroot_proxy.get(build_id, build.target)
+        chroot_build = get_chroot_build(build.target)
         update_copr_build_state(build, build_copr, chroot_build)
     # Builds which we ran CoprBuildStartHandler for still need to be monitored.
     return bool(build_copr.ended_on)
@@ -24,6 +24,7 @@ from packit_service.models import (
     BuildStatus,
     ProjectReleaseModel,
     GitBranchModel,
+    sa_session_deferred_commit,
 )
 from packit_service.service.urls import get_srpm_build_info_url
 from packit_service.trigger_mapping import are_job_types_same
@@ -497,11 +498,12 @@ class BaseBuildJobHelper(BaseJobHelper):
         extra_logs: str = ""
         results: Optional[TaskResults] = None
 
-        self._srpm_model, self.run_model = SRPMBuildModel.create_with_new_run(
-            project_event_model=self.db_project_event,
-            commit_sha=self.metadata.commit_sha,
-        )
-        self._srpm_model.set_start_time(datetime.datetime.utcnow())
+        with sa_session_deferred_commit():
+            self._srpm_model, self.run_model = SRPMBuildModel.create_with_new_run(
+                project_event_model=self.db_project_event,
+                commit_sha=self.metadata.commit_sha,
+            )
+            self._srpm_model.set_start_time(datetime.datetime.utcnow())
 
         if (
             self.job_config.release_suffix == ""  # TODO remove eventually
@@ -568,10 +570,11 @@ class BaseBuildJobHelper(BaseJobHelper):
                 "\nPlease join #packit on irc.libera.chat if you need help with the error above.\n"
             )
         pg_status = BuildStatus.success if srpm_success else BuildStatus.failure
-        self._srpm_model.set_status(pg_status)
-
+        # the logs may be uploaded to the log store, nothing is locked meanwhile
         self._srpm_model.set_logs(srpm_logs)
-        self._srpm_model.set_end_time(datetime.datetime.utcnow())
+        with sa_session_deferred_commit():
+            self._srpm_model.set_status(pg_status)
+            self._srpm_model.set_end_time(datetime.datetime.utcnow())
 
         return results
 
@@ -496,6 +496,7 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
 
         group = CoprBuildGroupModel.create(self.run_model)
         unprocessed_chroots = []
+        chroots = []
         for chroot in self.build_targets:
             if chroot not in self.available_chroots:
                 self.report_status_to_all_for_chroot(
@@ -508,17 +509,19 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
                 unprocessed_chroots.append(chroot)
                 continue
 
-            CoprBuildTargetModel.create(
-                build_id=None,
-                commit_sha=self.metadata.commit_sha,
-                project_name=self.job_project,
-                owner=self.job_owner,
-                web_url=None,
-                target=chroot,
-                status=BuildStatus.waiting_for_srpm,
-                copr_build_group=group,
-                task_accepted_time=self.metadata.task_accepted_time,
-            )
+            chroots.append(chroot)
+
+        CoprBuildTargetModel.bulk_create(
+            targets=chroots,
+            build_id=None,
+            commit_sha=self.metadata.commit_sha,
+            project_name=self.job_project,
+            owner=self.job_owner,
+            web_url=None,
+            status=BuildStatus.waiting_for_srpm,
+            copr_build_group=group,
+            task_accepted_time=self.metadata.task_accepted_time,
+        )
 
         if unprocessed_chroots:
             unprocessed = "\n".join(sorted(unprocessed_chroots))
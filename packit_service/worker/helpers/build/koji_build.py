@@ -115,6 +115,7 @@ class KojiBuildJobHelper(BaseBuildJobHelper):
 
         errors: Dict[str, str] = {}
         build_group = KojiBuildGroupModel.create(run_model=self.run_model)
+        targets = []
         for target in self.build_targets:
             if target not in self.supported_koji_targets:
                 msg = f"Target not supported: {target}"
@@ -127,15 +128,18 @@ class KojiBuildJobHelper(BaseBuildJobHelper):
                 errors[target] = msg
                 continue
 
-            koji_build = KojiBuildTargetModel.create(
-                build_id=None,
-                commit_sha=self.metadata.commit_sha,
-                web_url=None,
-                target=target,
-                status="pending",
-                scratch=self.is_scratch,
-                koji_build_group=build_group,
-            )
+            targets.append(target)
+
+        koji_builds = KojiBuildTargetModel.bulk_create(
+            targets=targets,
+            build_id=None,
+            commit_sha=self.metadata.commit_sha,
+            web_url=None,
+            status="pending",
+            scratch=self.is_scratch,
+            koji_build_group=build_group,
+        )
+        for target, koji_build in zip(targets, koji_builds):
             try:
                 build_id, web_url = self.run_build(target=target)
             except Exception as ex:
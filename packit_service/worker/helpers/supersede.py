@@ -0,0 +1,113 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Superseding of the builds and tests of outdated commits of pull requests.
+
+Once a new commit is pushed to a pull request, the builds and tests
+of the previous commits are no longer interesting for anyone.
+They are marked as superseded in the DB (so that their results are not
+reported anymore) and cancelled in Copr and Testing Farm.
+"""
+
+import logging
+from typing import Iterable
+
+import copr.v3
+import requests
+from copr.v3 import Client as CoprClient
+from ogr.abstract import GitProject
+
+from packit_service.config import ServiceConfig
+from packit_service.constants import TESTING_FARM_API_TIMEOUT
+from packit_service.models import PullRequestModel
+
+logger = logging.getLogger(__name__)
+
+
+def supersede_pull_request_runs(
+    pr: PullRequestModel, commit_sha: str, project: GitProject
+) -> None:
+    """
+    Supersede the pending builds and tests of the previous commits of the PR
+    and cancel them.
+
+    Nothing is superseded unless the commit is still the head of the PR,
+    the event could have been delivered late, redelivered or be about
+    reopening the PR with an older head.
+
+    Cancelling is best effort, failures are only logged, the superseded
+    entries are not reported anyway.
+
+    Args:
+        pr: Pull request from the DB.
+        commit_sha: Commit of the PR the event is about.
+        project: Project of the PR to check its head commit in.
+    """
+    if not pr.has_pending_runs_of_other_commits(commit_sha):
+        return
+    if (head_commit := project.get_pr(pr.pr_id).head_commit) != commit_sha:
+        logger.info(
+            f"Commit {commit_sha} is not the head of {pr} anymore ({head_commit}), "
+            "not superseding anything."
+        )
+        return
+
+    copr_build_ids, tf_request_ids = pr.supersede_pending_runs(commit_sha)
+    if not (copr_build_ids or tf_request_ids):
+        return
+
+    logger.info(
+        f"New commit {commit_sha} of {pr}, superseded "
+        f"Copr builds: {copr_build_ids}, Testing Farm requests: {tf_request_ids}"
+    )
+    if copr_build_ids:
+        cancel_copr_builds(copr_build_ids)
+    if tf_request_ids:
+        cancel_testing_farm_requests(tf_request_ids)
+
+
+def cancel_copr_builds(build_ids: Iterable[str]) -> None:
+    """Cancel the Copr builds, the already finished ones are skipped by Copr."""
+    copr_client = CoprClient.create_from_config_file()
+    for build_id in build_ids:
+        try:
+            copr_client.build_proxy.cancel(int(build_id))
+        except copr.v3.CoprException as ex:
+            logger.debug(f"Failed to cancel Copr build {build_id}: {ex!r}")
+
+
+def cancel_testing_farm_requests(request_ids: Iterable[str]) -> None:
+    """
+    Cancel the Testing Farm requests.
+
+    The request can be cancelled only with the API key it was submitted with
+    and we don't store which one was used, so try both of them.
+    """
+    service_config = ServiceConfig.get_service_config()
+    api_keys = [
+        key
+        for key in (
+            service_config.testing_farm_secret,
+            service_config.internal_testing_farm_secret,
+        )
+        if key
+    ]
+    with requests.Session() as session:
+        for request_id in request_ids:
+            for api_key in api_keys:
+                try:
+                    response = session.delete(
+                        f"{service_config.testing_farm_api_url}requests/{request_id}",
+                        json={"api_key": api_key},
+                        timeout=TESTING_FARM_API_TIMEOUT,
+                    )
+                except requests.RequestException as ex:
+                    logger.debug(
+                        f"Failed to cancel Testing Farm request {request_id}: {ex!r}"
+                    )
+                    break
+                if response.ok:
+                    break
+            else:
+                logger.debug(f"Testing Farm request {request_id} was not cancelled.")
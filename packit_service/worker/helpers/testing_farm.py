@@ -3,7 +3,20 @@
 
 import logging
 import re
-from typing import Dict, Any, Optional, Set, List, Union, Tuple, Callable
+import time
+from functools import lru_cache
+from threading import Lock, Thread
+from typing import (
+    Dict,
+    Any,
+    Optional,
+    Set,
+    List,
+    Union,
+    Tuple,
+    Callable,
+    FrozenSet,
+)
 
 import requests
 
@@ -22,6 +35,8 @@ from packit_service.constants import (
     PUBLIC_TF_ARCHITECTURE_LIST,
     INTERNAL_TF_ARCHITECTURE_LIST,
     TESTING_FARM_ARTIFACTS_KEY,
+    TESTING_FARM_COMPOSES_REFRESH_INTERVAL,
+    TESTING_FARM_COMPOSES_MAX_AGE,
 )
 from packit_service.models import (
     CoprBuildTargetModel,
@@ -52,6 +67,156 @@ from packit_service.worker.result import TaskResults
 logger = logging.getLogger(__name__)
 
 
+class ComposeCatalog:
+    """
+    Lists of the composes available in Testing Farm, shared by all the jobs
+    of the worker process.
+
+    A list older than `TESTING_FARM_COMPOSES_REFRESH_INTERVAL` is refreshed
+    in the background and the cached one is used in the meantime. Only a list
+    older than `TESTING_FARM_COMPOSES_MAX_AGE` (or a missing one) is fetched
+    before being used and if Testing Farm fails to provide it, the cached one
+    is used.
+    """
+
+    # URL of the composes endpoint -> (composes, time of fetching)
+    _composes: Dict[str, Tuple[FrozenSet[str], float]] = {}
+    _refreshing: Set[str] = set()
+    _lock = Lock()
+
+    @classmethod
+    def get(
+        cls, url: str, fetch: Callable[[], Optional[Set[str]]]
+    ) -> Optional[FrozenSet[str]]:
+        """
+        Args:
+            url: URL of the composes endpoint, identifies the list.
+            fetch: Callable fetching the list from Testing Farm,
+                returns `None` if Testing Farm fails to provide it.
+
+        Returns:
+            Set of the available composes or `None` if there is no list
+            and Testing Farm fails to provide it.
+        """
+        with cls._lock:
+            composes, fetched_at = cls._composes.get(url, (None, 0.0))
+
+        age = time.monotonic() - fetched_at
+        if composes is None or age > TESTING_FARM_COMPOSES_MAX_AGE:
+            return cls._refresh(url, fetch) or composes
+
+        if age > TESTING_FARM_COMPOSES_REFRESH_INTERVAL:
+            cls._refresh_in_background(url, fetch)
+        return composes
+
+    @classmethod
+    def _refresh(
+        cls, url: str, fetch: Callable[[], Optional[Set[str]]]
+    ) -> Optional[FrozenSet[str]]:
+        try:
+            composes = fetch()
+        except PackitException as ex:
+            logger.warning(f"Failed to fetch the composes from {url}: {ex}")
+            return None
+
+        if composes is None:
+            return None
+
+        composes = frozenset(composes)
+        with cls._lock:
+            cls._composes[url] = (composes, time.monotonic())
+        return composes
+
+    @classmethod
+    def _refresh_in_background(
+        cls, url: str, fetch: Callable[[], Optional[Set[str]]]
+    ) -> None:
+        with cls._lock:
+            if url in cls._refreshing:
+                return
+            cls._refreshing.add(url)
+
+        def refresh():
+            try:
+                cls._refresh(url, fetch)
+            finally:
+                with cls._lock:
+                    cls._refreshing.discard(url)
+
+        Thread(target=refresh, name="tf-composes", daemon=True).start()
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._composes.clear()
+
+
+@lru_cache(maxsize=1024)
+def _distro2compose(target: str, composes: FrozenSet[str], internal: bool) -> str:
+    """
+    Map the target to the name of the compose, see `distro2compose`.
+
+    The result depends only on the arguments and the lists of composes
+    are shared, so the mapping is done only once per target.
+    """
+    if target in composes:
+        logger.debug(f"Target {target} is directly in the compose list.")
+        return target
+
+    distro, arch = target.rsplit("-", 1)
+
+    # we append -x86_64 to target by default
+    # when that happens and the user precisely specified the compose via target
+    # we should just use it instead of continuing below with our logic
+    # some of those changes can change the target and result in a failure
+    if distro in composes and arch == "x86_64":
+        logger.debug(f"Distro {distro} is directly in the compose list for x86_64.")
+        return distro
+
+    compose = (
+        distro.title()
+        .replace("Centos", "CentOS")
+        .replace("Rhel", "RHEL")
+        .replace("Oraclelinux", "Oracle-Linux")
+        .replace("Latest", "latest")
+    )
+    if compose == "CentOS-Stream":
+        compose = "CentOS-Stream-8"
+
+    if arch == "aarch64":
+        # TF has separate composes for aarch64 architecture
+        compose += "-aarch64"
+
+    if internal:
+        if compose in composes:
+            return compose
+
+        if compose == "Fedora-Rawhide":
+            compose = "Fedora-Rawhide-Nightly"
+        elif compose.startswith("Fedora-"):
+            compose = f"{compose}-Updated"
+        elif compose.startswith("CentOS") and len(compose) == len("CentOS-7"):
+            # Attach latest suffix only to major versions:
+            # CentOS-7 -> CentOS-7-latest
+            # CentOS-8 -> CentOS-8-latest
+            # CentOS-8.4 -> CentOS-8.4
+            # CentOS-8-latest -> CentOS-8-latest
+            # CentOS-Stream-8 -> CentOS-Stream-8
+            compose = f"{compose}-latest"
+        elif compose == "RHEL-6":
+            compose = "RHEL-6-LatestReleased"
+        elif compose == "RHEL-7":
+            compose = "RHEL-7-LatestReleased"
+        elif compose == "RHEL-8":
+            compose = "RHEL-8.5.0-Nightly"
+        elif compose == "Oracle-Linux-7":
+            compose = "Oracle-Linux-7.9"
+        elif compose == "Oracle-Linux-8":
+            compose = "Oracle-Linux-8.6"
+
+    return compose
+
+
 class CommentArguments:
     """
     Parse arguments from trigger comment and provide the attributes to Testing Farm helper.
@@ -315,9 +480,10 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
         return self._copr_builds_from_other_pr
 
     @property
-    def available_composes(self) -> Optional[Set[str]]:
+    def available_composes(self) -> Optional[FrozenSet[str]]:
         """
-        Fetches available composes from the Testing Farm endpoint.
+        Available composes from the Testing Farm endpoint,
+        cached by the `ComposeCatalog`.
 
         Returns:
             Set of all available composes or `None` if error occurs.
@@ -325,7 +491,18 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
         endpoint = (
             f"composes/{'redhat' if self.job_config.use_internal_tf else 'public'}"
         )
+        return ComposeCatalog.get(
+            url=f"{self.tft_api_url}{endpoint}",
+            fetch=lambda: self.fetch_composes(endpoint),
+        )
+
+    def fetch_composes(self, endpoint: str) -> Optional[Set[str]]:
+        """
+        Fetches available composes from the Testing Farm endpoint.
 
+        Returns:
+            Set of all available composes or `None` if error occurs.
+        """
         response = self.send_testing_farm_request(endpoint=endpoint)
         if response.status_code != 200:
             return None
@@ -638,62 +815,9 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
             )
             return None
 
-        if target in composes:
-            logger.debug(f"Target {target} is directly in the compose list.")
-            return target
-
-        distro, arch = target.rsplit("-", 1)
-
-        # we append -x86_64 to target by default
-        # when that happens and the user precisely specified the compose via target
-        # we should just use it instead of continuing below with our logic
-        # some of those changes can change the target and result in a failure
-        if distro in composes and arch == "x86_64":
-            logger.debug(f"Distro {distro} is directly in the compose list for x86_64.")
-            return distro
-
-        compose = (
-            distro.title()
-            .replace("Centos", "CentOS")
-            .replace("Rhel", "RHEL")
-            .replace("Oraclelinux", "Oracle-Linux")
-            .replace("Latest", "latest")
-        )
-        if compose == "CentOS-Stream":
-            compose = "CentOS-Stream-8"
-
-        if arch == "aarch64":
-            # TF has separate composes for aarch64 architecture
-            compose += "-aarch64"
-
-        if self.job_config.use_internal_tf:
-            if compose in composes:
-                return compose
-
-            if compose == "Fedora-Rawhide":
-                compose = "Fedora-Rawhide-Nightly"
-            elif compose.startswith("Fedora-"):
-                compose = f"{compose}-Updated"
-            elif compose.startswith("CentOS") and len(compose) == len("CentOS-7"):
-                # Attach latest suffix only to major versions:
-                # CentOS-7 -> CentOS-7-latest
-                # CentOS-8 -> CentOS-8-latest
-                # CentOS-8.4 -> CentOS-8.4
-                # CentOS-8-latest -> CentOS-8-latest
-                # CentOS-Stream-8 -> CentOS-Stream-8
-                compose = f"{compose}-latest"
-            elif compose == "RHEL-6":
-                compose = "RHEL-6-LatestReleased"
-            elif compose == "RHEL-7":
-                compose = "RHEL-7-LatestReleased"
-            elif compose == "RHEL-8":
-                compose = "RHEL-8.5.0-Nightly"
-            elif compose == "Oracle-Linux-7":
-                compose = "Oracle-Linux-7.9"
-            elif compose == "Oracle-Linux-8":
-                compose = "Oracle-Linux-8.6"
-
+        compose = _distro2compose(target, composes, self.job_config.use_internal_tf)
         if compose not in composes:
+            distro = target.rsplit("-", 1)[0]
             msg = (
                 f"The compose {compose} (from target {distro}) is not in the list of "
                 f"available composes:\n{composes}. "
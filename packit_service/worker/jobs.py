@@ -6,25 +6,36 @@ We love you, Steve Jobs.
 """
 import logging
 from datetime import datetime
+from os import getenv
 from functools import cached_property
 from typing import Optional, Union, Callable
 from typing import List, Set, Type, Tuple
 from re import match
-
-import celery
+from uuid import uuid4
 
 from ogr.exceptions import GithubAppNotInstalledError
 from packit.config import JobConfig, JobType, JobConfigTriggerType
 from packit.config.job_config import DEPRECATED_JOB_TYPES
 from packit.utils import nested_get
+from packit_service.celerizer import celery_app
 from packit_service.config import PackageConfig, PackageConfigGetter, ServiceConfig
 from packit_service.constants import (
+    CELERY_DEFAULT_MAIN_TASK_NAME,
     DOCS_CONFIGURATION_URL,
     TASK_ACCEPTED,
     COMMENT_REACTION,
     PACKIT_VERIFY_FAS_COMMAND,
 )
-from packit_service.utils import get_packit_commands_from_comment, elapsed_seconds
+from packit_service.utils import (
+    elapsed_seconds,
+    get_event_hash,
+    get_packit_commands_from_comment,
+    is_latest_debounced_event,
+    register_delivery,
+    set_latest_debounced_event,
+    unregister_delivery,
+)
+from packit_service.worker import fair_share
 from packit_service.worker.allowlist import Allowlist
 from packit_service.worker.events import (
     Event,
@@ -33,11 +44,19 @@ from packit_service.worker.events import (
     InstallationEvent,
     CheckRerunEvent,
     IssueCommentEvent,
+    MergeRequestGitlabEvent,
+    PullRequestGithubEvent,
+    PullRequestPagureEvent,
+    PushGitHubEvent,
+    PushGitlabEvent,
+    PushPagureEvent,
 )
 from packit_service.worker.events.comment import (
     AbstractCommentEvent,
     AbstractIssueCommentEvent,
+    AbstractPRCommentEvent,
 )
+from packit_service.worker.events.enums import GitlabEventAction
 from packit_service.worker.events.event import AbstractResultEvent
 from packit_service.worker.handlers import (
     CoprBuildHandler,
@@ -63,6 +82,7 @@ from packit_service.worker.helpers.build import (
 from packit_service.worker.helpers.sync_release.propose_downstream import (
     ProposeDownstreamJobHelper,
 )
+from packit_service.worker.helpers.supersede import supersede_pull_request_runs
 from packit_service.worker.helpers.testing_farm import TestingFarmJobHelper
 from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.parser import Parser
@@ -116,6 +136,36 @@ def get_handlers_for_check_rerun(check_name_job: str) -> Set[Type[JobHandler]]:
     return handlers
 
 
+def get_debounce_subject(event: Optional[Event]) -> Optional[Tuple[str, str]]:
+    """
+    Get what the event can be debounced with.
+
+    Args:
+        event: Parsed event.
+
+    Returns:
+        Trigger the debounce window is configured for and the identifier
+        of the PR or branch the event is for (and of the packit command
+        for the comments), None if the event is not debounced at all.
+    """
+    if isinstance(event, AbstractPRCommentEvent):
+        # only the repeated commands are debounced, the comments without
+        # a command are not handled anyway
+        command = get_packit_commands_from_comment(
+            event.comment, ServiceConfig.get_service_config().comment_command_prefix
+        )
+        if not command:
+            return None
+        return "comment", f"{event.project_url}:pr:{event.pr_id}:{' '.join(command)}"
+    if isinstance(
+        event, (PullRequestGithubEvent, MergeRequestGitlabEvent, PullRequestPagureEvent)
+    ):
+        return "pull_request", f"{event.project_url}:pr:{event.pr_id}"
+    if isinstance(event, (PushGitHubEvent, PushGitlabEvent, PushPagureEvent)):
+        return "commit", f"{event.project_url}:branch:{event.git_ref}"
+    return None
+
+
 class SteveJobs:
     """
     Steve makes sure all the jobs are done with precision.
@@ -136,6 +186,8 @@ class SteveJobs:
         event: dict,
         source: Optional[str] = None,
         event_type: Optional[str] = None,
+        delivery_id: Optional[str] = None,
+        debounce_token: Optional[str] = None,
     ) -> List[TaskResults]:
         """
         Entrypoint for message processing.
@@ -146,15 +198,65 @@ class SteveJobs:
             event: Dict with webhook/fed-msg payload.
             source: Source of the event, for example: "github".
             event_type: Type of the event.
+            delivery_id: ID of the delivery of the event, the redeliveries
+                of an already processed event are dropped. The fedmsg events,
+                which come without it, are identified by the hash of their content.
+            debounce_token: Set when the processing of the event was delayed
+                till the end of its debounce window, identifies the event
+                to be compared with the latest one for the same PR or branch.
 
         Returns:
             List of results of the processing tasks.
         """
+        if delivery_id is None and event.get("topic"):
+            delivery_id = get_event_hash(event)
+        if (
+            delivery_id
+            and debounce_token is None
+            and not register_delivery(delivery_id, stage="processed")
+        ):
+            logger.info(f"Dropping duplicate delivery {delivery_id} of the event.")
+            cls.pushgateway.events_duplicate.inc()
+            cls.pushgateway.push()
+            return []
+
+        try:
+            return cls._process_message(
+                event, source, event_type, delivery_id, debounce_token
+            )
+        except Exception:
+            if delivery_id:
+                # let the event be redelivered
+                unregister_delivery(delivery_id, stage="processed")
+            raise
+
+    @classmethod
+    def _process_message(
+        cls,
+        event: dict,
+        source: Optional[str],
+        event_type: Optional[str],
+        delivery_id: Optional[str] = None,
+        debounce_token: Optional[str] = None,
+    ) -> List[TaskResults]:
         parser = nested_get(
             Parser.MAPPING, source, event_type, default=Parser.parse_event
         )
         event_object: Optional[Event] = parser(event)
 
+        debounced = cls._debounce(
+            event_object,
+            debounce_token,
+            task_kwargs={
+                "event": event,
+                "source": source,
+                "event_type": event_type,
+                "delivery_id": delivery_id,
+            },
+        )
+        if debounced is not None:
+            return debounced
+
         cls.pushgateway.events_processed.inc()
         if event_not_handled := not event_object:
             cls.pushgateway.events_not_handled.inc()
@@ -167,6 +269,59 @@ class SteveJobs:
 
         return cls(event_object).process()
 
+    @classmethod
+    def _debounce(
+        cls,
+        event_object: Optional[Event],
+        debounce_token: Optional[str],
+        task_kwargs: dict,
+    ) -> Optional[List[TaskResults]]:
+        """
+        Delay the processing of the event till the end of the debounce window
+        configured for its trigger, or drop the delayed event if a newer one
+        for the same PR or branch arrived within the window.
+
+        Args:
+            event_object: Parsed event.
+            debounce_token: Set if the processing of the event was already delayed.
+            task_kwargs: Arguments of the main task the event is delayed with.
+
+        Returns:
+            None if the event is to be processed now, results otherwise.
+        """
+        if not (debounce_subject := get_debounce_subject(event_object)):
+            return None
+        trigger, subject = debounce_subject
+
+        if debounce_token:
+            if is_latest_debounced_event(subject, debounce_token):
+                return None
+            logger.info(
+                f"Dropping the event for {subject}, a newer one arrived "
+                "within the debounce window."
+            )
+            cls.pushgateway.events_debounced.inc()
+            cls.pushgateway.push()
+            return []
+
+        window = ServiceConfig.get_service_config().debounce_windows.get(trigger)
+        token = uuid4().hex
+        if not window or not set_latest_debounced_event(subject, token, window):
+            return None
+
+        logger.debug(f"Delaying the event for {subject} by {window}s.")
+        celery_app.send_task(
+            name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
+            kwargs={**task_kwargs, "debounce_token": token},
+            countdown=window,
+        )
+        return [
+            TaskResults(
+                success=True,
+                details={"msg": f"Event delayed by {window}s for debouncing."},
+            )
+        ]
+
     def process(self) -> List[TaskResults]:
         """
         Processes the event object attribute of SteveJobs - runs the checks for
@@ -211,6 +366,7 @@ class SteveJobs:
             # should we comment about not processing if the comment is not
             # on the issue created by us or not in packit/notifications?
         else:
+            self.supersede_outdated_runs()
             # Processing the jobs from the config.
             processing_results = self.process_jobs()
 
@@ -226,6 +382,27 @@ class SteveJobs:
 
         return processing_results
 
+    def supersede_outdated_runs(self) -> None:
+        """
+        Supersede the builds and tests of the previous commits
+        of the pull request when a new commit is pushed to it.
+        """
+        if not isinstance(
+            self.event, (PullRequestGithubEvent, MergeRequestGitlabEvent)
+        ):
+            return
+        if (
+            isinstance(self.event, MergeRequestGitlabEvent)
+            and self.event.action == GitlabEventAction.closed
+        ):
+            return
+        try:
+            supersede_pull_request_runs(
+                self.event.db_project_event, self.event.commit_sha, self.event.project
+            )
+        except Exception as ex:
+            logger.warning(f"Failed to supersede the outdated runs: {ex!r}")
+
     def initialize_job_helper(
         self, handler_kls: Type[JobHandler], job_config: JobConfig
     ) -> Union[ProposeDownstreamJobHelper, BaseBuildJobHelper]:
@@ -496,8 +673,7 @@ class SteveJobs:
                     )
                 )
         self.push_statuses_metrics(statuses_check_feedback)
-        # https://docs.celeryq.dev/en/stable/userguide/canvas.html#groups
-        celery.group(signatures).apply_async()
+        fair_share.dispatch(getattr(self.event, "project_url", None), signatures)
         return processing_results
 
     def should_task_be_created_for_job_config_and_handler(
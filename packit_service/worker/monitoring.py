@@ -1,16 +1,64 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import atexit
 import logging
 import os
+import time
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Optional
 
-from prometheus_client import CollectorRegistry, Counter, push_to_gateway, Histogram
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    push_to_gateway,
+)
+
+from packit_service.constants import PUSHGATEWAY_PUSH_INTERVAL, PUSHGATEWAY_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# Metrics updated also outside of the worker code, where no Pushgateway instance
+# is at hand. They are registered to the shared registry of the Pushgateway.
+package_config_cache_hits = Counter(
+    "package_config_cache_hits",
+    "Number of package configs taken from the cache instead of the forge",
+    ["tier"],
+    registry=None,
+)
+package_config_cache_misses = Counter(
+    "package_config_cache_misses",
+    "Number of package configs (at a commit SHA) not found in the cache",
+    registry=None,
+)
+PROCESS_METRICS = (package_config_cache_hits, package_config_cache_misses)
+
 
 class Pushgateway:
+    """
+    Metrics of the worker process pushed to the Prometheus pushgateway.
+
+    All the instances within a process share one registry with the metrics,
+    so creating an instance is cheap and the metrics accumulate over
+    the lifetime of the process.
+
+    `push()` doesn't block, the metrics are pushed by a background thread,
+    at most once per `PUSHGATEWAY_PUSH_INTERVAL` seconds, so the pushes
+    requested in the meantime are done at once.
+    """
+
+    _shared_state: Dict[str, Any] = {}
+    _shared_state_lock = Lock()
+
     def __init__(self):
+        self.__dict__ = self._shared_state
+        with self._shared_state_lock:
+            if not self._shared_state:
+                self._setup()
+
+    def _setup(self):
         self.pushgateway_address = os.getenv(
             "PUSHGATEWAY_ADDRESS", "http://pushgateway"
         )
@@ -18,6 +66,13 @@ class Pushgateway:
         # the job name corresponds to worker name (e.g. packit-worker-0)
         self.worker_name = os.getenv("HOSTNAME")
         self.registry = CollectorRegistry()
+        for metric in PROCESS_METRICS:
+            self.registry.register(metric)
+
+        self._push_requested = Event()
+        self._pusher: Optional[Thread] = None
+        # the pusher thread doesn't survive forking of the worker process
+        self._pusher_pid: Optional[int] = None
 
         # metrics
         self.copr_builds_queued = Counter(
@@ -76,6 +131,14 @@ class Pushgateway:
             buckets=(5, 15, 30, 60, 120, float("inf")),
         )
 
+        self.status_report_time = Histogram(
+            "status_report_time",
+            "Time it takes to set one commit status (check run, flag) on the forge",
+            ["forge"],
+            registry=self.registry,
+            buckets=(0.25, 0.5, 1, 2, 5, 10, 30, float("inf")),
+        )
+
         self.copr_build_finished_time = Histogram(
             "copr_build_finished_time",
             "Time it takes from setting accepted status for Copr build to finished",
@@ -140,6 +203,25 @@ class Pushgateway:
             ),
         )
 
+        self.tf_runs_sweep_time = Histogram(
+            "tf_runs_sweep_time",
+            "Time it takes to check the state of all pending test runs",
+            registry=self.registry,
+            buckets=(10, 30, 60, 120, 300, 480, 600, float("inf")),
+        )
+
+        self.database_backup_time = Gauge(
+            "database_backup_time",
+            "Time it took to dump the database and upload the last backup",
+            registry=self.registry,
+        )
+
+        self.database_backup_size = Gauge(
+            "database_backup_size",
+            "Size (in bytes) of the last (compressed) database backup",
+            registry=self.registry,
+        )
+
         self.events_processed = Counter(
             "events_processed",
             "The number of events processed from the Celery queue",
@@ -159,12 +241,81 @@ class Pushgateway:
             registry=self.registry,
         )
 
+        self.events_duplicate = Counter(
+            "events_duplicate",
+            "The number of redelivered events dropped as duplicates",
+            registry=self.registry,
+        )
+
+        self.events_debounced = Counter(
+            "events_debounced",
+            "The number of events dropped in favour of a newer event "
+            "for the same PR or branch within the debounce window",
+            registry=self.registry,
+        )
+
+        self.fair_share_queue_depth = Gauge(
+            "fair_share_queue_depth",
+            "Number of handler tasks of the project waiting for their fair share "
+            "(as of the last dispatch)",
+            ["project"],
+            registry=self.registry,
+        )
+
+        self.fair_share_deferred = Counter(
+            "fair_share_deferred",
+            "Number of handler tasks of the project deferred over its fair share",
+            ["project"],
+            registry=self.registry,
+        )
+
     def push(self):
+        """
+        Request pushing of the metrics, the push itself is done in the background.
+        """
         if not (self.pushgateway_address and self.worker_name):
             logger.debug("Pushgateway address or worker name not defined.")
             return
 
+        self._start_pusher()
+        self._push_requested.set()
+
+    def _start_pusher(self):
+        with self._shared_state_lock:
+            if self._pusher_pid == os.getpid() and self._pusher.is_alive():
+                return
+
+            self._push_requested = Event()
+            self._pusher = Thread(
+                target=self._push_periodically, name="pushgateway", daemon=True
+            )
+            self._pusher_pid = os.getpid()
+            self._pusher.start()
+            atexit.register(self._push_pending)
+
+    def _push_periodically(self):
+        while True:
+            self._push_requested.wait()
+            self._push_requested.clear()
+            self.push_now()
+            # the pushes requested in the meantime are done together
+            time.sleep(PUSHGATEWAY_PUSH_INTERVAL)
+
+    def _push_pending(self):
+        if self._push_requested.is_set():
+            self.push_now()
+
+    def push_now(self):
+        """
+        Push the metrics to the pushgateway right away.
+        """
         logger.info("Pushing the metrics to pushgateway.")
-        push_to_gateway(
-            self.pushgateway_address, job=self.worker_name, registry=self.registry
-        )
+        try:
+            push_to_gateway(
+                self.pushgateway_address,
+                job=self.worker_name,
+                registry=self.registry,
+                timeout=PUSHGATEWAY_TIMEOUT,
+            )
+        except OSError as ex:
+            logger.warning(f"Failed to push the metrics to pushgateway: {ex!r}")
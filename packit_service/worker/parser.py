@@ -121,6 +121,8 @@ class Parser:
         See: https://github.com/packit/packit-service-fedmsg/blob/
              e53586bf7ace0c46fd6812fe8dc11491e5e6cf41/packit_service_fedmsg/consumer.py#L137
 
+        The event is passed only to the parser of its type, see `get_event_type()`.
+
         :param event: JSON from GitHub/GitLab
         :return: event object
         """
@@ -129,39 +131,41 @@ class Parser:
             logger.warning("No event to process!")
             return None
 
-        for response in map(
-            lambda parser: parser(event),
-            (
-                Parser.parse_pr_event,
-                Parser.parse_pull_request_comment_event,
-                Parser.parse_issue_comment_event,
-                Parser.parse_release_event,
-                Parser.parse_github_push_event,
-                Parser.parse_check_rerun_event,
-                Parser.parse_installation_event,
-                Parser.parse_testing_farm_results_event,
-                Parser.parse_copr_event,
-                Parser.parse_mr_event,
-                Parser.parse_koji_task_event,
-                Parser.parse_koji_build_event,
-                Parser.parse_merge_request_comment_event,
-                Parser.parse_gitlab_issue_comment_event,
-                Parser.parse_gitlab_push_event,
-                Parser.parse_pipeline_event,
-                Parser.parse_pagure_push_event,
-                Parser.parse_pagure_pr_flag_event,
-                Parser.parse_pagure_pull_request_comment_event,
-                Parser.parse_new_hotness_update_event,
-                Parser.parse_gitlab_release_event,
-                Parser.parse_gitlab_tag_push_event,
-            ),
-        ):
-            if response:
-                return response
+        if parser := nested_get(Parser.MAPPING, *Parser.get_event_type(event)):
+            return parser(event)
 
         logger.debug("We don't process this event.")
         return None
 
+    @staticmethod
+    def get_event_type(event: dict) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Determine the source and the type of the event (the keys of `MAPPING`)
+        from the event itself, for the events received without them,
+        i.e. the fedmsg events and the webhooks not received by the API.
+
+        Args:
+            event: JSON of the event.
+
+        Returns:
+            Source and type of the event, `(None, None)` if not recognized.
+        """
+        if topic := event.get("topic"):
+            # e.g. "org.fedoraproject.prod.copr.build.end" -> "copr.build.end"
+            return "fedora-messaging", topic.split(".", 3)[-1]
+        if event.get("source") == "testing-farm":
+            return "testing-farm", "results"
+        if object_kind := event.get("object_kind"):
+            return "gitlab", Parser.GITLAB_OBJECT_KINDS.get(object_kind)
+        # the "installation" key is present in all the events of the GitHub app,
+        # but only the installation events have the details of the account
+        if nested_get(event, "installation", "account"):
+            return "github", "installation"
+        for key, event_type in Parser.GITHUB_PAYLOAD_KEYS:
+            if event.get(key):
+                return "github", event_type
+        return None, None
+
     @staticmethod
     def parse_mr_event(event) -> Optional[MergeRequestGitlabEvent]:
         """Look into the provided event and see if it's one for a new gitlab MR."""
@@ -1541,6 +1545,27 @@ class Parser:
             distgit_project_url=distgit_project_url,
         )
 
+    # The event type (X-Gitlab-Event header) of the GitLab webhooks
+    # by the "object_kind" of their payload
+    GITLAB_OBJECT_KINDS = {
+        "merge_request": "Merge Request Hook",
+        "note": "Note Hook",
+        "push": "Push Hook",
+        "tag_push": "Tag Push Hook",
+        "pipeline": "Pipeline Hook",
+        "release": "Release Hook",
+    }
+
+    # The event type (X-GitHub-Event header) of the GitHub webhooks
+    # by a top-level key of their payload, in the order they are checked
+    GITHUB_PAYLOAD_KEYS = (
+        ("check_run", "check_run"),
+        ("comment", "issue_comment"),
+        ("pull_request", "pull_request"),
+        ("release", "release"),
+        ("pusher", "push"),
+    )
+
     # The .__func__ are needed for Python < 3.10
     MAPPING = {
         "github": {
@@ -1,11 +1,18 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum, auto
+from hashlib import sha256
+from os import getenv
 from random import choice
-from typing import Optional, Union, Dict, Callable
+from threading import Lock
+from typing import Optional, Union, Dict, Callable, List
 
 from ogr.abstract import CommitStatus, GitProject
 from ogr.exceptions import GithubAPIException, GitlabAPIException
@@ -17,12 +24,18 @@ from ogr.services.github.check_run import (
 )
 from ogr.services.gitlab import GitlabProject
 from ogr.services.pagure import PagureProject
+from redis.exceptions import RedisError
 
 from packit_service.config import ServiceConfig, PackageConfigGetter
 from packit_service.constants import (
+    COMMIT_STATUS_CACHE_TTL,
+    DEFAULT_STATUS_COALESCING_WINDOW,
+    DEFAULT_STATUS_REPORTING_CONCURRENCY,
     DOCS_URL,
     MSG_TABLE_HEADER_WITH_DETAILS,
 )
+from packit_service.utils import get_redis
+from packit_service.worker.monitoring import Pushgateway
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +108,16 @@ MAP_TO_CHECK_RUN: Dict[
 
 
 class StatusReporter:
+    # label of the forge in the metrics
+    forge: str = "unknown"
+
+    # updates of non-final states waiting for the end of the coalescing window,
+    # shared by all the reporters of the process
+    _deferred: Dict[str, "StatusUpdate"] = {}
+    _deferred_lock = Lock()
+    # time (monotonic) the oldest of the deferred updates was deferred at
+    _deferred_since: Optional[float] = None
+
     def __init__(
         self,
         project: GitProject,
@@ -165,7 +188,14 @@ class StatusReporter:
         url: str = "",
         links_to_external_services: Optional[Dict[str, str]] = None,
         markdown_content: str = None,
-    ):
+    ) -> Optional[bool]:
+        """
+        Set the status of the check.
+
+        Returns:
+            False if the status could not be set and the failure was handled
+            (e.g. by commenting instead), the status is set otherwise.
+        """
         raise NotImplementedError()
 
     def report(
@@ -211,18 +241,151 @@ class StatusReporter:
         elif isinstance(check_names, str):
             check_names = [check_names]
 
-        for check in check_names:
-            self.set_status(
+        updates = [
+            StatusUpdate(
+                reporter=self,
+                check_name=check_name,
                 state=state,
                 description=description,
-                check_name=check,
                 url=url,
                 links_to_external_services=links_to_external_services,
                 markdown_content=markdown_content,
+                update_feedback_time=update_feedback_time,
             )
+            # drop the duplicates, the order of the checks is kept
+            for check_name in dict.fromkeys(check_names)
+        ]
+
+        window = float(
+            getenv("STATUS_COALESCING_WINDOW", DEFAULT_STATUS_COALESCING_WINDOW)
+        )
+        if window > 0 and not self.is_final_state(state):
+            StatusReporter._defer(updates, window)
+            return
+
+        # the new state supersedes the deferred ones
+        StatusReporter._drop_deferred(updates)
+        self._send(self._skip_unchanged(updates))
+
+    def _skip_unchanged(self, updates: List["StatusUpdate"]) -> List["StatusUpdate"]:
+        """
+        Leave out the updates that would set the same status as the last one
+        set for the check (by any worker).
+        """
+        if not updates:
+            return updates
+
+        try:
+            last_digests = get_redis().mget([update.key for update in updates])
+        except RedisError as ex:
+            logger.warning(f"Failed to get the last statuses from Redis: {ex!r}")
+            return updates
+
+        changed = []
+        for update, last_digest in zip(updates, last_digests):
+            if isinstance(last_digest, bytes):
+                last_digest = last_digest.decode()
+            if last_digest == update.digest:
+                logger.debug(f"Status of {update.check_name!r} is up to date.")
+                continue
+            changed.append(update)
+        return changed
+
+    def _send(self, updates: List["StatusUpdate"]):
+        concurrency = min(
+            int(
+                getenv(
+                    "STATUS_REPORTING_CONCURRENCY", DEFAULT_STATUS_REPORTING_CONCURRENCY
+                )
+            ),
+            len(updates),
+        )
+        if concurrency <= 1:
+            for update in updates:
+                update.send()
+            return
+
+        # every status is a separate request to the forge, send them in parallel
+        # (resolve the lazy property first so that the threads don't race for it)
+        _ = self.project_with_commit
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="status-reporter"
+        ) as executor:
+            futures = {
+                executor.submit(self._set_status_and_measure, update): update
+                for update in updates
+            }
+            for future in as_completed(futures):
+                futures[future].sent(confirmed=future.result())
+
+    def _set_status_and_measure(self, update: "StatusUpdate") -> bool:
+        """
+        Set the status of the update.
+
+        Returns:
+            Whether the status was set.
+        """
+        start = time.monotonic()
+        try:
+            result = self.set_status(
+                state=update.state,
+                description=update.description,
+                check_name=update.check_name,
+                url=update.url,
+                links_to_external_services=update.links_to_external_services,
+                markdown_content=update.markdown_content,
+            )
+        finally:
+            Pushgateway().status_report_time.labels(forge=self.forge).observe(
+                time.monotonic() - start
+            )
+        return result is not False
+
+    @classmethod
+    def _defer(cls, updates: List["StatusUpdate"], window: float):
+        """
+        Hold the updates back, the deferred ones are sent once the window
+        since the oldest of them elapses (by the next update reported after that)
+        or when the job ends, whatever comes first.
+
+        The deferred updates are sent by the reporting thread of the job,
+        so that they don't outlive the task and its DB session.
+        """
+        now = time.monotonic()
+        with cls._deferred_lock:
+            for update in updates:
+                cls._deferred[update.key] = update
+            if cls._deferred_since is None:
+                cls._deferred_since = now
+            window_elapsed = now - cls._deferred_since >= window
+        if window_elapsed:
+            cls.flush_deferred()
+
+    @classmethod
+    def _drop_deferred(cls, updates: List["StatusUpdate"]):
+        with cls._deferred_lock:
+            for update in updates:
+                cls._deferred.pop(update.key, None)
 
-            if update_feedback_time:
-                update_feedback_time(datetime.now(timezone.utc))
+    @classmethod
+    def flush_deferred(cls):
+        """
+        Send the deferred updates of non-final states right away,
+        only the latest update of each check is sent.
+        """
+        with cls._deferred_lock:
+            updates, cls._deferred = list(cls._deferred.values()), {}
+            cls._deferred_since = None
+
+        by_reporter: Dict[int, List[StatusUpdate]] = {}
+        for update in updates:
+            by_reporter.setdefault(id(update.reporter), []).append(update)
+        for reporter_updates in by_reporter.values():
+            reporter = reporter_updates[0].reporter
+            try:
+                reporter._send(reporter._skip_unchanged(reporter_updates))
+            except Exception as ex:
+                logger.warning(f"Failed to send the deferred statuses: {ex!r}")
 
     @staticmethod
     def is_final_state(state: BaseCommitStatus) -> bool:
@@ -333,7 +496,66 @@ class StatusReporter:
             self.project.get_pr(pr_id=self.pr_id).comment(body=body)
 
 
+@dataclass
+class StatusUpdate:
+    """
+    Status of a check to be set by the reporter.
+    """
+
+    reporter: StatusReporter
+    check_name: str
+    state: BaseCommitStatus
+    description: str
+    url: str
+    links_to_external_services: Optional[Dict[str, str]]
+    markdown_content: Optional[str]
+    update_feedback_time: Optional[Callable]
+
+    @property
+    def key(self) -> str:
+        """Redis key of the last status set for the check."""
+        return (
+            f"packit-service:commit-status:{self.reporter.project}:"
+            f"{self.reporter.commit_sha}:{self.check_name}"
+        )
+
+    @property
+    def digest(self) -> str:
+        return sha256(
+            json.dumps(
+                [
+                    self.state.value,
+                    self.description,
+                    self.url,
+                    self.links_to_external_services,
+                    self.markdown_content,
+                ],
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
+    def send(self):
+        self.sent(confirmed=self.reporter._set_status_and_measure(self))
+
+    def sent(self, confirmed: bool = True):
+        """
+        Args:
+            confirmed: Whether the status was set, only such is remembered
+                so that a failed update is not skipped as unchanged next time.
+        """
+        if confirmed:
+            try:
+                get_redis().set(self.key, self.digest, ex=COMMIT_STATUS_CACHE_TTL)
+            except RedisError as ex:
+                logger.warning(f"Failed to store the status in Redis: {ex!r}")
+
+        if self.update_feedback_time:
+            self.update_feedback_time(datetime.now(timezone.utc))
+
+
 class StatusReporterPagure(StatusReporter):
+    forge = "pagure"
+
     @staticmethod
     def get_commit_status(state: BaseCommitStatus):
         mapped_state = StatusReporter.get_commit_status(state)
@@ -371,6 +593,8 @@ class StatusReporterPagure(StatusReporter):
 
 
 class StatusReporterGitlab(StatusReporter):
+    forge = "gitlab"
+
     @staticmethod
     def get_commit_status(state: BaseCommitStatus):
         mapped_state = StatusReporter.get_commit_status(state)
@@ -416,9 +640,12 @@ class StatusReporterGitlab(StatusReporter):
                 )
             if e.response_code not in {400, 403, 404}:
                 raise
+            return False
 
 
 class StatusReporterGithubStatuses(StatusReporter):
+    forge = "github"
+
     @staticmethod
     def get_commit_status(state: BaseCommitStatus):
         mapped_state = StatusReporter.get_commit_status(state)
@@ -454,6 +681,7 @@ class StatusReporterGithubStatuses(StatusReporter):
                 f" commenting on commit as a fallback: {e}"
             )
             self._add_commit_comment_with_status(state, description, check_name, url)
+            return False
 
 
 class StatusReporterGithubChecks(StatusReporterGithubStatuses):
@@ -532,7 +760,7 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
             logger.debug(
                 f"Failed to set status check, setting status as a fallback: {str(e)}"
             )
-            super().set_status(state, description, check_name, url)
+            return super().set_status(state, description, check_name, url)
 
 
 def report_in_issue_repository(
@@ -0,0 +1,429 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Retention of the data in the database.
+
+The outdated data are removed in batches by set-based statements, each batch
+in its own transaction and with a pause after it, so that the database isn't
+blocked by one huge transaction. The statements touch only the rows that are
+still to be removed, so a run stopped before finishing (because of its time
+limit or a restart of the worker) is continued by the next one.
+"""
+
+import time
+from datetime import datetime, timedelta
+from logging import getLogger
+from os import getenv
+from typing import Callable, List, NamedTuple, Optional
+
+from sqlalchemy import and_, delete, exists, or_, select, true, update
+from sqlalchemy.orm import Session as SQLASession
+
+from packit_service.constants import (
+    DEFAULT_RETENTION_BATCH_SIZE,
+    DEFAULT_RETENTION_BATCH_SLEEP,
+    DEFAULT_RETENTION_TIME_LIMIT,
+    LOG_STORE_DELETE_GRACE_PERIOD,
+    SRPMBUILDS_OUTDATED_AFTER_DAYS,
+)
+from packit_service.log_store import get_log_store
+from packit_service.models import (
+    CoprBuildGroupModel,
+    CoprBuildTargetModel,
+    GitBranchModel,
+    GitProjectModel,
+    GithubInstallationModel,
+    IssueModel,
+    KojiBuildGroupModel,
+    KojiBuildTargetModel,
+    PipelineModel,
+    ProjectAuthenticationIssueModel,
+    ProjectEventModel,
+    ProjectEventModelType,
+    ProjectReleaseModel,
+    PullRequestModel,
+    SRPMBuildModel,
+    SourceGitPRDistGitPRModel,
+    SyncReleaseModel,
+    SyncReleaseTargetModel,
+    TFTTestRunGroupModel,
+    TFTTestRunTargetModel,
+    UsageRollupModel,
+    VMImageBuildTargetModel,
+    get_unreferenced_logs,
+    sa_session_transaction,
+    tf_copr_association_table,
+)
+
+logger = getLogger(__name__)
+
+
+class RetentionReport(NamedTuple):
+    table: str
+    rows: int
+    duration: float
+    finished: bool
+
+
+class Retention:
+    """
+    Removal of the outdated data:
+
+    * the logs and URLs of the SRPM builds older than `srpm_build_logs_before`,
+    * the pipelines older than `pipelines_before` (if set) and then everything
+      not referenced anymore: SRPM builds, groups with their targets and,
+      if `delete_orphaned_project_events` is set, project events,
+      pull requests (branches, …) and projects.
+
+    The project events (and the objects and projects they are for) are created
+    before their pipelines, often in another task, and there is no time
+    of their creation to tell them from the outdated ones. Deleting them
+    is therefore left for the manual cleanup (files/scripts/db-cleanup.py).
+    """
+
+    def __init__(
+        self,
+        srpm_build_logs_before: datetime,
+        pipelines_before: Optional[datetime] = None,
+        batch_size: int = DEFAULT_RETENTION_BATCH_SIZE,
+        batch_sleep: float = DEFAULT_RETENTION_BATCH_SLEEP,
+        time_limit: Optional[float] = None,
+        delete_orphaned_project_events: bool = False,
+    ):
+        self.srpm_build_logs_before = srpm_build_logs_before
+        self.pipelines_before = pipelines_before
+        self.delete_orphaned_project_events = delete_orphaned_project_events
+        self.batch_size = batch_size
+        self.batch_sleep = batch_sleep
+        self.deadline = None if time_limit is None else time.monotonic() + time_limit
+        self.reports: List[RetentionReport] = []
+        # references to the logs in the log store to delete after the commit
+        self._stored_logs: List[str] = []
+
+    def run(self) -> List[RetentionReport]:
+        self._discard_srpm_build_logs()
+        if self.pipelines_before:
+            self._delete_pipelines()
+            self._delete_orphaned_builds()
+            self._delete_orphaned_targets()
+            self._delete_orphaned_groups()
+            if self.delete_orphaned_project_events:
+                self._delete_orphaned_project_events()
+                self._delete_orphaned_project_event_objects()
+                self._delete_orphaned_projects()
+
+        for report in self.reports:
+            logger.info(
+                f"Retention of {report.table}: {report.rows} rows "
+                f"in {report.duration:.1f}s"
+                + ("" if report.finished else ", to be continued by the next run")
+            )
+        return self.reports
+
+    def _out_of_time(self) -> bool:
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+    def _in_batches(
+        self,
+        model,
+        condition,
+        process: Callable[[SQLASession, List[int]], int],
+        *columns,
+    ) -> None:
+        """
+        Process the rows of the model matching the condition, batch by batch.
+
+        Args:
+            model: Model of the table.
+            condition: Condition of the rows to process.
+            process: Processes the rows with the given IDs (within the transaction
+                of the batch) and returns the number of the processed rows.
+            *columns: Additional columns to select, the rows are passed to
+                `_collect()` (before the processing) to remember anything needed
+                after the commit.
+        """
+        table = model.__tablename__
+        start = time.monotonic()
+        processed = 0
+        last_id = 0
+        finished = False
+        while not self._out_of_time():
+            with sa_session_transaction() as session:
+                rows = session.execute(
+                    select(model.id, *columns)
+                    .where(condition, model.id > last_id)
+                    .order_by(model.id)
+                    .limit(self.batch_size)
+                ).all()
+                if rows:
+                    self._collect(rows)
+                    processed += process(session, [row.id for row in rows])
+                    # the logs shared with the rows that are kept are not deleted
+                    self._stored_logs = list(
+                        get_unreferenced_logs(session, self._stored_logs)
+                    )
+
+            self._delete_stored_logs()
+            if len(rows) < self.batch_size:
+                finished = True
+                break
+
+            last_id = rows[-1].id
+            time.sleep(self.batch_sleep)
+
+        self.reports.append(
+            RetentionReport(
+                table=table,
+                rows=processed,
+                duration=time.monotonic() - start,
+                finished=finished,
+            )
+        )
+
+    def _collect(self, rows) -> None:
+        self._stored_logs.extend(
+            row.logs_reference for row in rows if getattr(row, "logs_reference", None)
+        )
+
+    def _delete_stored_logs(self) -> None:
+        log_store = get_log_store()
+        references, self._stored_logs = self._stored_logs, []
+        if not log_store:
+            return
+
+        for reference in references:
+            try:
+                # the logs may have just been stored again for a new model
+                log_store.delete(reference, grace_period=LOG_STORE_DELETE_GRACE_PERIOD)
+            except Exception as ex:
+                logger.warning(f"Failed to delete the logs {reference}: {ex!r}")
+
+    def _delete(
+        self,
+        model,
+        condition,
+        *columns,
+        before_delete: Optional[Callable[[SQLASession, List[int]], None]] = None,
+    ) -> None:
+        """
+        Delete the rows of the model matching the condition,
+        it's checked again when deleting, so that no row referenced
+        in the meantime is deleted.
+        """
+
+        def delete_batch(session: SQLASession, ids: List[int]) -> int:
+            if before_delete:
+                before_delete(session, ids)
+            return session.execute(
+                delete(model).where(model.id.in_(ids), condition)
+            ).rowcount
+
+        self._in_batches(model, condition, delete_batch, *columns)
+
+    def _discard_srpm_build_logs(self) -> None:
+        condition = and_(
+            SRPMBuildModel.build_submitted_time < self.srpm_build_logs_before,
+            or_(
+                SRPMBuildModel.logs.isnot(None),
+                SRPMBuildModel.logs_reference.isnot(None),
+            ),
+        )
+        self._in_batches(
+            SRPMBuildModel,
+            condition,
+            lambda session, ids: session.execute(
+                update(SRPMBuildModel)
+                .where(SRPMBuildModel.id.in_(ids))
+                .values(logs=None, logs_reference=None, url=None)
+            ).rowcount,
+            SRPMBuildModel.logs_reference,
+        )
+
+    def _delete_pipelines(self) -> None:
+        self._delete(PipelineModel, PipelineModel.datetime < self.pipelines_before)
+
+    def _delete_orphaned_builds(self) -> None:
+        self._delete(
+            SRPMBuildModel,
+            ~exists().where(PipelineModel.srpm_build_id == SRPMBuildModel.id),
+            SRPMBuildModel.logs_reference,
+        )
+        self._delete(
+            VMImageBuildTargetModel,
+            ~exists().where(
+                PipelineModel.vm_image_build_id == VMImageBuildTargetModel.id
+            ),
+        )
+
+    def _delete_orphaned_targets(self) -> None:
+        """
+        Delete the targets of the groups not referenced by any pipeline.
+        """
+        self._delete(
+            CoprBuildTargetModel,
+            ~exists().where(
+                PipelineModel.copr_build_group_id
+                == CoprBuildTargetModel.copr_build_group_id
+            ),
+            before_delete=self._tf_copr_associations_deleter(
+                tf_copr_association_table.c.copr_id
+            ),
+        )
+        self._delete(
+            TFTTestRunTargetModel,
+            ~exists().where(
+                PipelineModel.test_run_group_id
+                == TFTTestRunTargetModel.tft_test_run_group_id
+            ),
+            before_delete=self._tf_copr_associations_deleter(
+                tf_copr_association_table.c.tft_id
+            ),
+        )
+        self._delete(
+            KojiBuildTargetModel,
+            ~exists().where(
+                PipelineModel.koji_build_group_id
+                == KojiBuildTargetModel.koji_build_group_id
+            ),
+        )
+        self._delete(
+            SyncReleaseTargetModel,
+            ~exists().where(
+                PipelineModel.sync_release_run_id
+                == SyncReleaseTargetModel.sync_release_id
+            ),
+            SyncReleaseTargetModel.logs_reference,
+        )
+
+    @staticmethod
+    def _tf_copr_associations_deleter(
+        column,
+    ) -> Callable[[SQLASession, List[int]], None]:
+        """
+        Deleter of the associations of the Copr builds and test runs
+        referencing the deleted targets by the column.
+        """
+        return lambda session, ids: session.execute(
+            delete(tf_copr_association_table).where(column.in_(ids))
+        )
+
+    def _delete_orphaned_groups(self) -> None:
+        for group, target_group_id, pipeline_group_id in (
+            (
+                CoprBuildGroupModel,
+                CoprBuildTargetModel.copr_build_group_id,
+                PipelineModel.copr_build_group_id,
+            ),
+            (
+                KojiBuildGroupModel,
+                KojiBuildTargetModel.koji_build_group_id,
+                PipelineModel.koji_build_group_id,
+            ),
+            (
+                TFTTestRunGroupModel,
+                TFTTestRunTargetModel.tft_test_run_group_id,
+                PipelineModel.test_run_group_id,
+            ),
+            (
+                SyncReleaseModel,
+                SyncReleaseTargetModel.sync_release_id,
+                PipelineModel.sync_release_run_id,
+            ),
+        ):
+            self._delete(
+                group,
+                and_(
+                    ~exists().where(pipeline_group_id == group.id),
+                    ~exists().where(target_group_id == group.id),
+                ),
+            )
+
+    def _delete_orphaned_project_events(self) -> None:
+        self._delete(
+            ProjectEventModel,
+            ~exists().where(PipelineModel.project_event_id == ProjectEventModel.id),
+        )
+
+    def _delete_orphaned_project_event_objects(self) -> None:
+        for project_event_type, model, condition in (
+            (
+                ProjectEventModelType.pull_request,
+                PullRequestModel,
+                and_(
+                    ~exists().where(
+                        SourceGitPRDistGitPRModel.source_git_pull_request_id
+                        == PullRequestModel.id
+                    ),
+                    ~exists().where(
+                        SourceGitPRDistGitPRModel.dist_git_pull_request_id
+                        == PullRequestModel.id
+                    ),
+                ),
+            ),
+            (ProjectEventModelType.branch_push, GitBranchModel, true()),
+            (ProjectEventModelType.release, ProjectReleaseModel, true()),
+            (ProjectEventModelType.issue, IssueModel, true()),
+        ):
+            self._delete(
+                model,
+                and_(
+                    ~exists().where(
+                        ProjectEventModel.type == project_event_type,
+                        ProjectEventModel.event_id == model.id,
+                    ),
+                    condition,
+                ),
+            )
+
+    def _delete_orphaned_projects(self) -> None:
+        self._delete(
+            GitProjectModel,
+            and_(
+                *(
+                    ~exists().where(model.project_id == GitProjectModel.id)
+                    for model in (
+                        PullRequestModel,
+                        GitBranchModel,
+                        ProjectReleaseModel,
+                        IssueModel,
+                        ProjectAuthenticationIssueModel,
+                        UsageRollupModel,
+                    )
+                ),
+                ~exists().where(
+                    GithubInstallationModel.repositories.any(GitProjectModel.id)
+                ),
+            ),
+        )
+
+
+def apply_retention() -> List[RetentionReport]:
+    """
+    Called periodically (see `database_maintenance` in celery_config.py)
+    to remove the outdated data configured by the env. vars:
+
+    * `SRPMBUILDS_OUTDATED_AFTER_DAYS`: age of the SRPM builds to discard the logs of,
+    * `PIPELINES_OUTDATED_AFTER_DAYS`: age of the pipelines to delete (along with
+      the builds and tests not referenced anymore), nothing is deleted if not set,
+    * `RETENTION_BATCH_SIZE` and `RETENTION_BATCH_SLEEP`: number of rows
+      processed at once and pause (in seconds) after each batch,
+    * `RETENTION_TIME_LIMIT`: time (in seconds) after which the run is stopped.
+    """
+    logger.info("About to remove the outdated data.")
+    now = datetime.utcnow()
+    srpm_builds_outdated_after_days = int(
+        getenv("SRPMBUILDS_OUTDATED_AFTER_DAYS", SRPMBUILDS_OUTDATED_AFTER_DAYS)
+    )
+    pipelines_outdated_after_days = getenv("PIPELINES_OUTDATED_AFTER_DAYS")
+    return Retention(
+        srpm_build_logs_before=now - timedelta(days=srpm_builds_outdated_after_days),
+        pipelines_before=now - timedelta(days=int(pipelines_outdated_after_days))
+        if pipelines_outdated_after_days
+        else None,
+        batch_size=int(getenv("RETENTION_BATCH_SIZE", DEFAULT_RETENTION_BATCH_SIZE)),
+        batch_sleep=float(
+            getenv("RETENTION_BATCH_SLEEP", DEFAULT_RETENTION_BATCH_SLEEP)
+        ),
+        time_limit=float(getenv("RETENTION_TIME_LIMIT", DEFAULT_RETENTION_TIME_LIMIT)),
+    ).run()
@@ -21,13 +21,13 @@ from packit_service.constants import (
     DEFAULT_RETRY_BACKOFF,
     CELERY_DEFAULT_MAIN_TASK_NAME,
 )
-from packit_service.models import VMImageBuildTargetModel
+from packit_service.models import UsageRollupModel, VMImageBuildTargetModel
 from packit_service.utils import (
     load_job_config,
     load_package_config,
     log_package_versions,
 )
-from packit_service.worker.database import discard_old_srpm_build_logs, backup
+from packit_service.worker.database import backup
 from packit_service.worker.handlers import (
     CoprBuildEndHandler,
     CoprBuildStartHandler,
@@ -64,6 +64,7 @@ from packit_service.worker.helpers.build.babysit import (
 )
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.result import TaskResults
+from packit_service.worker.retention import apply_retention
 
 logger = logging.getLogger(__name__)
 
@@ -133,7 +134,12 @@ class BodhiHandlerTaskWithRetry(HandlerTaskWithRetry):
     name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME, bind=True
 )
 def process_message(
-    self, event: dict, source: Optional[str] = None, event_type: Optional[str] = None
+    self,
+    event: dict,
+    source: Optional[str] = None,
+    event_type: Optional[str] = None,
+    delivery_id: Optional[str] = None,
+    debounce_token: Optional[str] = None,
 ) -> List[TaskResults]:
     """
     Main celery task for processing messages.
@@ -144,11 +150,19 @@ def process_message(
         event: event data
         source: Source of the event, for example: "github"
         event_type: Type of the event, for example: "pull_request"
+        delivery_id: ID of the delivery of the event, for dropping duplicates
+        debounce_token: identifier of the event delayed for debouncing
 
     Returns:
         task results
     """
-    return SteveJobs.process_message(event=event, source=source, event_type=event_type)
+    return SteveJobs.process_message(
+        event=event,
+        source=source,
+        event_type=event_type,
+        delivery_id=delivery_id,
+        debounce_token=debounce_token,
+    )
 
 
 @celery_app.task(
@@ -507,10 +521,15 @@ def babysit_pending_tft_runs() -> None:
 
 @celery_app.task
 def database_maintenance() -> None:
-    discard_old_srpm_build_logs()
+    apply_retention()
     backup()
 
 
 @celery_app.task
 def babysit_pending_vm_image_builds() -> None:
     check_pending_vm_image_builds()
+
+
+@celery_app.task
+def refresh_usage_rollups() -> None:
+    UsageRollupModel.refresh()
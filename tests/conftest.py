@@ -12,8 +12,10 @@ from flexmock import flexmock
 from ogr import GithubService, GitlabService, PagureService
 from packit.config import JobConfigTriggerType, JobConfig, PackageConfig
 from packit.config.common_package_config import Deployment
-from packit_service.config import ServiceConfig
+from packit_service import config, models, utils
+from packit_service.config import PackageConfigCache, ServiceConfig
 from packit_service.models import (
+    DbIdCache,
     ProjectEventModelType,
     ProjectEventModel,
     BuildStatus,
@@ -26,6 +28,8 @@ from packit_service.worker.events import (
     MergeRequestGitlabEvent,
     PushPagureEvent,
 )
+from packit_service.worker import reporting
+from packit_service.worker.helpers.testing_farm import ComposeCatalog
 from packit_service.worker.parser import Parser
 from tests.spellbook import SAVED_HTTPD_REQS, DATA_DIR, load_the_message_from_file
 from deepdiff import DeepDiff
@@ -58,6 +62,44 @@ def global_service_config():
     ServiceConfig.service_config = service_config
 
 
+@pytest.fixture(autouse=True)
+def redis_storage():
+    """
+    Replace Redis used for storing the package configs, the last commit
+    statuses, the DB IDs and the deliveries of the events by a dictionary
+    and start every test with empty package config and DB ID caches.
+    """
+    storage = {}
+
+    def set_(key, value, ex=None, nx=False):
+        if nx and key in storage:
+            return None
+        storage[key] = value
+        return True
+
+    redis = flexmock(
+        get=storage.get,
+        mget=lambda keys: [storage.get(key) for key in keys],
+        set=set_,
+        delete=lambda *keys: sum(storage.pop(key, None) is not None for key in keys),
+    )
+    flexmock(config).should_receive("get_redis").and_return(redis)
+    flexmock(utils).should_receive("get_redis").and_return(redis)
+    flexmock(reporting).should_receive("get_redis").and_return(redis)
+    flexmock(models).should_receive("get_redis").and_return(redis)
+    PackageConfigCache.clear()
+    DbIdCache.clear()
+    return storage
+
+
+@pytest.fixture(autouse=True)
+def clear_compose_catalog():
+    """
+    Start every test with no cached Testing Farm composes.
+    """
+    ComposeCatalog.clear()
+
+
 @pytest.fixture()
 def dump_http_com():
     """
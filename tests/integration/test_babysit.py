@@ -17,6 +17,7 @@ from packit.config import (
     PackageConfig,
 )
 from packit.copr_helper import CoprHelper
+from packit_service.constants import TESTING_FARM_API_TIMEOUT
 from packit_service.models import (
     CoprBuildTargetModel,
     ProjectEventModelType,
@@ -26,7 +27,9 @@ from packit_service.models import (
 )
 from packit_service.worker.events import AbstractCoprBuildEvent, TestingFarmResultsEvent
 from packit_service.worker.helpers.build.babysit import (
+    BabysitStats,
     check_copr_build,
+    iter_copr_builds_grouped_by_id,
     update_copr_builds,
     check_pending_copr_builds,
     check_pending_testing_farm_runs,
@@ -36,6 +39,7 @@ from packit_service.worker.handlers import (
     CoprBuildStartHandler,
     TestingFarmResultsHandler,
 )
+from packit_service.worker.monitoring import Pushgateway
 
 
 def test_check_copr_build_no_build():
@@ -412,9 +416,10 @@ def test_check_pending_copr_builds():
     build1 = flexmock(status=BuildStatus.pending, build_id="1")
     build2 = flexmock(status=BuildStatus.pending, build_id="2")
     build3 = flexmock(status=BuildStatus.pending, build_id="1")
+    # builds of the same Copr build follow each other
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
         BuildStatus.pending
-    ).and_return([build1, build2, build3])
+    ).and_return([build1, build3, build2])
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
         "update_copr_builds"
     ).with_args(1, [build1, build3]).once()
@@ -424,12 +429,24 @@ def test_check_pending_copr_builds():
     check_pending_copr_builds()
 
 
+def test_iter_copr_builds_grouped_by_id():
+    builds = [
+        flexmock(status=BuildStatus.pending, build_id=build_id)
+        for build_id in ("1", "1", "2", "3", "3")
+    ]
+    flexmock(packit_service.worker.helpers.build.babysit, ITER_IN_CHUNKS_SIZE=2)
+    assert list(iter_copr_builds_grouped_by_id(iter(builds))) == [
+        {1: builds[0:2]},
+        {2: builds[2:3], 3: builds[3:5]},
+    ]
+
+
 def test_check_pending_testing_farm_runs_no_runs():
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
         TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
     ).and_return([])
     # No request should be performed
-    flexmock(requests).should_receive("get").never()
+    flexmock(requests.Session).should_receive("get").never()
     check_pending_testing_farm_runs()
 
 
@@ -446,6 +463,7 @@ def test_check_pending_testing_farm_runs(created):
     run = (
         flexmock(
             pipeline_id=pipeline_id,
+            status=TestingFarmResult.queued,
             submitted_time=created,
             commit_sha="123456",
             target="fedora-rawhide-x86_64",
@@ -476,7 +494,9 @@ def test_check_pending_testing_farm_runs(created):
         pipeline_id=pipeline_id
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(
+        url, timeout=TESTING_FARM_API_TIMEOUT
+    ).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -499,7 +519,8 @@ def test_check_pending_testing_farm_runs(created):
         )
     )
     flexmock(TestingFarmResultsHandler).should_receive("run_job").and_return().once()
-    check_pending_testing_farm_runs()
+    flexmock(Pushgateway).should_receive("push").once()
+    assert check_pending_testing_farm_runs() == BabysitStats(1, 1, 0)
 
 
 @pytest.mark.parametrize(
@@ -528,6 +549,7 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
     run = (
         flexmock(
             pipeline_id=pipeline_id,
+            status=TestingFarmResult.queued,
             submitted_time=datetime.datetime.utcnow(),
             commit_sha="123456",
             target="fedora-rawhide-x86_64",
@@ -558,7 +580,9 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
         pipeline_id=pipeline_id
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(
+        url, timeout=TESTING_FARM_API_TIMEOUT
+    ).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -599,4 +623,173 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
         )
     )
     flexmock(TestingFarmResultsHandler).should_receive("run_job").and_return().once()
-    check_pending_testing_farm_runs()
+    flexmock(Pushgateway).should_receive("push").once()
+    assert check_pending_testing_farm_runs() == BabysitStats(1, 1, 0)
+
+
+def test_check_pending_testing_farm_runs_grouped():
+    project_event = flexmock(
+        project=flexmock(
+            repo_name="repo_name",
+            namespace="the-namespace",
+            project_url="https://github.com/the-namespace/repo_name",
+        ),
+        pr_id=5,
+        job_config_trigger_type=JobConfigTriggerType.pull_request,
+        project_event_model_type=ProjectEventModelType.pull_request,
+        id=123,
+    )
+    runs = {
+        pipeline_id: flexmock(
+            pipeline_id=pipeline_id,
+            status=TestingFarmResult.queued,
+            submitted_time=datetime.datetime.utcnow(),
+            commit_sha="123456",
+            target="fedora-rawhide-x86_64",
+            data={},
+            project_event=flexmock(type=ProjectEventModelType.pull_request),
+            identifier=None,
+        )
+        .should_receive("get_project_event_object")
+        .and_return(project_event)
+        .mock()
+        for pipeline_id in ("1", "2")
+    }
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
+        TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
+    ).and_return(list(runs.values())).once()
+    for pipeline_id, run in runs.items():
+        flexmock(TFTTestRunTargetModel).should_receive("get_by_pipeline_id").with_args(
+            pipeline_id=pipeline_id
+        ).and_return(run)
+        flexmock(requests.Session).should_receive("get").with_args(
+            f"https://api.dev.testing-farm.io/v0.1/requests/{pipeline_id}",
+            timeout=TESTING_FARM_API_TIMEOUT,
+        ).and_return(
+            flexmock(
+                json=lambda pipeline_id=pipeline_id: {
+                    "id": pipeline_id,
+                    "state": TestingFarmResult.passed,
+                    "created": "2021-11-01 17:22:36.061250",
+                },
+                ok=True,
+            )
+        ).once()
+    # both runs are for the same commit => the config is obtained only once
+    flexmock(TestingFarmResultsEvent).should_receive("get_packages_config").and_return(
+        PackageConfig(
+            jobs=[
+                JobConfig(
+                    type=JobType.tests,
+                    trigger=JobConfigTriggerType.pull_request,
+                    packages={"package": CommonPackageConfig()},
+                )
+            ],
+            packages={"package": CommonPackageConfig()},
+        )
+    ).once()
+    flexmock(TestingFarmResultsHandler).should_receive("run_job").and_return().twice()
+    flexmock(Pushgateway).should_receive("push").once()
+    assert check_pending_testing_farm_runs(concurrency=2) == BabysitStats(2, 2, 0)
+
+
+def test_check_pending_testing_farm_runs_connection_error():
+    run = flexmock(pipeline_id=1, submitted_time=datetime.datetime.utcnow())
+    run.should_receive("set_status").never()
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
+        TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
+    ).and_return([run]).once()
+    flexmock(requests.Session).should_receive("get").and_raise(
+        requests.Timeout("Testing Farm is slow")
+    ).once()
+    flexmock(TestingFarmResultsHandler).should_receive("run_job").never()
+    flexmock(Pushgateway).should_receive("push").once()
+    # the run is left for the next time
+    assert check_pending_testing_farm_runs() == BabysitStats(0, 0, 1)
+
+
+def test_check_pending_copr_builds_concurrently():
+    build1 = flexmock(
+        status=BuildStatus.pending,
+        build_id="1",
+        target="the-target",
+        build_submitted_time=datetime.datetime.utcnow(),
+    )
+    build2 = flexmock(
+        status=BuildStatus.pending,
+        build_id="2",
+        target="the-target",
+        build_submitted_time=datetime.datetime.utcnow(),
+    )
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
+        BuildStatus.pending
+    ).and_return([build1, build2])
+
+    copr_builds = {
+        1: flexmock(ended_on="timestamp", started_on="timestamp", state="succeeded"),
+        2: flexmock(ended_on=None, started_on=None, state="pending"),
+    }
+    chroot_build = flexmock(ended_on="timestamp", state="succeeded")
+    flexmock(Client).should_receive("create_from_config_file").and_return(
+        flexmock(
+            build_proxy=flexmock(get=lambda build_id: copr_builds[build_id]),
+            build_chroot_proxy=flexmock(
+                get=lambda build_id, target: chroot_build
+                if (build_id, target) == (1, "the-target")
+                else None
+            ),
+        )
+    )
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_build_state"
+    ).with_args(build1, copr_builds[1], chroot_build).once()
+
+    assert check_pending_copr_builds(concurrency=4) == BabysitStats(
+        checked=2, updated=1, skipped=0
+    )
+
+
+def test_check_pending_copr_builds_concurrently_copr_error():
+    build = flexmock(status=BuildStatus.pending, build_id="1")
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
+        BuildStatus.pending
+    ).and_return([build])
+
+    def get(build_id):
+        raise requests.ConnectionError("Copr is down")
+
+    flexmock(Client).should_receive("create_from_config_file").and_return(
+        flexmock(build_proxy=flexmock(get=get))
+    )
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_builds_with_copr_data"
+    ).never()
+
+    assert check_pending_copr_builds(concurrency=4) == BabysitStats(
+        checked=0, updated=0, skipped=1
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_check_pending_copr_builds_time_budget(concurrency):
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
+        BuildStatus.pending
+    ).and_return(
+        [
+            flexmock(status=BuildStatus.pending, build_id="1"),
+            flexmock(status=BuildStatus.pending, build_id="2"),
+        ]
+    )
+    flexmock(Client).should_receive("create_from_config_file").and_return(
+        flexmock(build_proxy=flexmock(get=lambda build_id: None))
+    )
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_builds"
+    ).never()
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_builds_with_copr_data"
+    ).never()
+
+    assert check_pending_copr_builds(
+        concurrency=concurrency, time_budget=0
+    ) == BabysitStats(checked=0, updated=0, skipped=2)
@@ -260,7 +260,7 @@ def test_check_rerun_pr_testing_farm_handler(
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args([run]).and_return(
         flexmock(grouped_targets=[test])
     )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test])
     flexmock(TestingFarmJobHelper).should_receive("run_testing_farm").once().and_return(
         TaskResults(success=True, details={})
     )
@@ -474,7 +474,7 @@ def test_check_rerun_push_testing_farm_handler(
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args([run]).and_return(
         flexmock(grouped_targets=[test])
     )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test])
     flexmock(TestingFarmJobHelper).should_receive("run_testing_farm").once().and_return(
         TaskResults(success=True, details={})
     )
@@ -1,30 +1,54 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import datetime, timezone
-from pathlib import Path
+from subprocess import PIPE, Popen
 
-from boto3.s3.transfer import S3Transfer
+import pytest
 from flexmock import flexmock
 
-from packit_service.models import SRPMBuildModel
+from packit.exceptions import PackitCommandFailedError
 from packit_service.worker import database
+from packit_service.worker.monitoring import Pushgateway
 
 
-def test_cleanup_old_srpm_build_logs():
-    srpm_build = flexmock(id=1, build_submitted_time=datetime.now(timezone.utc))
-    flexmock(srpm_build).should_receive("set_logs").with_args(None).once()
-    flexmock(srpm_build).should_receive("set_url").with_args(None).once()
-    flexmock(SRPMBuildModel).should_receive("get_older_than").and_return(
-        [srpm_build]
+def test_backup():
+    flexmock(database).should_receive("is_aws_configured").once().and_return(True)
+    flexmock(database).should_receive("start_dump").once().and_return(
+        Popen(["printf", "dump"], stdout=PIPE, stderr=PIPE)
+    )
+    uploaded = []
+    s3_client = flexmock()
+    s3_client.should_receive("upload_fileobj").replace_with(
+        lambda dump, bucket, key, Config: uploaded.append(
+            (dump.read(2) + dump.read(), bucket, key)
+        )
     ).once()
-    database.discard_old_srpm_build_logs()
+    flexmock(database).should_receive("boto3_client").and_return(s3_client)
+    flexmock(Pushgateway).should_receive("push").once()
 
+    database.backup(bucket="bucket")
 
-def test_backup():
+    assert uploaded == [(b"dump", "bucket", f"packit_database_{database.DB_NAME}.dump")]
+    assert Pushgateway().database_backup_size._value.get() == 4
+
+
+def test_backup_pg_dump_failed():
     flexmock(database).should_receive("is_aws_configured").once().and_return(True)
-    flexmock(database).should_receive("dump_to").once()
-    flexmock(database).should_receive("gzip_file").once().and_return(Path("xyz"))
-    flexmock(S3Transfer).should_receive("upload_file").once()
-    flexmock(Path).should_receive("unlink").twice()
-    database.backup()
+    flexmock(database).should_receive("start_dump").once().and_return(
+        Popen(
+            ["sh", "-c", "printf dump; echo failed >&2; exit 1"],
+            stdout=PIPE,
+            stderr=PIPE,
+        )
+    )
+    s3_client = flexmock()
+    s3_client.should_receive("upload_fileobj").replace_with(
+        # the upload reads until the end of the dump
+        lambda dump, *_, **__: [dump.read(1024) for _ in range(2)]
+    ).once()
+    flexmock(database).should_receive("boto3_client").and_return(s3_client)
+    flexmock(Pushgateway).should_receive("push").never()
+
+    with pytest.raises(PackitCommandFailedError) as exc_info:
+        database.backup(bucket="bucket")
+    assert exc_info.value.stderr_output == "failed\n"
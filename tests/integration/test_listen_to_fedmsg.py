@@ -681,17 +681,16 @@ def test_copr_build_end_testing_farm(copr_build_end, copr_build_pr):
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [copr_build_pr.group_of_targets.runs[-1]]
     ).and_return(group)
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").with_args(
+        targets={"fedora-rawhide-x86_64": [copr_build_pr]},
         pipeline_id=None,
         identifier=None,
         commit_sha="0011223344",
         status=TestingFarmResult.new,
-        target="fedora-rawhide-x86_64",
         web_url=None,
         test_run_group=group,
-        copr_build_targets=[copr_build_pr],
         data={"base_project_url": "https://github.com/foo/bar"},
-    ).and_return(tft_test_run_model)
+    ).and_return([tft_test_run_model])
 
     flexmock(StatusReporter).should_receive("report").with_args(
         state=BaseCommitStatus.running,
@@ -1619,7 +1618,7 @@ def test_copr_build_end_failed_testing_farm(copr_build_end, copr_build_pr):
         .with_args(TestingFarmResult.error)
         .mock()
     )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test])
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [copr_build_pr.group_of_targets.runs[-1]]
     ).and_return(flexmock(grouped_targets=[test]))
@@ -1806,7 +1805,7 @@ def test_copr_build_end_failed_testing_farm_no_json(copr_build_end, copr_build_p
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [copr_build_pr.group_of_targets.runs[-1]]
     ).and_return(flexmock(grouped_targets=[test]))
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test])
     flexmock(TestingFarmJobHelper).should_receive("is_fmf_configured").and_return(True)
     flexmock(TestingFarmJobHelper).should_receive("distro2compose").with_args(
         "fedora-rawhide-x86_64"
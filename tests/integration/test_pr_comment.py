@@ -587,7 +587,7 @@ def test_pr_test_command_handler(pr_embedded_command_comment_event):
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test_run])
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args([run]).and_return(
         flexmock(grouped_targets=[test_run])
     )
@@ -696,7 +696,7 @@ def test_pr_test_command_handler_identifiers(pr_embedded_command_comment_event):
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test_run])
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args([run]).and_return(
         flexmock(grouped_targets=[test_run])
     )
@@ -989,14 +989,16 @@ def test_pr_test_command_handler_retries(
     if retry_number > 0:
         flexmock(PipelineModel).should_receive("create").never()
         flexmock(TFTTestRunGroupModel).should_receive("create").never()
-        flexmock(TFTTestRunTargetModel).should_receive("create").never()
+        flexmock(TFTTestRunTargetModel).should_receive("bulk_create").never()
         flexmock(TFTTestRunTargetModel).should_receive("get_by_id").and_return(test_run)
     else:
         flexmock(PipelineModel).should_receive("create").and_return(
             flexmock(test_run_group=None)
         )
         flexmock(TFTTestRunGroupModel).should_receive("create").and_return(group)
-        flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+        flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return(
+            [test_run]
+        )
 
     if retry_number == 2:
         flexmock(test_run).should_receive("set_status").with_args(
@@ -1214,17 +1216,16 @@ def test_pr_test_command_handler_skip_build_option(pr_embedded_command_comment_e
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [run_model]
     ).and_return(group)
-    flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").with_args(
+        targets={"fedora-rawhide-x86_64": []},
         pipeline_id=None,
         identifier=None,
         commit_sha="0011223344",
         status=TestingFarmResult.new,
-        target="fedora-rawhide-x86_64",
         web_url=None,
         test_run_group=group,
-        copr_build_targets=[],
         data={"base_project_url": "https://github.com/packit-service/hello-world"},
-    ).and_return(tft_test_run_model)
+    ).and_return([tft_test_run_model])
     flexmock(tft_test_run_model).should_receive("set_pipeline_id").with_args(
         pipeline_id
     ).once()
@@ -1317,7 +1318,7 @@ def test_pr_test_command_handler_compose_not_present(
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test_run])
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [run_model]
     ).and_return(flexmock(grouped_targets=[test_run]))
@@ -1467,7 +1468,7 @@ def test_pr_test_command_handler_composes_not_available(
         target="fedora-rawhide-x86_64",
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test_run])
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [run_model]
     ).and_return(flexmock(grouped_targets=[test_run]))
@@ -1614,7 +1615,7 @@ def test_pr_test_command_handler_missing_build_trigger_with_build_job_config(
         copr_builds=[flexmock(status=BuildStatus.success)],
         target="test-target",
     )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test_run])
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [run_model]
     ).and_return(flexmock(grouped_targets=[test_run]))
@@ -2052,7 +2053,7 @@ def test_pr_test_command_handler_skip_build_option_no_fmf_metadata(
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
         [run_model]
     ).and_return(group_model)
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(test_run)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return([test_run])
     flexmock(TestingFarmJobHelper).should_receive("get_latest_copr_build").never()
     flexmock(Pushgateway).should_receive("push").times(3).and_return()
     flexmock(TestingFarmJobHelper).should_receive("report_status_to_tests").with_args(
@@ -2456,21 +2457,16 @@ def test_pr_test_command_handler_multiple_builds(pr_embedded_command_comment_eve
         grouped_targets=[tft_test_run_model_rawhide, tft_test_run_model_35],
     )
     flexmock(TFTTestRunGroupModel).should_receive("create").and_return(group)
-    for t, model in (
-        ("fedora-35-x86_64", tft_test_run_model_35),
-        ("fedora-rawhide-x86_64", tft_test_run_model_rawhide),
-    ):
-        flexmock(TFTTestRunTargetModel).should_receive("create").with_args(
-            pipeline_id=None,
-            identifier=None,
-            commit_sha="0011223344",
-            status=TestingFarmResult.new,
-            target=t,
-            web_url=None,
-            test_run_group=group,
-            copr_build_targets=[build],
-            data={"base_project_url": "https://github.com/packit-service/hello-world"},
-        ).and_return(model)
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").with_args(
+        targets={"fedora-35-x86_64": [build], "fedora-rawhide-x86_64": [build]},
+        pipeline_id=None,
+        identifier=None,
+        commit_sha="0011223344",
+        status=TestingFarmResult.new,
+        web_url=None,
+        test_run_group=group,
+        data={"base_project_url": "https://github.com/packit-service/hello-world"},
+    ).and_return([tft_test_run_model_35, tft_test_run_model_rawhide])
     flexmock(tft_test_run_model_rawhide).should_receive("add_copr_build").with_args(
         additional_copr_build
     )
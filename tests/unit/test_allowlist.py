@@ -17,6 +17,7 @@ from packit.copr_helper import CoprHelper
 from packit.local_project import LocalProject
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
+    ALLOWLIST_INDEX_MAX_AGE,
     DOCS_APPROVAL_URL,
     NOTIFICATION_REPO,
     DENIED_MSG,
@@ -28,7 +29,7 @@ from packit_service.models import (
     ProjectEventModel,
     ProjectEventModelType,
 )
-from packit_service.worker.allowlist import Allowlist
+from packit_service.worker.allowlist import Allowlist, AllowlistIndex
 from packit_service.worker.events import (
     EventData,
     IssueCommentEvent,
@@ -116,14 +117,12 @@ def allowlist_entries():
 
 
 def mock_model(entries, namespaces):
-    for queried_namespace in namespaces:
-        (
-            flexmock(DBAllowlist)
-            .should_receive("get_namespace")
-            .with_args(queried_namespace)
-            .and_return(entries.get(queried_namespace))
-            .ordered()
-        )
+    # the allowlist index is loaded anew in every test
+    flexmock(AllowlistIndex, _instance=None, _version=None)
+    flexmock(DBAllowlist).should_receive("get_version").and_return(None)
+    flexmock(DBAllowlist).should_receive("get_all").and_return(
+        [entries[namespace] for namespace in namespaces if entries.get(namespace)]
+    )
 
 
 @pytest.fixture()
@@ -230,6 +229,59 @@ def test_is_denied(allowlist, account_name, mocked_model, is_denied):
     assert allowlist.is_namespace_or_parent_denied(account_name) == is_denied
 
 
+@pytest.mark.parametrize(
+    "namespace, statuses",
+    (
+        ("github.com/konipas", [AllowlistStatus.waiting]),
+        ("github.com/krasomila", []),
+        (
+            "gitlab.com/packit-service/src/glibc.git",
+            [AllowlistStatus.approved_automatically, AllowlistStatus.denied],
+        ),
+        (
+            "gitlab.com/packit/packit.git",
+            [AllowlistStatus.denied, AllowlistStatus.approved_manually],
+        ),
+        (
+            "gitlab.com/packit-service/src",
+            [AllowlistStatus.approved_automatically, AllowlistStatus.denied],
+        ),
+        ("gitlab.com/packit-service/s", [AllowlistStatus.denied]),
+    ),
+)
+def test_allowlist_index_get_statuses(allowlist_entries, namespace, statuses):
+    index = AllowlistIndex(entry for entry in allowlist_entries.values() if entry)
+    assert index.get_statuses(namespace) == statuses
+
+
+def test_allowlist_index_reloaded_on_change(allowlist_entries):
+    flexmock(AllowlistIndex, _instance=None, _version=None)
+    flexmock(DBAllowlist).should_receive("get_version").and_return(1, 1, 2).one_by_one()
+    flexmock(DBAllowlist).should_receive("get_all").and_return(
+        [allowlist_entries["github.com/fero"]], []
+    ).one_by_one().twice()
+
+    assert Allowlist.is_namespace_or_parent_approved("github.com/fero/dwm.git")
+    # the allowlist has not changed, no query
+    assert Allowlist.is_namespace_or_parent_approved("github.com/fero/dwm.git")
+    # the allowlist has changed
+    assert not Allowlist.is_namespace_or_parent_approved("github.com/fero/dwm.git")
+
+
+def test_allowlist_index_kept_without_version(allowlist_entries):
+    flexmock(AllowlistIndex, _instance=None, _version=None, _loaded_at=0.0)
+    flexmock(DBAllowlist).should_receive("get_version").and_return(None)
+    flexmock(DBAllowlist).should_receive("get_all").and_return(
+        [allowlist_entries["github.com/fero"]], []
+    ).one_by_one().twice()
+
+    assert Allowlist.is_namespace_or_parent_approved("github.com/fero/dwm.git")
+    # Redis is not available, the loaded index is used until it's too old
+    assert Allowlist.is_namespace_or_parent_approved("github.com/fero/dwm.git")
+    AllowlistIndex._loaded_at -= ALLOWLIST_INDEX_MAX_AGE + 1
+    assert not Allowlist.is_namespace_or_parent_approved("github.com/fero/dwm.git")
+
+
 @pytest.mark.parametrize(
     "event, mocked_model, approved, user_namespace",
     [
@@ -10,7 +10,12 @@ from packit.config import (
     JobConfigTriggerType,
 )
 from packit_service.config import ServiceConfig
-from packit_service.models import CoprBuildTargetModel
+from packit_service.models import (
+    BuildStatus,
+    CoprBuildTargetModel,
+    TestingFarmResult,
+    TFTTestRunTargetModel,
+)
 from packit_service.worker.checker.koji import (
     PermissionOnKoji,
 )
@@ -18,19 +23,23 @@ from packit_service.worker.checker.koji import (
     IsJobConfigTriggerMatching as IsJobConfigTriggerMatchingKoji,
 )
 from packit_service.worker.checker.copr import (
+    BuildNotSuperseded,
     IsJobConfigTriggerMatching as IsJobConfigTriggerMatchingCopr,
 )
 from packit_service.worker.checker.testing_farm import (
     IsJobConfigTriggerMatching as IsJobConfigTriggerMatchingTF,
     IsIdentifierFromCommentMatching,
     IsLabelFromCommentMatching,
+    IsTestRunNotSuperseded,
 )
 from packit_service.worker.checker.vm_image import (
     IsCoprBuildForChrootOk,
     HasAuthorWriteAccess,
 )
 from packit_service.worker.events import (
+    CoprBuildEndEvent,
     PullRequestGithubEvent,
+    TestingFarmResultsEvent,
 )
 from packit_service.worker.events.event import EventData
 from packit_service.worker.events.github import (
@@ -512,3 +521,53 @@ def test_tf_comment_labels(comment, result):
     )
 
     assert checker.pre_check() == result
+
+
+@pytest.mark.parametrize(
+    "status, result",
+    (
+        pytest.param(BuildStatus.pending, True, id="Pending build"),
+        pytest.param(BuildStatus.superseded, False, id="Superseded build"),
+    ),
+)
+def test_copr_build_not_superseded(status, result):
+    flexmock(BuildNotSuperseded).should_receive("build").and_return(
+        flexmock(status=status)
+    )
+    flexmock(BuildNotSuperseded).should_receive("copr_event").and_return(
+        flexmock(build_id=1)
+    )
+    checker = BuildNotSuperseded(
+        package_config=flexmock(jobs=[]),
+        job_config=flexmock(),
+        event={"event_type": CoprBuildEndEvent.__name__},
+    )
+
+    assert checker.pre_check() == result
+
+
+@pytest.mark.parametrize(
+    "test_run, result",
+    (
+        pytest.param(None, True, id="Unknown run"),
+        pytest.param(
+            flexmock(status=TestingFarmResult.running), True, id="Running test run"
+        ),
+        pytest.param(
+            flexmock(status=TestingFarmResult.superseded),
+            False,
+            id="Superseded test run",
+        ),
+    ),
+)
+def test_tf_test_run_not_superseded(test_run, result):
+    flexmock(TFTTestRunTargetModel).should_receive("get_by_pipeline_id").with_args(
+        pipeline_id="123"
+    ).and_return(test_run)
+    checker = IsTestRunNotSuperseded(
+        package_config=flexmock(jobs=[]),
+        job_config=flexmock(),
+        event={"event_type": TestingFarmResultsEvent.__name__, "pipeline_id": "123"},
+    )
+
+    assert checker.pre_check() == result
@@ -1,10 +1,13 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
+
 import pytest
 from flexmock import flexmock
 from marshmallow import ValidationError
 
+from packit.config import PackageConfig
 from packit.exceptions import PackitConfigException
 from packit_service.config import (
     ServiceConfig,
@@ -14,6 +17,7 @@ from packit_service.config import (
 )
 from packit_service import config
 from packit_service.constants import TESTING_FARM_API_URL
+from packit_service.utils import dump_package_config
 
 
 @pytest.fixture(scope="module")
@@ -83,6 +87,7 @@ def test_parse_valid(service_config_valid):
         "github.com/other-private-namespace",
     }
     assert config.package_config_path_override is None
+    assert config.debounce_windows == {}
 
 
 def test_parse_optional_values(service_config_valid):
@@ -92,10 +97,26 @@ def test_parse_optional_values(service_config_valid):
             **service_config_valid,
             "testing_farm_api_url": "https://other.url",
             "package_config_path_override": ".distro/source-git.yaml",
+            "debounce_windows": {"pull_request": 10, "commit": 5},
         }
     )
     assert config.testing_farm_api_url == "https://other.url"
     assert config.package_config_path_override == ".distro/source-git.yaml"
+    assert config.debounce_windows == {"pull_request": 10, "commit": 5}
+
+
+@pytest.mark.parametrize(
+    "debounce_windows",
+    (
+        {"release": 10},
+        {"pull_request": -1},
+    ),
+)
+def test_parse_invalid_debounce_windows(service_config_valid, debounce_windows):
+    with pytest.raises(ValidationError):
+        ServiceConfig.get_from_dict(
+            {**service_config_valid, "debounce_windows": debounce_windows}
+        )
 
 
 @pytest.fixture(scope="module")
@@ -210,6 +231,72 @@ def test_get_package_config_from_repo(
     )
 
 
+def test_get_package_config_from_repo_cached():
+    project = flexmock(
+        service=flexmock(instance_url="https://github.com"),
+        full_repo_name="packit/ogr",
+    )
+    package_config = PackageConfig.get_from_dict(
+        {
+            "specfile_path": "python-ogr.spec",
+            "jobs": [{"job": "copr_build", "trigger": "pull_request"}],
+        },
+        repo_name="ogr",
+    )
+    flexmock(config).should_receive("get_package_config_from_repo").with_args(
+        project=project,
+        ref="7c4d4ed4e0d9f7f9e55e42d5a6dfa5e3c6b9e8d2",
+        package_config_path=None,
+    ).once().and_return(package_config)
+
+    assert (
+        PackageConfigGetter.get_package_config_from_repo(
+            project=project,
+            reference="7c4d4ed4e0d9f7f9e55e42d5a6dfa5e3c6b9e8d2",
+        )
+        is package_config
+    )
+    for _ in range(2):
+        cached_config = PackageConfigGetter.get_package_config_from_repo(
+            project=project,
+            reference="7c4d4ed4e0d9f7f9e55e42d5a6dfa5e3c6b9e8d2",
+        )
+        assert cached_config == package_config
+        # every caller gets its own copy
+        assert cached_config is not package_config
+
+
+def test_get_package_config_from_repo_cached_in_redis():
+    project = flexmock(
+        service=flexmock(instance_url="https://github.com"),
+        full_repo_name="packit/ogr",
+    )
+    package_config = PackageConfig.get_from_dict(
+        {"specfile_path": "python-ogr.spec"}, repo_name="ogr"
+    )
+    key = (
+        "packit-service:package-config:https://github.com/packit/ogr:"
+        "7c4d4ed4e0d9f7f9e55e42d5a6dfa5e3c6b9e8d2:"
+    )
+    flexmock(config).should_receive("get_redis").and_return(
+        flexmock()
+        .should_receive("get")
+        .with_args(key)
+        .and_return(json.dumps(dump_package_config(package_config)))
+        .once()
+        .mock()
+    )
+    flexmock(config).should_receive("get_package_config_from_repo").never()
+
+    assert (
+        PackageConfigGetter.get_package_config_from_repo(
+            project=project,
+            reference="7c4d4ed4e0d9f7f9e55e42d5a6dfa5e3c6b9e8d2",
+        )
+        == package_config
+    )
+
+
 def test_get_package_config_from_repo_no_project():
     """When neither a project nor a base_project is provided,
     None is returned and no exception is raised.
@@ -278,9 +278,10 @@ def test_run_copr_build_from_source_script(github_pr_event, srpm_build_deps):
     flexmock(build).should_receive("set_build_id")
     flexmock(build).should_receive("set_web_url")
     group = flexmock(id=1, grouped_targets=4 * [build])
-    flexmock(CoprBuildTargetModel).should_receive("create").and_return(build)
     flexmock(CoprBuildGroupModel).should_receive("create").and_return(group)
-    flexmock(CoprBuildTargetModel).should_receive("create").and_return(build).times(4)
+    flexmock(CoprBuildTargetModel).should_receive("bulk_create").and_return(
+        4 * [build]
+    ).once()
     flexmock(PullRequestGithubEvent).should_receive("db_project_event").and_return(
         flexmock()
     )
@@ -400,7 +401,7 @@ def test_run_copr_build_from_source_script_github_outage_retry(
     group = flexmock(id=1, grouped_targets=[build])
     if retry_number > 0:
         flexmock(CoprBuildGroupModel).should_receive("get_by_id").and_return(group)
-        flexmock(CoprBuildTargetModel).should_receive("create").never()
+        flexmock(CoprBuildTargetModel).should_receive("bulk_create").never()
         flexmock(CoprBuildGroupModel).should_receive("create").never()
         # We set it to pending
         flexmock(build).should_receive("set_status").with_args(
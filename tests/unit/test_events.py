@@ -465,6 +465,15 @@ class TestEvents:
         ).once()
         assert event_object.packages_config
 
+        event_dict = event_object.get_dict()
+        assert event_dict["commit_sha"] == "12345"
+        assert not {
+            "_build_targets_override",
+            "_tests_targets_override",
+            "_comment_object",
+            "_package_config",
+        } & event_dict.keys()
+
     def test_parse_mr_comment(self, gitlab_mr_comment):
         event_object = Parser.parse_event(gitlab_mr_comment)
 
@@ -1817,3 +1826,32 @@ class TestEvents:
     )
     def test_parse_check_name(self, check_name, db_project_event, result):
         assert Parser.parse_check_name(check_name, db_project_event) == result
+
+    @pytest.mark.parametrize(
+        "path, source, event_type",
+        [
+            ("fedmsg/copr_build_end.json", "fedora-messaging", "copr.build.end"),
+            (
+                "fedmsg/koji_build_scratch_end.json",
+                "fedora-messaging",
+                "buildsys.task.state.change",
+            ),
+            (
+                "fedmsg/pagure_pr_flag_updated.json",
+                "fedora-messaging",
+                "pagure.pull-request.flag.updated",
+            ),
+            ("webhooks/testing_farm/notification.json", "testing-farm", "results"),
+            ("webhooks/gitlab/mr_comment.json", "gitlab", "Note Hook"),
+            ("webhooks/gitlab/tag_push.json", "gitlab", "Tag Push Hook"),
+            ("webhooks/github/installation_created.json", "github", "installation"),
+            ("webhooks/github/checkrun_rerequested.json", "github", "check_run"),
+            ("webhooks/github/pr_comment_build.json", "github", "issue_comment"),
+            ("webhooks/github/pr.json", "github", "pull_request"),
+            ("webhooks/github/push_branch.json", "github", "push"),
+            ("webhooks/testing_farm/results.json", None, None),
+        ],
+    )
+    def test_get_event_type(self, path, source, event_type):
+        event = json.loads((DATA_DIR / path).read_text())
+        assert Parser.get_event_type(event) == (source, event_type)
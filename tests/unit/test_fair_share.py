@@ -0,0 +1,79 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import celery
+import pytest
+from flexmock import flexmock
+from redis.exceptions import RedisError
+
+from packit_service.constants import FAIR_SHARE_MAX_DELAY
+from packit_service.worker import fair_share
+from packit_service.worker.fair_share import dispatch
+from packit_service.worker.monitoring import Pushgateway
+
+PROJECT_URL = "https://github.com/packit/ogr"
+
+
+def mock_env(env):
+    flexmock(fair_share).should_receive("getenv").replace_with(
+        lambda name, default=None: env.get(name, default)
+    )
+
+
+@pytest.mark.parametrize(
+    "env, project_url",
+    (
+        pytest.param({}, PROJECT_URL, id="disabled"),
+        pytest.param({"FAIR_SHARE_RATE": "1"}, None, id="no project"),
+    ),
+)
+def test_dispatch_right_away(env, project_url):
+    mock_env(env)
+    signatures = [flexmock(), flexmock()]
+    flexmock(fair_share).should_receive("take_tokens").never()
+    flexmock(celery).should_receive("group").with_args(signatures).and_return(
+        flexmock().should_receive("apply_async").once().mock()
+    ).once()
+
+    dispatch(project_url, signatures)
+
+
+def test_dispatch_redis_unavailable():
+    mock_env({"FAIR_SHARE_RATE": "1"})
+    signatures = [flexmock(), flexmock()]
+    flexmock(fair_share).should_receive("take_tokens").and_raise(RedisError)
+    flexmock(celery).should_receive("group").with_args(signatures).and_return(
+        flexmock().should_receive("apply_async").once().mock()
+    ).once()
+
+    dispatch(PROJECT_URL, signatures)
+
+
+def test_dispatch_over_fair_share():
+    mock_env({"FAIR_SHARE_RATE": "0.5", "FAIR_SHARE_BURST": "2"})
+    signatures = [flexmock() for _ in range(5)]
+    flexmock(fair_share).should_receive("take_tokens").with_args(
+        PROJECT_URL, 5, 0.5, 2
+    ).and_return(([0.0, 0.0, 2.0, 4.0, 2 * FAIR_SHARE_MAX_DELAY], -3.0)).once()
+    flexmock(celery).should_receive("group").with_args(signatures[:2]).and_return(
+        flexmock().should_receive("apply_async").once().mock()
+    ).once()
+    for signature, countdown in zip(signatures[2:], (2.0, 4.0, FAIR_SHARE_MAX_DELAY)):
+        signature.should_receive("apply_async").with_args(countdown=countdown).once()
+    flexmock(Pushgateway).should_receive("push").once()
+    registry = Pushgateway().registry
+    deferred_before = (
+        registry.get_sample_value("fair_share_deferred_total", {"project": PROJECT_URL})
+        or 0
+    )
+
+    dispatch(PROJECT_URL, signatures)
+
+    assert (
+        registry.get_sample_value("fair_share_queue_depth", {"project": PROJECT_URL})
+        == 3
+    )
+    assert (
+        registry.get_sample_value("fair_share_deferred_total", {"project": PROJECT_URL})
+        == deferred_before + 3
+    )
@@ -169,13 +169,16 @@ def test_koji_build_check_names(github_pr_event):
         )
     )
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(flexmock(id=1))
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(
+    koji_build_model = (
         flexmock(id=1)
         .should_receive("set_build_id")
         .mock()
         .should_receive("set_web_url")
         .mock()
     )
+    flexmock(KojiBuildTargetModel).should_receive("bulk_create").replace_with(
+        lambda targets, **_: len(targets) * [koji_build_model]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     # koji build
@@ -252,7 +255,10 @@ def test_koji_build_failed_kerberos(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(flexmock(id=1))
+    koji_build_model = flexmock(id=1)
+    flexmock(KojiBuildTargetModel).should_receive("bulk_create").replace_with(
+        lambda targets, **_: len(targets) * [koji_build_model]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     flexmock(PackitAPI).should_receive("init_kerberos_ticket").and_raise(
@@ -331,7 +337,10 @@ def test_koji_build_target_not_supported(github_pr_event):
         )
     )
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(flexmock(id=1))
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(flexmock(id=1))
+    koji_build_model = flexmock(id=1)
+    flexmock(KojiBuildTargetModel).should_receive("bulk_create").replace_with(
+        lambda targets, **_: len(targets) * [koji_build_model]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     response = helper.run_koji_build()
@@ -389,12 +398,15 @@ def test_koji_build_with_multiple_targets(github_pr_event):
         )
     )
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(flexmock(id=1))
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(
+    koji_build_model = (
         flexmock(id=1)
         .should_receive("set_build_id")
         .mock()
         .should_receive("set_web_url")
         .mock()
+    )
+    flexmock(KojiBuildTargetModel).should_receive("bulk_create").replace_with(
+        lambda targets, **_: len(targets) * [koji_build_model]
     ).and_return(
         flexmock(id=2)
         .should_receive("set_build_id")
@@ -485,9 +497,12 @@ def test_koji_build_failed(github_pr_event):
         )
     )
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(flexmock(id=1))
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(
+    koji_build_model = (
         flexmock(id=1).should_receive("set_status").with_args("error").mock()
     )
+    flexmock(KojiBuildTargetModel).should_receive("bulk_create").replace_with(
+        lambda targets, **_: len(targets) * [koji_build_model]
+    )
     flexmock(PackitAPI).should_receive("create_srpm").and_return("my.srpm")
 
     # koji build
@@ -558,7 +573,7 @@ def test_koji_build_failed_srpm(github_pr_event):
             flexmock(),
         )
     )
-    flexmock(KojiBuildTargetModel).should_receive("create").never()
+    flexmock(KojiBuildTargetModel).should_receive("bulk_create").never()
     flexmock(sentry_integration).should_receive("send_to_sentry").and_return().once()
 
     result = helper.run_koji_build()
@@ -614,12 +629,15 @@ def test_koji_build_targets_override(github_pr_event):
         )
     )
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(flexmock(id=1))
-    flexmock(KojiBuildTargetModel).should_receive("create").and_return(
+    koji_build_model = (
         flexmock(id=1)
         .should_receive("set_build_id")
         .mock()
         .should_receive("set_web_url")
         .mock()
+    )
+    flexmock(KojiBuildTargetModel).should_receive("bulk_create").replace_with(
+        lambda targets, **_: len(targets) * [koji_build_model]
     ).and_return(
         flexmock(id=2)
         .should_receive("set_build_id")
@@ -0,0 +1,115 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import time
+from gzip import decompress
+from io import BytesIO
+from os import utime
+
+import boto3
+import pytest
+from flexmock import flexmock
+
+from packit_service import log_store
+from packit_service.constants import LOG_STORE_CHUNK_SIZE
+from packit_service.log_store import (
+    FilesystemLogStore,
+    S3LogStore,
+    get_log_store,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_log_store():
+    get_log_store.cache_clear()
+    yield
+    get_log_store.cache_clear()
+
+
+def test_filesystem_log_store(tmp_path):
+    store = FilesystemLogStore(tmp_path)
+    logs = "some\nboring\nlogs\n" * 10_000
+
+    reference = store.put(logs)
+    assert reference.startswith("sha256:")
+    digest = reference.removeprefix("sha256:")
+    path = tmp_path / digest[:2] / f"{digest}.gz"
+    assert decompress(path.read_bytes()).decode() == logs
+
+    # the same logs are stored once
+    assert store.put(logs) == reference
+    assert list(tmp_path.glob("*/*")) == [path]
+
+    assert store.get(reference) == logs
+    chunks = list(store.stream(reference))
+    assert len(chunks) > 1
+    assert all(len(chunk) <= LOG_STORE_CHUNK_SIZE for chunk in chunks)
+
+    # the logs stored (again) recently are kept
+    old_time = time.time() - 2 * 3600
+    utime(path, (old_time, old_time))
+    store.put(logs)
+    assert not store.delete(reference, grace_period=3600)
+    assert path.exists()
+
+    utime(path, (old_time, old_time))
+    assert store.delete(reference, grace_period=3600)
+    assert not path.exists()
+    # already deleted
+    assert store.delete(reference, grace_period=3600)
+
+
+def test_filesystem_log_store_invalid_reference(tmp_path):
+    with pytest.raises(ValueError):
+        FilesystemLogStore(tmp_path).get("../../etc/passwd")
+
+
+def test_s3_log_store():
+    s3_client = flexmock()
+    flexmock(boto3).should_receive("client").with_args(
+        "s3", endpoint_url=None
+    ).and_return(s3_client)
+    store = S3LogStore(bucket="bucket", prefix="logs/")
+
+    stored = {}
+    s3_client.should_receive("put_object").replace_with(
+        lambda Bucket, Key, Body, **_: stored.__setitem__((Bucket, Key), Body)
+    )
+    s3_client.should_receive("get_object").replace_with(
+        lambda Bucket, Key: {"Body": BytesIO(stored[Bucket, Key])}
+    )
+
+    reference = store.put("logs")
+    digest = reference.removeprefix("sha256:")
+    assert list(stored) == [("bucket", f"logs/{digest[:2]}/{digest}.gz")]
+    assert decompress(stored["bucket", f"logs/{digest[:2]}/{digest}.gz"]) == b"logs"
+    assert store.get(reference) == "logs"
+
+
+@pytest.mark.parametrize(
+    "url, expected_type, attributes",
+    [
+        (None, None, {}),
+        ("file:///var/lib/logs", FilesystemLogStore, {}),
+        ("s3://bucket/packit/logs/", S3LogStore, {"prefix": "packit/logs/"}),
+        ("s3://bucket", S3LogStore, {"prefix": ""}),
+        ("ftp://logs.example.com", None, {}),
+    ],
+)
+def test_get_log_store(url, expected_type, attributes):
+    flexmock(log_store).should_receive("getenv").with_args("LOG_STORE_URL").and_return(
+        url
+    )
+    flexmock(log_store).should_receive("getenv").with_args(
+        "LOG_STORE_S3_ENDPOINT_URL"
+    ).and_return(None)
+    flexmock(boto3).should_receive("client").and_return(flexmock())
+
+    store = get_log_store()
+    if expected_type is None:
+        assert store is None
+        return
+
+    assert isinstance(store, expected_type)
+    for attribute, value in attributes.items():
+        assert getattr(store, attribute) == value
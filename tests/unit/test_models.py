@@ -3,7 +3,12 @@ from datetime import datetime, timedelta
 import pytest
 from flexmock import flexmock
 
+from packit_service import models as models_module
+from packit_service.log_store import FilesystemLogStore
 from packit_service.models import (
+    DbIdCache,
+    PullRequestModel,
+    SRPMBuildModel,
     filter_most_recent_target_models_by_status,
     TestingFarmResult,
     filter_most_recent_target_names_by_status,
@@ -55,3 +60,48 @@ def test_filter_most_recent_target_names_by_status(models):
     assert filter_most_recent_target_names_by_status(
         models, [TestingFarmResult.passed]
     ) == {"target-a"}
+
+
+def test_db_id_cache(redis_storage):
+    key = DbIdCache.get_key(
+        PullRequestModel, "https://github.com/packit/ogr", "packit", "ogr", 342
+    )
+    assert key == (
+        "packit-service:db-id:pull_requests:"
+        "https://github.com/packit/ogr:packit:ogr:342"
+    )
+    assert DbIdCache.get(key) is None
+
+    DbIdCache.set(key, 21)
+    assert DbIdCache.get(key) == 21
+
+    # the ID is shared with the other processes via Redis
+    DbIdCache.clear()
+    redis_storage[key] = b"21"
+    assert DbIdCache.get(key) == 21
+
+
+def test_db_id_cache_get_object():
+    key = DbIdCache.get_key(PullRequestModel, "https://github.com/a/b", "a", "b", 1)
+    session = flexmock()
+    session.should_receive("get").never()
+    assert DbIdCache.get_object(session, PullRequestModel, key, pr_id=1) is None
+
+    DbIdCache.set(key, 21)
+    pr = flexmock(id=21, pr_id=1)
+    session.should_receive("get").with_args(PullRequestModel, 21).and_return(pr)
+    assert DbIdCache.get_object(session, PullRequestModel, key, pr_id=1) == pr
+    # the object with the cached ID is a different one
+    assert DbIdCache.get_object(session, PullRequestModel, key, pr_id=2) is None
+
+
+def test_get_logs_missing_in_log_store(tmp_path):
+    log_store = FilesystemLogStore(tmp_path)
+    flexmock(models_module).should_receive("get_log_store").and_return(log_store)
+    reference = log_store.put("some\nboring\nlogs")
+    srpm_build = SRPMBuildModel(logs_reference=reference)
+    assert srpm_build.get_logs() == "some\nboring\nlogs"
+
+    log_store.delete(reference)
+    assert srpm_build.get_logs() is None
+    assert list(srpm_build.iter_logs()) == []
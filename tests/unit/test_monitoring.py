@@ -2,15 +2,19 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+from threading import Event
 
 from flexmock import flexmock
 import pytest
 
+from packit_service.constants import PUSHGATEWAY_TIMEOUT
+from packit_service.worker import monitoring
 from packit_service.worker.handlers import (
     CoprBuildHandler,
     TestingFarmHandler,
 )
 from packit_service.worker.jobs import SteveJobs
+from packit_service.worker.monitoring import Pushgateway
 
 
 @pytest.mark.parametrize(
@@ -74,3 +78,26 @@ def test_delayed():
     jobs.pushgateway = pushgateway
 
     jobs.push_statuses_metrics([created_at + datetime.timedelta(seconds=42)])
+
+
+def test_pushgateway_shared_registry():
+    first, second = Pushgateway(), Pushgateway()
+
+    assert first.registry is second.registry
+    assert first.events_processed is second.events_processed
+
+
+def test_push_in_background():
+    pushgateway = Pushgateway()
+    flexmock(pushgateway, worker_name="packit-worker-0")
+    pushed = Event()
+    flexmock(monitoring).should_receive("push_to_gateway").with_args(
+        pushgateway.pushgateway_address,
+        job="packit-worker-0",
+        registry=pushgateway.registry,
+        timeout=PUSHGATEWAY_TIMEOUT,
+    ).replace_with(lambda *args, **kwargs: pushed.set()).once()
+
+    pushgateway.push()
+
+    assert pushed.wait(timeout=5)
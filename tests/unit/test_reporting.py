@@ -1,5 +1,8 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
+
+import time
+
 import gitlab
 import pytest
 from flexmock import flexmock
@@ -469,6 +472,190 @@ def test_status_instead_check(
     reporter.set_status(state, title, check_name, url)
 
 
+@pytest.mark.parametrize("concurrency", ["1", "4"])
+def test_report_multiple_checks(concurrency):
+    flexmock(reporting).should_receive("getenv").with_args(
+        "STATUS_REPORTING_CONCURRENCY", int
+    ).and_return(concurrency)
+    flexmock(reporting).should_receive("getenv").with_args(
+        "STATUS_COALESCING_WINDOW", int
+    ).and_return("0")
+    reporter = StatusReporter.get_instance(
+        project=GithubProject(None, None, None),
+        commit_sha="7654321",
+        pr_id=None,
+        packit_user="packit",
+    )
+    check_names = [f"rpm-build:fedora-{version}-x86_64" for version in range(36, 40)]
+    for check_name in check_names:
+        flexmock(reporter).should_receive("set_status").with_args(
+            state=BaseCommitStatus.pending,
+            description="Task was accepted.",
+            check_name=check_name,
+            url="",
+            links_to_external_services=None,
+            markdown_content=None,
+        ).once()
+    feedback_times = []
+
+    reporter.report(
+        state=BaseCommitStatus.pending,
+        description="Task was accepted.",
+        # duplicates are reported only once
+        check_names=check_names + check_names[:2],
+        update_feedback_time=feedback_times.append,
+    )
+
+    assert len(feedback_times) == len(check_names)
+
+
+def test_report_unchanged_status():
+    reporter = StatusReporter.get_instance(
+        project=flexmock(),
+        commit_sha="7654321",
+        pr_id=None,
+        packit_user="packit",
+    )
+    for description in ("Task was accepted.", "Build is in progress..."):
+        flexmock(reporter).should_receive("set_status").with_args(
+            state=BaseCommitStatus.running,
+            description=description,
+            check_name="rpm-build:fedora-rawhide-x86_64",
+            url="",
+            links_to_external_services=None,
+            markdown_content=None,
+        ).once()
+
+    for description in (
+        "Task was accepted.",
+        # the same status is not set again
+        "Task was accepted.",
+        "Build is in progress...",
+    ):
+        reporter.report(
+            state=BaseCommitStatus.running,
+            description=description,
+            check_names="rpm-build:fedora-rawhide-x86_64",
+        )
+
+
+def test_report_coalesced_statuses():
+    flexmock(reporting).should_receive("getenv").with_args(
+        "STATUS_REPORTING_CONCURRENCY", int
+    ).and_return("1")
+    flexmock(reporting).should_receive("getenv").with_args(
+        "STATUS_COALESCING_WINDOW", int
+    ).and_return("60")
+    reporter = StatusReporter.get_instance(
+        project=flexmock(),
+        commit_sha="7654321",
+        pr_id=None,
+        packit_user="packit",
+    )
+    reporter.report(
+        state=BaseCommitStatus.pending,
+        description="Task was accepted.",
+        check_names=["testing-farm:fedora-rawhide-x86_64", "rpm-build:fedora-38"],
+    )
+    reporter.report(
+        state=BaseCommitStatus.running,
+        description="Tests are running...",
+        check_names="testing-farm:fedora-rawhide-x86_64",
+    )
+
+    # the final state is set right away, the deferred ones are dropped
+    flexmock(reporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.success,
+        description="Build succeeded.",
+        check_name="rpm-build:fedora-38",
+        url="",
+        links_to_external_services=None,
+        markdown_content=None,
+    ).once()
+    reporter.report(
+        state=BaseCommitStatus.success,
+        description="Build succeeded.",
+        check_names="rpm-build:fedora-38",
+    )
+
+    # only the latest of the deferred states is set
+    flexmock(reporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.running,
+        description="Tests are running...",
+        check_name="testing-farm:fedora-rawhide-x86_64",
+        url="",
+        links_to_external_services=None,
+        markdown_content=None,
+    ).once()
+    StatusReporter.flush_deferred()
+    # nothing is left to be set
+    StatusReporter.flush_deferred()
+
+
+def test_report_coalesced_statuses_window_elapsed():
+    flexmock(reporting).should_receive("getenv").with_args(
+        "STATUS_REPORTING_CONCURRENCY", int
+    ).and_return("1")
+    flexmock(reporting).should_receive("getenv").with_args(
+        "STATUS_COALESCING_WINDOW", int
+    ).and_return("0.01")
+    reporter = StatusReporter.get_instance(
+        project=flexmock(),
+        commit_sha="7654321",
+        pr_id=None,
+        packit_user="packit",
+    )
+    flexmock(reporter).should_receive("set_status").never()
+    reporter.report(
+        state=BaseCommitStatus.pending,
+        description="Task was accepted.",
+        check_names="testing-farm:fedora-rawhide-x86_64",
+    )
+    time.sleep(0.02)
+
+    # the deferred states are sent by the next report after the window
+    flexmock(reporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.running,
+        description="Tests are running...",
+        check_name="testing-farm:fedora-rawhide-x86_64",
+        url="",
+        links_to_external_services=None,
+        markdown_content=None,
+    ).once()
+    reporter.report(
+        state=BaseCommitStatus.running,
+        description="Tests are running...",
+        check_names="testing-farm:fedora-rawhide-x86_64",
+    )
+    # nothing is left to be set
+    StatusReporter.flush_deferred()
+
+
+def test_report_failed_status():
+    reporter = StatusReporter.get_instance(
+        project=flexmock(),
+        commit_sha="7654321",
+        pr_id=None,
+        packit_user="packit",
+    )
+    # the failed status is set again
+    flexmock(reporter).should_receive("set_status").with_args(
+        state=BaseCommitStatus.running,
+        description="Task was accepted.",
+        check_name="rpm-build:fedora-rawhide-x86_64",
+        url="",
+        links_to_external_services=None,
+        markdown_content=None,
+    ).and_return(False).and_return(None).twice()
+
+    for _ in range(2):
+        reporter.report(
+            state=BaseCommitStatus.running,
+            description="Task was accepted.",
+            check_names="rpm-build:fedora-rawhide-x86_64",
+        )
+
+
 def test_create_table():
     assert create_table_content(
         "dashboard.packit.dev-url",
@@ -0,0 +1,45 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from datetime import datetime, timedelta
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.worker import retention
+from packit_service.worker.retention import apply_retention
+
+
+@pytest.mark.parametrize(
+    "env, pipelines_before_days",
+    [
+        ({}, None),
+        ({"PIPELINES_OUTDATED_AFTER_DAYS": "365"}, 365),
+    ],
+)
+def test_apply_retention(env, pipelines_before_days):
+    flexmock(retention).should_receive("getenv").replace_with(
+        lambda name, default=None: env.get(name, default)
+    )
+
+    def check(
+        srpm_build_logs_before,
+        pipelines_before,
+        batch_size,
+        batch_sleep,
+        time_limit,
+    ):
+        now = datetime.utcnow()
+        assert (
+            now - timedelta(days=31) < srpm_build_logs_before < now - timedelta(days=29)
+        )
+        if pipelines_before_days is None:
+            assert pipelines_before is None
+        else:
+            assert pipelines_before < now - timedelta(days=pipelines_before_days - 1)
+        assert (batch_size, batch_sleep, time_limit) == (1000, 0.5, 300)
+        return flexmock(run=lambda: [])
+
+    flexmock(retention).should_receive("Retention").replace_with(check).once()
+
+    assert apply_retention() == []
@@ -34,11 +34,16 @@ from packit_service.models import (
 from packit_service.service.db_project_events import AddReleaseDbTrigger
 from packit_service.service.urls import get_propose_downstream_info_url
 from packit_service.worker.allowlist import Allowlist
+from packit_service.worker.events import PullRequestCommentGithubEvent
+from packit_service.worker.events.enums import PullRequestCommentAction
 from packit_service.worker.helpers.sync_release.propose_downstream import (
     ProposeDownstreamJobHelper,
 )
+from packit_service.worker import jobs
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.parser import Parser
+from packit_service.worker.result import TaskResults
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.tasks import run_propose_downstream_handler
 from tests.spellbook import DATA_DIR, first_dict_value, get_parameters_from_results
@@ -235,3 +240,103 @@ def test_ignore_delete_branch(github_push):
     processing_results = SteveJobs.process_message(github_push)
 
     assert processing_results == []
+
+
+def test_process_message_duplicate_delivery():
+    event = {"topic": "org.fedoraproject.prod.copr.build.end", "build": 123}
+    flexmock(SteveJobs).should_receive("_process_message").and_return([]).once()
+    flexmock(SteveJobs.pushgateway.events_duplicate).should_receive("inc").once()
+
+    # fedmsg events are identified by their content
+    assert SteveJobs.process_message(event) == []
+    assert SteveJobs.process_message(dict(event)) == []
+
+
+def test_process_message_debounce():
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig(debounce_windows={"pull_request": 10})
+    )
+    event_object = flexmock(pre_check=lambda: True)
+    flexmock(Parser).should_receive("parse_event").and_return(event_object)
+    flexmock(jobs).should_receive("get_debounce_subject").with_args(
+        event_object
+    ).and_return(("pull_request", "https://github.com/packit/ogr:pr:1"))
+
+    tokens = []
+
+    def send_task(name, kwargs, countdown):
+        assert countdown == 10
+        assert kwargs["delivery_id"] == str(len(tokens))
+        tokens.append(kwargs["debounce_token"])
+
+    flexmock(jobs.celery_app).should_receive("send_task").replace_with(
+        send_task
+    ).twice()
+
+    # two events for the same PR within the window are delayed
+    for delivery_id in ("0", "1"):
+        results = SteveJobs.process_message({}, delivery_id=delivery_id)
+        assert results[0]["details"]["msg"] == "Event delayed by 10s for debouncing."
+
+    # only the latest one is processed
+    flexmock(SteveJobs.pushgateway.events_debounced).should_receive("inc").once()
+    assert (
+        SteveJobs.process_message({}, delivery_id="0", debounce_token=tokens[0]) == []
+    )
+
+    results = [TaskResults(success=True, details={})]
+    flexmock(SteveJobs).should_receive("process").and_return(results).once()
+    assert (
+        SteveJobs.process_message({}, delivery_id="1", debounce_token=tokens[1])
+        == results
+    )
+
+
+def pr_comment_event(comment):
+    return PullRequestCommentGithubEvent(
+        action=PullRequestCommentAction.created,
+        pr_id=1,
+        base_repo_namespace="packit",
+        base_repo_name="ogr",
+        base_ref="",
+        target_repo_namespace="packit",
+        target_repo_name="ogr",
+        project_url="https://github.com/packit/ogr",
+        actor="me",
+        comment=comment,
+        comment_id=1,
+    )
+
+
+def test_process_message_debounce_comments():
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig(debounce_windows={"comment": 10})
+    )
+    comments = ["/packit build", "/packit test", "thanks!"]
+    flexmock(Parser).should_receive("parse_event").and_return(
+        *(pr_comment_event(comment) for comment in comments)
+    ).one_by_one()
+    flexmock(PullRequestCommentGithubEvent).should_receive("pre_check").and_return(True)
+    tokens = []
+    flexmock(jobs.celery_app).should_receive("send_task").replace_with(
+        lambda name, kwargs, countdown: tokens.append(kwargs["debounce_token"])
+    ).twice()
+    results = [TaskResults(success=True, details={})]
+    flexmock(SteveJobs).should_receive("process").and_return(results).times(3)
+
+    # the different commands within the window are delayed
+    for delivery_id in ("0", "1"):
+        SteveJobs.process_message({}, delivery_id=delivery_id)
+    # the comment without a command is not debounced
+    assert SteveJobs.process_message({}, delivery_id="2") == results
+
+    # none of the commands is dropped
+    flexmock(Parser).should_receive("parse_event").and_return(
+        *(pr_comment_event(comment) for comment in comments[:2])
+    ).one_by_one()
+    flexmock(SteveJobs.pushgateway.events_debounced).should_receive("inc").never()
+    for delivery_id, token in zip(("0", "1"), tokens):
+        assert (
+            SteveJobs.process_message({}, delivery_id=delivery_id, debounce_token=token)
+            == results
+        )
@@ -0,0 +1,108 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import pytest
+import requests
+from copr.v3 import Client as CoprClient, CoprRequestException
+from flexmock import flexmock
+
+from packit_service.config import ServiceConfig
+from packit_service.constants import TESTING_FARM_API_TIMEOUT
+from packit_service.worker.helpers import supersede
+from packit_service.worker.helpers.supersede import (
+    cancel_copr_builds,
+    cancel_testing_farm_requests,
+    supersede_pull_request_runs,
+)
+
+
+@pytest.mark.parametrize(
+    "copr_build_ids, tf_request_ids",
+    (
+        ([], []),
+        (["1"], []),
+        ([], ["a"]),
+        (["1", "2"], ["a"]),
+    ),
+)
+def test_supersede_pull_request_runs(copr_build_ids, tf_request_ids):
+    pr = flexmock(pr_id=21)
+    pr.should_receive("has_pending_runs_of_other_commits").with_args(
+        "abcdef"
+    ).and_return(True)
+    pr.should_receive("supersede_pending_runs").with_args("abcdef").and_return(
+        (copr_build_ids, tf_request_ids)
+    ).once()
+    project = flexmock()
+    project.should_receive("get_pr").with_args(21).and_return(
+        flexmock(head_commit="abcdef")
+    )
+    flexmock(supersede).should_receive("cancel_copr_builds").with_args(
+        copr_build_ids
+    ).times(1 if copr_build_ids else 0)
+    flexmock(supersede).should_receive("cancel_testing_farm_requests").with_args(
+        tf_request_ids
+    ).times(1 if tf_request_ids else 0)
+
+    supersede_pull_request_runs(pr, "abcdef", project)
+
+
+@pytest.mark.parametrize(
+    "pending_runs, head_commit",
+    (
+        pytest.param(False, "abcdef", id="nothing pending"),
+        # e.g. a late delivery of the event about an older commit
+        pytest.param(True, "123456", id="not the head"),
+    ),
+)
+def test_supersede_pull_request_runs_nothing(pending_runs, head_commit):
+    pr = flexmock(pr_id=21)
+    pr.should_receive("has_pending_runs_of_other_commits").and_return(pending_runs)
+    pr.should_receive("supersede_pending_runs").never()
+    project = flexmock()
+    project.should_receive("get_pr").and_return(
+        flexmock(head_commit=head_commit)
+    ).times(1 if pending_runs else 0)
+
+    supersede_pull_request_runs(pr, "abcdef", project)
+
+
+def test_cancel_copr_builds():
+    build_proxy = flexmock()
+    build_proxy.should_receive("cancel").with_args(1).and_raise(
+        CoprRequestException("Build 1 is already finished")
+    ).once()
+    build_proxy.should_receive("cancel").with_args(2).once()
+    flexmock(CoprClient).should_receive("create_from_config_file").and_return(
+        flexmock(build_proxy=build_proxy)
+    )
+
+    cancel_copr_builds(["1", "2"])
+
+
+def test_cancel_testing_farm_requests():
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        flexmock(
+            testing_farm_api_url="https://api.dev.testing-farm.io/v0.1/",
+            testing_farm_secret="public",
+            internal_testing_farm_secret="internal",
+        )
+    )
+    url = "https://api.dev.testing-farm.io/v0.1/requests/"
+    # submitted with the internal API key
+    flexmock(requests.Session).should_receive("delete").with_args(
+        f"{url}a", json={"api_key": "public"}, timeout=TESTING_FARM_API_TIMEOUT
+    ).and_return(flexmock(ok=False)).once()
+    flexmock(requests.Session).should_receive("delete").with_args(
+        f"{url}a", json={"api_key": "internal"}, timeout=TESTING_FARM_API_TIMEOUT
+    ).and_return(flexmock(ok=True)).once()
+    # submitted with the public API key
+    flexmock(requests.Session).should_receive("delete").with_args(
+        f"{url}b", json={"api_key": "public"}, timeout=TESTING_FARM_API_TIMEOUT
+    ).and_return(flexmock(ok=True)).once()
+    # Testing Farm is not available
+    flexmock(requests.Session).should_receive("delete").with_args(
+        f"{url}c", json={"api_key": "public"}, timeout=TESTING_FARM_API_TIMEOUT
+    ).and_raise(requests.ConnectionError).once()
+
+    cancel_testing_farm_requests(["a", "b", "c"])
@@ -1,6 +1,8 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
+import time
 from datetime import datetime, timezone
+from threading import Event
 from typing import List
 
 import pytest
@@ -17,6 +19,7 @@ from packit.config import (
     PackageConfig,
 )
 from packit.copr_helper import CoprHelper
+from packit.exceptions import PackitException
 from packit.local_project import LocalProject
 from packit_service.config import PackageConfigGetter, ServiceConfig
 from packit_service.models import ProjectEventModel, ProjectEventModelType, BuildStatus
@@ -38,7 +41,9 @@ from packit_service.worker.events import (
 )
 from packit_service.worker.handlers import TestingFarmHandler
 from packit_service.worker.handlers import TestingFarmResultsHandler as TFResultsHandler
+from packit_service.worker.helpers import testing_farm
 from packit_service.worker.helpers.testing_farm import (
+    ComposeCatalog,
     TestingFarmJobHelper as TFJobHelper,
 )
 from packit_service.worker.reporting import StatusReporter, BaseCommitStatus
@@ -277,6 +282,68 @@ def test_distro2compose_for_aarch64(target, compose, use_internal_tf):
     assert job_helper.distro2compose(target) == compose
 
 
+def test_distro2compose_composes_cached():
+    response = flexmock(
+        status_code=200,
+        json=lambda: {"composes": [{"name": "Fedora-37"}, {"name": "Fedora-38"}]},
+    )
+    flexmock(TFJobHelper).should_receive("send_testing_farm_request").with_args(
+        endpoint="composes/public"
+    ).and_return(response).once()
+
+    for target, compose in (
+        ("fedora-37-x86_64", "Fedora-37"),
+        ("fedora-38-x86_64", "Fedora-38"),
+        ("fedora-38-x86_64", "Fedora-38"),
+    ):
+        job_helper = TFJobHelper(
+            service_config=ServiceConfig.get_service_config(),
+            package_config=flexmock(jobs=[]),
+            project=flexmock(),
+            metadata=flexmock(),
+            db_project_event=flexmock(),
+            job_config=JobConfig(
+                type=JobType.tests,
+                trigger=JobConfigTriggerType.pull_request,
+                packages={"package": CommonPackageConfig()},
+            ),
+        )
+        assert job_helper.distro2compose(target) == compose
+
+
+def test_compose_catalog_refresh():
+    url = "https://api.dev.testing-farm.io/v0.1/composes/public"
+    refreshed = Event()
+
+    def fetch():
+        return {"Fedora-37"}
+
+    def fetch_in_background():
+        refreshed.set()
+        return {"Fedora-37", "Fedora-38"}
+
+    def fetch_failing():
+        raise PackitException("Cannot connect to url")
+
+    assert ComposeCatalog.get(url, fetch) == {"Fedora-37"}
+    assert ComposeCatalog.get(url, fetch_failing) == {"Fedora-37"}
+
+    # the cached list is used until the refreshed one is fetched
+    flexmock(testing_farm, TESTING_FARM_COMPOSES_REFRESH_INTERVAL=-1)
+    assert ComposeCatalog.get(url, fetch_in_background) == {"Fedora-37"}
+    assert refreshed.wait(timeout=5)
+    for _ in range(50):
+        if ComposeCatalog.get(url, fetch_in_background) != {"Fedora-37"}:
+            break
+        time.sleep(0.1)
+    assert ComposeCatalog.get(url, fetch_in_background) == {"Fedora-37", "Fedora-38"}
+
+    # the expired list is still better than none
+    flexmock(testing_farm, TESTING_FARM_COMPOSES_MAX_AGE=-1)
+    assert ComposeCatalog.get(url, fetch_failing) == {"Fedora-37", "Fedora-38"}
+    assert ComposeCatalog.get(f"{url}/redhat", fetch_failing) is None
+
+
 @pytest.mark.parametrize(
     ("build_id," "chroot," "built_packages," "packages_to_send"),
     [
@@ -1184,9 +1251,7 @@ def test_trigger_build(copr_build, run_new_build, wait_for_build):
                 status=TestingFarmResult.new,
             )
         )
-    flexmock(TFTTestRunTargetModel).should_receive("create").and_return(
-        *tests
-    ).one_by_one()
+    flexmock(TFTTestRunTargetModel).should_receive("bulk_create").and_return(tests)
     flexmock(PipelineModel).should_receive("create").and_return(flexmock())
     flexmock(TFTTestRunGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=tests)
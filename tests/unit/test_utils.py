@@ -1,7 +1,25 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from packit_service.utils import only_once
+import pytest
+from flexmock import flexmock
+from redis.exceptions import RedisError
+
+from packit.config import PackageConfig
+from packit_service import utils
+from packit_service.constants import PACKAGE_CONFIG_REFERENCE_PREFIX
+from packit_service.utils import (
+    PackageConfigReferenceNotFound,
+    dump_package_config,
+    dump_package_config_by_reference,
+    get_event_hash,
+    is_latest_debounced_event,
+    load_package_config,
+    only_once,
+    register_delivery,
+    set_latest_debounced_event,
+    unregister_delivery,
+)
 
 
 def test_only_once():
@@ -74,3 +92,83 @@ def test_only_once_with_args_and_kwargs():
     assert counter == 1
     f("b", "b", three="different")
     assert counter == 1
+
+
+def test_package_config_by_reference(redis_storage):
+    package_config = PackageConfig.get_from_dict(
+        {"specfile_path": "python-ogr.spec"}, repo_name="ogr"
+    )
+
+    reference = dump_package_config_by_reference(package_config)
+
+    assert reference.startswith(PACKAGE_CONFIG_REFERENCE_PREFIX)
+    assert list(redis_storage) == [reference]
+    # the same content is stored only once
+    assert dump_package_config_by_reference(package_config) == reference
+    assert load_package_config(reference) == package_config
+
+
+def test_package_config_by_reference_redis_unavailable():
+    package_config = PackageConfig.get_from_dict(
+        {"specfile_path": "python-ogr.spec"}, repo_name="ogr"
+    )
+    flexmock(utils).should_receive("get_redis").and_return(
+        flexmock().should_receive("set").and_raise(RedisError).mock()
+    )
+
+    dumped_config = dump_package_config_by_reference(package_config)
+
+    assert dumped_config == dump_package_config(package_config)
+    assert load_package_config(dumped_config) == package_config
+
+
+def test_package_config_by_reference_expired():
+    with pytest.raises(PackageConfigReferenceNotFound):
+        load_package_config(f"{PACKAGE_CONFIG_REFERENCE_PREFIX}0123abcd")
+
+
+def test_register_delivery(redis_storage):
+    assert register_delivery("some-uuid", stage="received")
+    assert not register_delivery("some-uuid", stage="received")
+    # the stages are independent
+    assert register_delivery("some-uuid", stage="processed")
+
+    unregister_delivery("some-uuid", stage="received")
+    assert register_delivery("some-uuid", stage="received")
+
+
+def test_register_delivery_redis_unavailable():
+    flexmock(utils).should_receive("get_redis").and_return(
+        flexmock().should_receive("set").and_raise(RedisError).mock()
+    )
+    assert register_delivery("some-uuid", stage="received")
+    assert register_delivery("some-uuid", stage="received")
+
+
+def test_latest_debounced_event():
+    assert set_latest_debounced_event("github.com/packit/ogr:pr:1", "first", 10)
+    assert is_latest_debounced_event("github.com/packit/ogr:pr:1", "first")
+    assert set_latest_debounced_event("github.com/packit/ogr:pr:1", "second", 10)
+    assert not is_latest_debounced_event("github.com/packit/ogr:pr:1", "first")
+    assert is_latest_debounced_event("github.com/packit/ogr:pr:1", "second")
+    # the latest event for the subject is not known anymore
+    assert is_latest_debounced_event("github.com/packit/ogr:pr:2", "first")
+
+
+def test_latest_debounced_event_redis_unavailable():
+    flexmock(utils).should_receive("get_redis").and_return(
+        flexmock()
+        .should_receive("set")
+        .and_raise(RedisError)
+        .mock()
+        .should_receive("get")
+        .and_raise(RedisError)
+        .mock()
+    )
+    assert not set_latest_debounced_event("github.com/packit/ogr:pr:1", "first", 10)
+    assert is_latest_debounced_event("github.com/packit/ogr:pr:1", "first")
+
+
+def test_get_event_hash():
+    assert get_event_hash({"a": 1, "b": [2]}) == get_event_hash({"b": [2], "a": 1})
+    assert get_event_hash({"a": 1}) != get_event_hash({"a": 2})
@@ -244,3 +244,32 @@ def test_interested(mock_config, headers, payload, interested):
         json=payload, content_type="application/json", headers=headers
     ):
         assert webhooks.GithubWebhook.interested() == interested
+
+
+def test_accept_delivery(mock_config):
+    # flexmock config before import as it fails on looking for config
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        flexmock(ServiceConfig)
+    )
+
+    from packit_service.service.api import webhooks
+
+    flexmock(webhooks.celery_app).should_receive("send_task").with_args(
+        name=str,
+        kwargs={
+            "event": {"action": "opened"},
+            "source": "github",
+            "event_type": "pull_request",
+            "delivery_id": "uuid",
+        },
+    ).once()
+
+    assert [
+        webhooks.accept_delivery(
+            {"action": "opened"},
+            source="github",
+            event_type="pull_request",
+            delivery_id="uuid",
+        )
+        for _ in range(2)
+    ] == [True, False]
@@ -21,6 +21,7 @@ from packit_service.config import ServiceConfig
 from packit_service.models import (
     CoprBuildTargetModel,
     CoprBuildGroupModel,
+    DbIdCache,
     ProjectEventModel,
     sa_session_transaction,
     SRPMBuildModel,
@@ -46,6 +47,7 @@ from packit_service.models import (
     SourceGitPRDistGitPRModel,
     BuildStatus,
     SyncReleaseJobType,
+    UsageRollupModel,
 )
 from packit_service.worker.events import InstallationEvent
 
@@ -162,6 +164,7 @@ def clean_db():
         session.query(AllowlistModel).delete()
         session.query(GithubInstallationModel).delete()
 
+        session.query(UsageRollupModel).delete()
         session.query(PipelineModel).delete()
         session.query(ProjectEventModel).delete()
 
@@ -180,6 +183,8 @@ def clean_db():
 
         session.query(GitProjectModel).delete()
 
+    DbIdCache.clear()
+
 
 @pytest.fixture()
 def clean_before_and_after():
@@ -1254,6 +1259,7 @@ def full_database(
     multiple_allowlist_entries,
     multiple_installation_entries,
 ):
+    UsageRollupModel.refresh()
     yield
 
 
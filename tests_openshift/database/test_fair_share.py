@@ -0,0 +1,70 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from packit_service.constants import FAIR_SHARE_KEY_PREFIX
+from packit_service.utils import get_redis
+from packit_service.worker.fair_share import take_tokens
+
+PROJECT_URL = "https://github.com/packit/fair-share-test"
+KEY = f"{FAIR_SHARE_KEY_PREFIX}{PROJECT_URL}"
+
+
+@pytest.fixture()
+def clean_bucket():
+    get_redis().delete(KEY)
+    yield
+    get_redis().delete(KEY)
+
+
+def approx(values):
+    # the bucket is refilled a bit between the calls
+    return pytest.approx(values, abs=0.1)
+
+
+def test_take_tokens_burst(clean_bucket):
+    delays, tokens = take_tokens(PROJECT_URL, count=3, rate=1, burst=3)
+
+    assert delays == approx([0, 0, 0])
+    assert tokens == approx(0)
+
+
+def test_take_tokens_negative(clean_bucket):
+    delays, tokens = take_tokens(PROJECT_URL, count=2, rate=2, burst=1)
+    assert delays == approx([0, 0.5])
+    assert tokens == approx(-1)
+
+    delays, tokens = take_tokens(PROJECT_URL, count=2, rate=2, burst=1)
+    assert delays == approx([1, 1.5])
+    assert tokens == approx(-3)
+
+
+def test_take_tokens_max_delay(clean_bucket):
+    delays, tokens = take_tokens(PROJECT_URL, count=6, rate=1, burst=1, max_delay=3)
+    assert delays == approx([0, 1, 2, 3, 3, 3])
+    assert tokens == approx(-3)
+
+    # the debt doesn't grow over the longest delay
+    delays, tokens = take_tokens(PROJECT_URL, count=2, rate=1, burst=1, max_delay=3)
+    assert delays == approx([3, 3])
+    assert tokens == approx(-3)
+
+
+def test_take_tokens_refill(clean_bucket):
+    _, tokens = take_tokens(PROJECT_URL, count=3, rate=1, burst=2)
+    assert tokens == approx(-1)
+
+    seconds, microseconds = get_redis().time()
+    get_redis().hset(KEY, "timestamp", seconds + microseconds / 1000000 - 2)
+
+    delays, tokens = take_tokens(PROJECT_URL, count=1, rate=1, burst=2)
+    assert delays == approx([0])
+    assert tokens == approx(0)
+
+    # the bucket isn't refilled over its capacity
+    get_redis().hset(KEY, "timestamp", seconds + microseconds / 1000000 - 100)
+
+    delays, tokens = take_tokens(PROJECT_URL, count=3, rate=1, burst=2)
+    assert delays == approx([0, 0, 1])
+    assert tokens == approx(-1)
@@ -1,17 +1,25 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import pytest
+import time
 
 from datetime import datetime, timedelta
+from os import utime
 
+from flexmock import flexmock
 from sqlalchemy.exc import ProgrammingError, IntegrityError
 
+from packit_service import models
+from packit_service.constants import LOG_STORE_DELETE_GRACE_PERIOD
+from packit_service.log_store import FilesystemLogStore
+
 from packit_service.models import (
     CoprBuildTargetModel,
     CoprBuildGroupModel,
     GitBranchModel,
     GitProjectModel,
     GithubInstallationModel,
+    ProjectEventModel,
     ProjectEventModelType,
     KojiBuildTargetModel,
     KojiBuildGroupModel,
@@ -32,6 +40,8 @@ from packit_service.models import (
     Session,
     BuildStatus,
     SyncReleaseJobType,
+    UsageRollupModel,
+    sa_session_deferred_commit,
 )
 from tests_openshift.conftest import SampleValues
 
@@ -128,6 +138,54 @@ def test_get_merged_chroots(clean_before_and_after, too_many_copr_builds):
     assert ["fedora-43-x86_64"] in builds_list[2].target
 
 
+@pytest.mark.parametrize(
+    "get_page, id_attribute",
+    [
+        (CoprBuildTargetModel.get_merged_chroots, "new_id"),
+        (PipelineModel.get_merged_chroots, "merged_id"),
+        (SRPMBuildModel.get_range, "id"),
+    ],
+)
+def test_keyset_pagination(
+    clean_before_and_after, too_many_copr_builds, get_page, id_attribute
+):
+    def ids(page):
+        return [getattr(entry, id_attribute) for entry in page]
+
+    first_page, second_page = ids(get_page(0, 10)), ids(get_page(10, 20))
+    assert len(second_page) == 10
+
+    assert ids(get_page(0, 10, before_id=first_page[-1])) == second_page
+    assert ids(get_page(0, 10, after_id=second_page[0])) == first_page
+    assert not get_page(0, 10, after_id=first_page[0])
+
+
+def test_keyset_pagination_copr_builds_without_build_id(
+    clean_before_and_after, too_many_copr_builds
+):
+    with sa_session_transaction() as session:
+        for build in too_many_copr_builds[10:50:10]:
+            build.build_id = None
+            session.add(build)
+
+    offset_pages = [
+        [build.new_id for build in CoprBuildTargetModel.get_merged_chroots(i, i + 10)]
+        for i in range(0, 50, 10)
+    ]
+    # the builds without a build ID are merged into one, with a cursor as well
+    cursor_pages = [offset_pages[0]]
+    for _ in offset_pages[1:]:
+        cursor_pages.append(
+            [
+                build.new_id
+                for build in CoprBuildTargetModel.get_merged_chroots(
+                    0, 10, before_id=cursor_pages[-1][-1]
+                )
+            ]
+        )
+    assert cursor_pages == offset_pages
+
+
 def test_get_copr_build(clean_before_and_after, a_copr_build_for_pr):
     assert a_copr_build_for_pr.id
 
@@ -170,6 +228,62 @@ def test_copr_build_set_build_logs_url(clean_before_and_after, a_copr_build_for_
     assert b.build_logs_url == url
 
 
+def test_copr_build_bulk_create(
+    clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    _, run_model = srpm_build_model_with_new_run_for_pr
+    group = CoprBuildGroupModel.create(run_model)
+    targets = [SampleValues.target, SampleValues.different_target]
+    builds = CoprBuildTargetModel.bulk_create(
+        targets=targets,
+        build_id=SampleValues.build_id,
+        commit_sha=SampleValues.commit_sha,
+        project_name=SampleValues.project,
+        owner=SampleValues.owner,
+        web_url=None,
+        status=BuildStatus.waiting_for_srpm,
+        copr_build_group=group,
+    )
+
+    assert [build.target for build in builds] == targets
+    assert all(build.id for build in builds)
+    assert {build.target for build in group.grouped_targets} == set(targets)
+    for target in targets:
+        build = CoprBuildTargetModel.get_by_build_id(SampleValues.build_id, target)
+        assert build.status == BuildStatus.waiting_for_srpm
+        assert build.group_of_targets.id == group.id
+
+
+def test_copr_build_deferred_commit(clean_before_and_after, a_copr_build_for_pr):
+    url = "https://copr.fp.o/logs/12456/build.log"
+    with sa_session_deferred_commit() as session:
+        a_copr_build_for_pr.set_build_logs_url(url)
+        a_copr_build_for_pr.set_status(BuildStatus.success)
+        # nothing is sent to the database until the end of the context
+        assert a_copr_build_for_pr in session.dirty
+
+    assert a_copr_build_for_pr not in Session().dirty
+    b = CoprBuildTargetModel.get_by_build_id(
+        a_copr_build_for_pr.build_id, SampleValues.target
+    )
+    assert b.build_logs_url == url
+    assert b.status == BuildStatus.success
+
+
+def test_copr_build_deferred_commit_rollback(
+    clean_before_and_after, a_copr_build_for_pr
+):
+    with pytest.raises(ValueError):
+        with sa_session_deferred_commit():
+            a_copr_build_for_pr.set_status(BuildStatus.success)
+            raise ValueError()
+
+    b = CoprBuildTargetModel.get_by_build_id(
+        a_copr_build_for_pr.build_id, SampleValues.target
+    )
+    assert b.status == BuildStatus.pending
+
+
 def test_create_koji_build(clean_before_and_after, a_koji_build_for_pr):
     assert a_koji_build_for_pr.build_id == "123456"
     assert a_koji_build_for_pr.commit_sha == "80201a74d96c"
@@ -256,6 +370,29 @@ def test_get_or_create_pr(clean_before_and_after):
         assert expected_pr.project_id == actual_pr.project_id
 
 
+def test_get_or_create_project_event(clean_before_and_after, pr_model):
+    project_event = ProjectEventModel.get_or_create(
+        type=ProjectEventModelType.pull_request, event_id=pr_model.id
+    )
+    assert project_event.id
+    assert (
+        ProjectEventModel.get_or_create(
+            type=ProjectEventModelType.pull_request, event_id=pr_model.id
+        ).id
+        == project_event.id
+    )
+    assert project_event.get_project_event_object() == pr_model
+
+
+def test_pr_unique(clean_before_and_after, pr_model):
+    with pytest.raises(IntegrityError):
+        with sa_session_transaction() as session:
+            duplicate_pr = PullRequestModel()
+            duplicate_pr.pr_id = pr_model.pr_id
+            duplicate_pr.project_id = pr_model.project_id
+            session.add(duplicate_pr)
+
+
 def test_errors_while_doing_db(clean_before_and_after):
     with sa_session_transaction() as session:
         try:
@@ -302,6 +439,28 @@ def test_get_all_build_id(clean_before_and_after, multiple_copr_builds):
     assert builds_list[1].project_name == "the-project-name"
 
 
+def test_copr_build_get_all_by_status(clean_before_and_after, multiple_copr_builds):
+    # the builds of the same Copr build not being created one after another
+    multiple_copr_builds[0].set_build_id(SampleValues.different_build_id)
+    for build in multiple_copr_builds:
+        build.set_status(BuildStatus.pending)
+
+    # loaded in chunks of one, while the builds are being completed
+    flexmock(models, ITER_IN_CHUNKS_SIZE=1)
+    pending = []
+    for build in CoprBuildTargetModel.get_all_by_status(BuildStatus.pending):
+        pending.append(build.id)
+        build.set_status(BuildStatus.success)
+
+    assert pending == [
+        build.id
+        for build in sorted(
+            multiple_copr_builds, key=lambda build: (build.build_id, build.id)
+        )
+    ]
+    assert not list(CoprBuildTargetModel.get_all_by_status(BuildStatus.pending))
+
+
 # returns the first copr build with given build id and target
 def test_get_by_build_id(clean_before_and_after, multiple_copr_builds):
     # these are not iterable and thus should be accessible directly
@@ -507,6 +666,20 @@ def test_tmt_test_run_set_status(clean_before_and_after, a_new_test_run_pr):
     assert b.status == TestingFarmResult.running
 
 
+def test_tmt_test_run_get_all_by_status(clean_before_and_after, multiple_new_test_runs):
+    # loaded in chunks of one, while the runs are being completed
+    flexmock(models, ITER_IN_CHUNKS_SIZE=1)
+    not_completed = []
+    for run in TFTTestRunTargetModel.get_all_by_status(
+        TestingFarmResult.new, TestingFarmResult.running
+    ):
+        not_completed.append(run.id)
+        run.set_status(TestingFarmResult.passed)
+
+    assert not_completed == sorted(run.id for run in multiple_new_test_runs)
+    assert not list(TFTTestRunTargetModel.get_all_by_status(TestingFarmResult.new))
+
+
 def test_tmt_test_run_get_project(clean_before_and_after, a_new_test_run_pr):
     assert a_new_test_run_pr.status == TestingFarmResult.new
     assert a_new_test_run_pr.get_project().namespace == "the-namespace"
@@ -818,6 +991,27 @@ def test_merged_runs(clean_before_and_after, few_runs):
         assert len(merged_run.test_run_group_id) == 1
 
 
+def test_get_merged_runs_data(clean_before_and_after, few_runs):
+    merged_runs = list(PipelineModel.get_merged_chroots(0, 10))
+    data = PipelineModel.get_merged_runs_data(merged_runs)
+
+    for merged_run in merged_runs:
+        srpm_build = data.srpm_builds[merged_run.srpm_build_id]
+        assert srpm_build.id == merged_run.srpm_build_id
+
+        for (group_id,) in merged_run.copr_build_group_id:
+            build_group = data.copr_build_groups[group_id]
+            for copr_build in build_group.grouped_targets:
+                assert copr_build.get_srpm_build().id == srpm_build.id
+
+        for (group_id,) in merged_run.test_run_group_id:
+            assert data.test_run_groups[group_id].grouped_targets
+
+        project_event_object = data.project_event_objects[merged_run.project_event_id]
+        assert project_event_object == srpm_build.get_project_event_object()
+        assert project_event_object.project.repo_name == SampleValues.repo_name
+
+
 def test_merged_chroots_on_tests_without_build(
     clean_before_and_after, runs_without_build
 ):
@@ -875,6 +1069,73 @@ def test_set_propose_model_attributes(clean_before_and_after, propose_model):
     assert propose_model.logs == "omg secret logs! don't read this!"
 
 
+def test_set_logs_to_log_store(
+    clean_before_and_after, srpm_build_model_with_new_run_for_pr, tmp_path
+):
+    log_store = FilesystemLogStore(tmp_path)
+    flexmock(models).should_receive("get_log_store").and_return(log_store)
+    srpm_build, _ = srpm_build_model_with_new_run_for_pr
+
+    srpm_build.set_logs("some\nboring\nlogs")
+    assert srpm_build.logs is None
+    assert srpm_build.logs_reference.startswith("sha256:")
+    assert srpm_build.get_logs() == "some\nboring\nlogs"
+    assert len(list(tmp_path.glob("*/*.gz"))) == 1
+
+    # discarding the logs deletes them from the log store
+    _store_logs_before_grace_period(tmp_path)
+    srpm_build.set_logs(None)
+    assert srpm_build.logs_reference is None
+    assert srpm_build.get_logs() is None
+    assert not list(tmp_path.glob("*/*.gz"))
+
+
+def test_set_logs_shared_in_log_store(clean_before_and_after, pr_model, tmp_path):
+    log_store = FilesystemLogStore(tmp_path)
+    flexmock(models).should_receive("get_log_store").and_return(log_store)
+    srpm_builds = [
+        SRPMBuildModel.create_with_new_run(
+            project_event_model=pr_model, commit_sha=SampleValues.commit_sha
+        )[0]
+        for _ in range(2)
+    ]
+    for srpm_build in srpm_builds:
+        srpm_build.set_logs("the same logs")
+    assert srpm_builds[0].logs_reference == srpm_builds[1].logs_reference
+    assert len(list(tmp_path.glob("*/*.gz"))) == 1
+
+    # the logs are still referenced by the other build
+    srpm_builds[0].set_logs(None)
+    assert srpm_builds[1].get_logs() == "the same logs"
+    assert len(list(tmp_path.glob("*/*.gz"))) == 1
+
+    _store_logs_before_grace_period(tmp_path)
+    srpm_builds[1].set_logs("different logs")
+    assert srpm_builds[1].get_logs() == "different logs"
+    assert len(list(tmp_path.glob("*/*.gz"))) == 1
+
+
+def test_set_logs_stored_recently_in_log_store(
+    clean_before_and_after, srpm_build_model_with_new_run_for_pr, tmp_path
+):
+    log_store = FilesystemLogStore(tmp_path)
+    flexmock(models).should_receive("get_log_store").and_return(log_store)
+    srpm_build, _ = srpm_build_model_with_new_run_for_pr
+    srpm_build.set_logs("the same logs")
+    _store_logs_before_grace_period(tmp_path)
+
+    # stored again for another model not committed yet
+    reference = log_store.put("the same logs")
+    srpm_build.set_logs(None)
+    assert log_store.get(reference) == "the same logs"
+
+
+def _store_logs_before_grace_period(path):
+    stored = time.time() - 2 * LOG_STORE_DELETE_GRACE_PERIOD
+    for logs in path.glob("*/*.gz"):
+        utime(logs, (stored, stored))
+
+
 def test_propose_model_get_by_id(clean_before_and_after, propose_model):
     assert propose_model.id
 
@@ -1009,3 +1270,127 @@ def test_get_by_dist_git_id(
     assert SourceGitPRDistGitPRModel.get_by_dist_git_id(
         source_git_dist_git_pr_new_relationship.dist_git_pull_request_id
     )
+
+
+def test_usage_rollups_refresh(clean_before_and_after, few_runs):
+    UsageRollupModel.refresh()
+    assert GitProjectModel.get_job_usage_numbers_all_project_events(
+        job_result_model=SRPMBuildModel
+    ) == {SampleValues.project_url: 2}
+    assert (
+        GitProjectModel.get_project_event_usage_count(
+            project_event_type=ProjectEventModelType.pull_request
+        )
+        == 2
+    )
+
+    # the last day is recomputed, nothing is counted twice
+    UsageRollupModel.refresh()
+    assert GitProjectModel.get_job_usage_numbers_all_project_events(
+        job_result_model=SRPMBuildModel
+    ) == {SampleValues.project_url: 2}
+
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    assert GitProjectModel.get_active_projects_count(datetime_to=yesterday) == 0
+    assert GitProjectModel.get_active_projects(datetime_from=yesterday) == [
+        SampleValues.project_url
+    ]
+
+
+def test_usage_rollups_object_active_on_more_days(clean_before_and_after, branch_model):
+    earlier = datetime.utcnow() - timedelta(days=2)
+    with sa_session_transaction() as session:
+        for pipeline_datetime in (earlier, datetime.utcnow()):
+            pipeline = PipelineModel.create(
+                type=ProjectEventModelType.branch_push, event_id=branch_model.id
+            )
+            pipeline.datetime = pipeline_datetime
+            session.add(pipeline)
+    UsageRollupModel.refresh()
+
+    # the branch is counted on each of the days, but once for the whole period
+    for day in (earlier, datetime.utcnow()):
+        assert GitProjectModel.get_project_event_usage_numbers(
+            project_event_type=ProjectEventModelType.branch_push,
+            datetime_from=day,
+            datetime_to=day,
+        ) == {SampleValues.project_url: 1}
+    assert (
+        GitProjectModel.get_project_event_usage_count(
+            project_event_type=ProjectEventModelType.branch_push,
+            datetime_from=earlier,
+        )
+        == 1
+    )
+    assert GitProjectModel.get_active_projects_usage_numbers(datetime_from=earlier) == {
+        SampleValues.project_url: 1
+    }
+    assert UsageRollupModel.get_usage_numbers(
+        counted=PipelineModel.__tablename__, datetime_from=earlier
+    ) == {SampleValues.project_url: 2}
+
+    # the project is active even though the branch had a pipeline before
+    assert GitProjectModel.get_active_projects(
+        datetime_from=datetime.utcnow() - timedelta(days=1)
+    ) == [SampleValues.project_url]
+
+    # not active in the days between the pipelines, once for all of the time
+    between = datetime.utcnow() - timedelta(days=1)
+    assert (
+        GitProjectModel.get_project_event_usage_numbers(
+            project_event_type=ProjectEventModelType.branch_push,
+            datetime_from=between,
+            datetime_to=between,
+        )
+        == {}
+    )
+    assert GitProjectModel.get_project_event_usage_numbers(
+        project_event_type=ProjectEventModelType.branch_push
+    ) == {SampleValues.project_url: 1}
+
+    # the recomputed last day keeps the previous activity of the branch
+    UsageRollupModel.refresh()
+    assert (
+        GitProjectModel.get_project_event_usage_count(
+            project_event_type=ProjectEventModelType.branch_push,
+            datetime_from=earlier,
+        )
+        == 1
+    )
+
+
+def test_supersede_pending_runs(
+    clean_before_and_after,
+    pr_model,
+    srpm_build_model_with_new_run_for_pr,
+    a_copr_build_for_pr,
+    a_new_test_run_pr,
+):
+    srpm_build, _ = srpm_build_model_with_new_run_for_pr
+
+    # nothing to supersede for the current commit
+    assert not pr_model.has_pending_runs_of_other_commits(SampleValues.commit_sha)
+    assert pr_model.supersede_pending_runs(SampleValues.commit_sha) == ([], [])
+    assert a_copr_build_for_pr.status == BuildStatus.pending
+    assert a_new_test_run_pr.status == TestingFarmResult.new
+
+    assert pr_model.has_pending_runs_of_other_commits(
+        SampleValues.different_commit_sha
+    )
+    assert pr_model.supersede_pending_runs(SampleValues.different_commit_sha) == (
+        [SampleValues.build_id],
+        [SampleValues.pipeline_id],
+    )
+    assert a_copr_build_for_pr.status == BuildStatus.superseded
+    assert a_new_test_run_pr.status == TestingFarmResult.superseded
+    # the SRPM build has already finished
+    assert srpm_build.status == BuildStatus.success
+
+    # the superseded ones are not returned again
+    assert pr_model.supersede_pending_runs(SampleValues.different_commit_sha) == (
+        [],
+        [],
+    )
+    assert not pr_model.has_pending_runs_of_other_commits(
+        SampleValues.different_commit_sha
+    )
@@ -0,0 +1,155 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import time
+from datetime import datetime, timedelta
+from os import utime
+
+from flexmock import flexmock
+
+from packit_service import models
+from packit_service.log_store import FilesystemLogStore
+from packit_service.models import (
+    CoprBuildGroupModel,
+    CoprBuildTargetModel,
+    GitProjectModel,
+    PipelineModel,
+    ProjectEventModel,
+    PullRequestModel,
+    SRPMBuildModel,
+    TFTTestRunGroupModel,
+    TFTTestRunTargetModel,
+    sa_session,
+    sa_session_transaction,
+)
+from packit_service.worker import retention
+from packit_service.worker.retention import Retention
+from tests_openshift.conftest import SampleValues
+
+
+def test_retention_discard_srpm_build_logs(
+    clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    srpm_build, _ = srpm_build_model_with_new_run_for_pr
+    srpm_build.set_url("https://some.host/my.srpm")
+
+    reports = Retention(
+        srpm_build_logs_before=datetime.utcnow() + timedelta(days=1),
+        batch_sleep=0,
+    ).run()
+
+    assert [(report.table, report.rows, report.finished) for report in reports] == [
+        ("srpm_builds", 1, True)
+    ]
+    sa_session().expire_all()
+    srpm_build = SRPMBuildModel.get_by_id(srpm_build.id)
+    assert srpm_build.logs is None
+    assert srpm_build.url is None
+    # only the logs are discarded, not the builds
+    assert sa_session().query(PipelineModel).count() == 1
+
+
+def test_retention_keep_shared_stored_logs(clean_before_and_after, pr_model, tmp_path):
+    log_store = FilesystemLogStore(tmp_path)
+    flexmock(models).should_receive("get_log_store").and_return(log_store)
+    flexmock(retention).should_receive("get_log_store").and_return(log_store)
+    srpm_builds = [
+        SRPMBuildModel.create_with_new_run(
+            project_event_model=pr_model, commit_sha=SampleValues.commit_sha
+        )[0]
+        for _ in range(3)
+    ]
+    for srpm_build, logs in zip(srpm_builds, ("shared", "shared", "outdated")):
+        srpm_build.set_logs(logs)
+    with sa_session_transaction() as session:
+        session.query(SRPMBuildModel).filter(
+            SRPMBuildModel.id != srpm_builds[1].id
+        ).update({SRPMBuildModel.build_submitted_time: datetime(2020, 1, 1)})
+
+    # stored before the grace period
+    old_time = time.time() - 2 * 3600
+    for path in tmp_path.glob("*/*.gz"):
+        utime(path, (old_time, old_time))
+
+    Retention(
+        srpm_build_logs_before=datetime.utcnow() - timedelta(days=30),
+        batch_sleep=0,
+    ).run()
+
+    # only the logs not referenced by the recent build are deleted
+    sa_session().expire_all()
+    assert SRPMBuildModel.get_by_id(srpm_builds[0].id).logs_reference is None
+    assert SRPMBuildModel.get_by_id(srpm_builds[1].id).get_logs() == "shared"
+    assert len(list(tmp_path.glob("*/*.gz"))) == 1
+
+
+def test_retention_delete_pipelines(
+    clean_before_and_after, a_new_test_run_pr, different_pr_model
+):
+    with sa_session_transaction() as session:
+        session.query(PipelineModel).update(
+            {PipelineModel.datetime: datetime.utcnow() - timedelta(days=400)}
+        )
+    # recent pipeline of a different PR of the same project
+    kept_srpm_build, _ = SRPMBuildModel.create_with_new_run(
+        project_event_model=different_pr_model, commit_sha=SampleValues.commit_sha
+    )
+
+    reports = Retention(
+        srpm_build_logs_before=datetime.utcnow() - timedelta(days=30),
+        pipelines_before=datetime.utcnow() - timedelta(days=365),
+        batch_size=1,
+        batch_sleep=0,
+        delete_orphaned_project_events=True,
+    ).run()
+
+    assert all(report.finished for report in reports)
+    rows = {}
+    for report in reports:
+        rows[report.table] = rows.get(report.table, 0) + report.rows
+    assert rows["pipelines"] == 1
+    assert rows["srpm_builds"] == 1
+    assert rows["copr_build_targets"] == 1
+    assert rows["copr_build_groups"] == 1
+    assert rows["tft_test_run_targets"] == 1
+    assert rows["tft_test_run_groups"] == 1
+    assert rows["project_events"] == 1
+    assert rows["pull_requests"] == 1
+    assert rows["git_projects"] == 0
+
+    session = sa_session()
+    assert [srpm_build.id for srpm_build in session.query(SRPMBuildModel)] == [
+        kept_srpm_build.id
+    ]
+    assert session.query(PipelineModel).count() == 1
+    assert session.query(ProjectEventModel).count() == 1
+    assert [pr.pr_id for pr in session.query(PullRequestModel)] == [
+        different_pr_model.pr_id
+    ]
+    assert session.query(GitProjectModel).count() == 1
+    for model in (
+        CoprBuildGroupModel,
+        CoprBuildTargetModel,
+        TFTTestRunGroupModel,
+        TFTTestRunTargetModel,
+    ):
+        assert not session.query(model).count()
+
+
+def test_retention_keep_project_events(clean_before_and_after, pr_trigger_model):
+    reports = Retention(
+        srpm_build_logs_before=datetime.utcnow() - timedelta(days=30),
+        pipelines_before=datetime.utcnow() - timedelta(days=365),
+        batch_sleep=0,
+    ).run()
+
+    # the pipeline of the project event can be just being created
+    assert not {report.table for report in reports} & {
+        "project_events",
+        "pull_requests",
+        "git_projects",
+    }
+    session = sa_session()
+    assert session.query(ProjectEventModel).count() == 1
+    assert session.query(PullRequestModel).count() == 1
+    assert session.query(GitProjectModel).count() == 1
@@ -78,6 +78,23 @@ def test_pagination(client, clean_before_and_after, too_many_copr_builds):
     assert len(response_dict_2) == 30  # three builds, but two unique build ids
 
 
+def test_pagination_cursors(client, clean_before_and_after, too_many_copr_builds):
+    url = url_for("api.copr-builds_copr_builds_list")
+    response_1 = client.get(url + "?per_page=20")
+    response_2 = client.get(url + "?page=2&per_page=20")
+
+    response_cursor = client.get(
+        url + f"?per_page=20&before_id={response_1.headers['X-Before-Id']}"
+    )
+    assert response_cursor.json == response_2.json
+    assert "X-Before-Id" in response_cursor.headers["Access-Control-Expose-Headers"]
+
+    response_cursor = client.get(
+        url + f"?per_page=20&after_id={response_2.headers['X-After-Id']}"
+    )
+    assert response_cursor.json == response_1.json
+
+
 # Test detailed build info
 def test_detailed_copr_build_info(client, clean_before_and_after, a_copr_build_for_pr):
     response = client.get(
@@ -221,6 +238,18 @@ def test_srpm_build_info(
     assert "release" in response_dict
 
 
+def test_srpm_build_logs(
+    client, clean_before_and_after, srpm_build_model_with_new_run_for_pr
+):
+    srpm_build_model, _ = srpm_build_model_with_new_run_for_pr
+    response = client.get(
+        url_for("api.srpm-builds_srpm_build_logs", id=srpm_build_model.id)
+    )
+
+    assert response.mimetype == "text/plain"
+    assert response.get_data(as_text=True) == SampleValues.srpm_logs
+
+
 def test_srpm_build_in_copr_info(
     client, clean_before_and_after, srpm_build_in_copr_model
 ):